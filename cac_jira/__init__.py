@@ -9,7 +9,7 @@ from importlib import metadata
 
 import cac_core as cac
 
-from cac_jira.core import client
+from cac_jira.core import cache, client
 
 try:
     __version__ = metadata.version(__package__)
@@ -71,7 +71,15 @@ def _initialize():
     _module_state["CONFIG"] = config
     try:
         _module_state["JIRA_CLIENT"] = client.JiraClient(
-            jira_server, jira_username, jira_api_token
+            jira_server,
+            jira_username,
+            jira_api_token,
+            max_workers=int(config.get("max_workers", 8)),
+            cache=(
+                cache.DiskCache(ttls=config.get("cache_ttls", None))
+                if str(config.get("cache", True)).lower() not in ("false", "0", "no")
+                else None
+            ),
         )
     except client.JiraAuthenticationError as e:
         log.error("%s", e)
@@ -206,10 +206,12 @@ def main():
             sys.exit(1)
 
         log.debug("Executing action: %s %s", args.command, args.action)
-        action_instance.execute(args)
+        # Commands return 1 (e.g. when some issues of a bulk run failed)
+        sys.exit(action_instance.execute(args) or 0)
 
     except Exception as e:  # pylint: disable=broad-except
         log.error("Error executing command: %s", e)
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+
+"""
+Base module for all cache-related commands.
+
+This module defines the base JiraCacheCommand class that all cache-related
+action classes should inherit from.
+"""
+
+import abc
+
+from cac_jira.commands.command import JiraCommand
+
+
+class JiraCacheCommand(JiraCommand):
+    """
+    Base class for all cache-related actions.
+
+    Cache actions operate on the Jira client's on-disk cache and fail cleanly
+    when caching is disabled in the configuration.
+    """
+
+    @abc.abstractmethod
+    def define_arguments(self, parser):
+        """
+        Define arguments specific to this command.
+
+        Args:
+            parser: The argument parser to add arguments to
+
+        Returns:
+            The parser with arguments added
+        """
+        super().define_arguments(parser)
+        return parser
+
+    @abc.abstractmethod
+    def execute(self, args):
+        """
+        Execute the command with the given arguments.
+
+        Args:
+            args: The parsed arguments
+
+        Returns:
+            The result of the command execution
+        """
+        raise NotImplementedError("Subclasses must implement execute()")
+
+    @property
+    def cache(self):
+        """
+        The client's DiskCache, or None (with an error logged) if disabled.
+        """
+        cache = getattr(self.jira_client, "cache", None)
+        if cache is None:
+            self.log.error("Caching is disabled; set 'cache: true' in the config")
+        return cache
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+
+"""
+Command module for clearing the on-disk cache.
+
+Example usage:
+    jira cache clear
+    jira cache clear --kind createmeta
+"""
+
+from cac_jira.commands.cache import JiraCacheCommand
+
+
+class CacheClear(JiraCacheCommand):
+    """
+    Command class for clearing cached entries.
+    """
+
+    def define_arguments(self, parser):
+        """
+        Define command-specific arguments.
+
+        Args:
+            parser: The argument parser to add arguments to
+        """
+        super().define_arguments(parser)
+        parser.add_argument(
+            "--kind",
+            help="Only clear this kind of entry (e.g. issue, project, createmeta)",
+            default=None,
+        )
+        return parser
+
+    def execute(self, args):
+        """
+        Execute the command with the provided arguments.
+
+        Args:
+            args: The parsed arguments
+        """
+        cache = self.cache
+        if cache is None:
+            return 1
+
+        dropped = cache.clear(args.kind)
+        self.log.info(
+            "Cleared %d cached %s",
+            dropped,
+            f"{args.kind} entries" if args.kind else "entries",
+        )
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+
+"""
+Command module for reporting on the on-disk cache.
+
+Example usage:
+    jira cache stats
+    jira cache stats --output json
+"""
+
+import time
+
+import cac_core as cac
+
+from cac_jira.commands.cache import JiraCacheCommand
+
+
+def _age(stored_at, now):
+    """
+    Format the age of an entry for display.
+    """
+    if stored_at is None:
+        return "N/A"
+    seconds = int(now - stored_at)
+    for unit, size in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= size:
+            return f"{seconds // size}{unit}"
+    return f"{seconds}s"
+
+
+class CacheStats(JiraCacheCommand):
+    """
+    Command class for showing cache hit rates, sizes and ages.
+    """
+
+    def define_arguments(self, parser):
+        """
+        Define command-specific arguments.
+
+        Args:
+            parser: The argument parser to add arguments to
+        """
+        super().define_arguments(parser)
+        return parser
+
+    def execute(self, args):
+        """
+        Execute the command with the provided arguments.
+
+        Args:
+            args: The parsed arguments
+        """
+        cache = self.cache
+        if cache is None:
+            return 1
+
+        now = time.time()
+        models = []
+        for kind in cache.stats():
+            lookups = kind["hits"] + kind["misses"]
+            models.append(
+                cac.model.Model(
+                    {
+                        "Kind": kind["kind"],
+                        "Entries": kind["entries"],
+                        "Size (KB)": f"{kind['size'] / 1024:.1f}",
+                        "Hit Rate": (
+                            f"{100 * kind['hits'] / lookups:.0f}%" if lookups else "N/A"
+                        ),
+                        "Hits": kind["hits"],
+                        "Misses": kind["misses"],
+                        "Oldest": _age(kind["oldest"], now),
+                        "Newest": _age(kind["newest"], now),
+                    }
+                )
+            )
+        if not models:
+            self.log.info("The cache at %s is empty", cache.path)
+            return
+        printer = cac.output.Output(args)
+        printer.print_models(models)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# pylint: disable=broad-exception-caught
+
+"""
+Command module for prefetching Jira metadata into the on-disk cache.
+
+Everything is fetched concurrently and replaces whatever was cached, so
+interactive commands run afterwards never wait on metadata. Workflows are
+learned from the transitions of a recent issue in each status of each type.
+
+Example usage:
+    jira cache warm
+    jira cache warm --project PROJ,OTHER
+"""
+
+import time
+
+import cac_core as cac
+
+from cac_jira.commands.cache import JiraCacheCommand
+from cac_jira.core.workflow import WorkflowGraph
+
+
+class CacheWarm(JiraCacheCommand):
+    """
+    Command class for warming the metadata cache.
+    """
+
+    def define_arguments(self, parser):
+        """
+        Define command-specific arguments.
+
+        Args:
+            parser: The argument parser to add arguments to
+        """
+        super().define_arguments(parser)
+        parser.add_argument(
+            "--project",
+            help="Comma-separated project keys to warm (default: the configured project)",
+            default=self.config.project,  # pylint: disable=no-member
+        )
+        return parser
+
+    def tasks(self, projects):
+        """
+        List what to fetch.
+
+        Args:
+            projects: The project keys to warm
+
+        Returns:
+            A list of (description, callable) pairs
+        """
+        client = self.jira_client
+        tasks = [
+            ("projects", client.projects),
+            ("issue types", client.issue_types),
+            ("fields", client.fields),
+        ]
+        for project in projects:
+            tasks.append((f"{project} project", lambda p=project: client.project(p)))
+            tasks.append(
+                (f"{project} createmeta", lambda p=project: client.createmeta(p))
+            )
+            tasks.append(
+                (f"{project} workflows", lambda p=project: self.warm_workflows(p))
+            )
+        return tasks
+
+    def warm_workflows(self, project, sample_size=200):
+        """
+        Learn and cache a project's workflows from its recently updated issues.
+
+        Args:
+            project: The project key
+            sample_size: How many recent issues to look through for statuses
+        """
+        client = self.jira_client
+        samples = {}
+        for issue in client.search_issues(
+            f'project = "{project}" ORDER BY updated DESC',
+            fields=["status", "issuetype"],
+            max_results=sample_size,
+        ):
+            where = (issue.fields.issuetype.name, issue.fields.status.name)
+            samples.setdefault(where, issue)
+
+        graphs = {}
+        for (issuetype, status), issue in samples.items():
+            graph = graphs.setdefault(issuetype, WorkflowGraph())
+            graph.learn(status, client.transitions(issue))
+        for issuetype, graph in graphs.items():
+            client.save_workflow(project, issuetype, graph)
+
+    def execute(self, args):
+        """
+        Execute the command with the provided arguments.
+
+        Args:
+            args: The parsed arguments
+        """
+        cache = self.cache
+        if cache is None:
+            return 1
+
+        projects = [p.strip().upper() for p in (args.project or "").split(",")]
+        projects = [p for p in projects if p and p != "INVALID_DEFAULT"]
+
+        # Drop what we're about to refetch so stale entries aren't served
+        self.jira_client.invalidate_metadata(*projects)
+        for kind in ("issue_types", "fields"):
+            cache.invalidate(kind)
+
+        def run(task):
+            name, fetch = task
+            started = time.monotonic()
+            try:
+                fetch()
+                status = "ok"
+            except Exception as e:
+                status = f"failed: {e}"
+            return {
+                "Item": name,
+                "Status": status,
+                "Seconds": f"{time.monotonic() - started:.2f}",
+            }
+
+        rows = self.jira_client.concurrent_map(run, self.tasks(projects))
+
+        printer = cac.output.Output(args)
+        printer.print_models([cac.model.Model(row) for row in rows])
+        if any(row["Status"] != "ok" for row in rows):
+            return 1
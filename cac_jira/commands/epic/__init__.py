@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+
+"""
+Base module for all epic-related commands.
+
+This module defines the base JiraEpicCommand class that all epic-related
+action classes should inherit from.
+"""
+
+import abc
+
+from cac_jira.commands.issue import JiraIssueCommand
+
+
+class JiraEpicCommand(JiraIssueCommand):
+    """
+    Base class for all epic-related actions.
+
+    Epic actions work on an epic's child issues, so they share the issue
+    commands' helpers for resolving target issues and reporting bulk results.
+    """
+
+    @abc.abstractmethod
+    def define_arguments(self, parser):
+        """
+        Define arguments specific to this command.
+
+        Args:
+            parser: The argument parser to add arguments to
+
+        Returns:
+            The parser with arguments added
+        """
+        super().define_arguments(parser)
+        parser.add_argument("epic", help="The epic's key")
+        return parser
+
+    @abc.abstractmethod
+    def execute(self, args):
+        """
+        Execute the command with the given arguments.
+
+        Args:
+            args: The parsed arguments
+
+        Returns:
+            The result of the command execution
+        """
+        raise NotImplementedError("Subclasses must implement execute()")
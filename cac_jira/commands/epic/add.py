@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+"""
+Command module for moving issues into an epic.
+
+Issues are sent to the agile API in batches of the largest size it accepts,
+and the batches are sent concurrently, so moving hundreds of issues takes a
+handful of requests.
+
+Example usage:
+    jira epic add PROJ-1 --issue PROJ-10,PROJ-11
+    jira epic add PROJ-1 --jql 'project = PROJ AND labels = "q3"'
+"""
+
+from itertools import islice
+
+from cac_jira.commands.epic import JiraEpicCommand
+from cac_jira.core.bulk import BulkResult, run_bulk
+from cac_jira.core.client import MAX_EPIC_ISSUES
+
+
+def batched(items, size):
+    """
+    Split an iterable into lists of at most size items, lazily.
+
+    Args:
+        items: The iterable
+        size: The batch size
+
+    Yields:
+        Lists of items
+    """
+    items = iter(items)
+    while batch := [*islice(items, size)]:
+        yield batch
+
+
+class EpicAdd(JiraEpicCommand):
+    """
+    Command class for moving issues into an epic.
+    """
+
+    def define_arguments(self, parser):
+        """
+        Define command-specific arguments.
+
+        Args:
+            parser: The argument parser to add arguments to
+        """
+        super().define_arguments(parser)
+        parser.add_argument(
+            "-i",
+            "--issue",
+            help="Issue to move into the epic (repeatable; comma-separated "
+            "lists and keys piped on stdin also work)",
+            action="append",
+            default=None,
+        )
+        parser.add_argument(
+            "--jql",
+            help="Move every issue matching this JQL query into the epic",
+            default=None,
+        )
+        return parser
+
+    def execute(self, args):
+        """
+        Execute the command with the provided arguments.
+
+        Args:
+            args: The parsed arguments
+        """
+        epic = args.epic.upper()
+        jql = getattr(args, "jql", None)
+        keys = [] if jql else self.issue_keys(args)
+        if not keys and not jql:
+            self.log.error("No issues given; pass --issue, --jql or pipe keys on stdin")
+            return 1
+
+        targets = keys or (
+            issue.key for issue in self.jira_client.iter_search(jql, fields=["key"])
+        )
+        batches = run_bulk(
+            lambda batch: self.jira_client.add_issues_to_epic(epic, batch),
+            batched((key for key in targets if key != epic), MAX_EPIC_ISSUES),
+            self.jira_client.max_workers,
+        )
+        self.log.debug("Sent %d batches to %s", len(batches), epic)
+        # A batch succeeds or fails as a whole; report it per issue
+        results = [
+            BulkResult(key, batch.ok, batch.error, None)
+            for batch in batches
+            for key in batch.item
+        ]
+        return self.report_bulk(args, results)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+
+"""
+Command module for listing the issues in an epic.
+
+Children are found with a `parent = EPIC` search that fetches only the
+columns shown, and are streamed a page at a time; with --output json each row
+is printed as soon as it arrives (the output is still one JSON array).
+
+Example usage:
+    jira epic children PROJ-1
+    jira epic children PROJ-1 --output json
+"""
+
+import json
+
+import cac_core as cac
+
+from cac_jira.commands.epic import JiraEpicCommand
+
+# The only fields the listing shows
+CHILD_FIELDS = ["summary", "status", "assignee", "issuetype"]
+
+
+class EpicChildren(JiraEpicCommand):
+    """
+    Command class for listing the issues in an epic.
+    """
+
+    def define_arguments(self, parser):
+        """
+        Define command-specific arguments.
+
+        Args:
+            parser: The argument parser to add arguments to
+        """
+        super().define_arguments(parser)
+        return parser
+
+    @staticmethod
+    def child_row(issue):
+        """
+        Build the listing row for a child issue.
+
+        Args:
+            issue: The child issue
+
+        Returns:
+            A dict of column name -> value
+        """
+        assignee = issue.fields.assignee
+        return {
+            "ID": issue.key,
+            "Summary": issue.fields.summary,
+            "Status": issue.fields.status.name,
+            "Assignee": assignee.displayName if assignee else "Unassigned",
+            "Issue Type": issue.fields.issuetype.name,
+        }
+
+    def stream_json(self, children):
+        """
+        Print children as a JSON array, one row per line as each is fetched.
+
+        Args:
+            children: An iterable of child issues
+
+        Returns:
+            The number of children printed
+        """
+        count = 0
+        print("[", end="")
+        for count, issue in enumerate(children, 1):
+            separator = "," if count > 1 else ""
+            print(
+                f"{separator}\n    {json.dumps(self.child_row(issue))}",
+                end="",
+                flush=True,
+            )
+        print("\n]" if count else "]")
+        return count
+
+    def execute(self, args):
+        """
+        Execute the command with the provided arguments.
+
+        Args:
+            args: The parsed arguments
+        """
+        epic = args.epic.upper()
+        self.log.debug("Listing children of %s", epic)
+        children = self.jira_client.iter_search(
+            f"parent = {epic} ORDER BY key", fields=CHILD_FIELDS
+        )
+        if args.output == "json":
+            if not self.stream_json(children):
+                self.log.info("No issues in %s", epic)
+            return None
+
+        # A table needs every row to size its columns
+        models = [cac.model.Model(self.child_row(issue)) for issue in children]
+        if not models:
+            self.log.info("No issues in %s", epic)
+            return None
+        output = cac.output.Output(args)
+        output.print_models(models)
+        return None
@@ -8,8 +8,20 @@ action classes should inherit from.
 """
 
 import abc
+import re
+import sys
+import threading
+
+import cac_core as cac
+from jira.exceptions import JIRAError
 
 from cac_jira.commands.command import JiraCommand
+from cac_jira.core.bulk import retry_after, run_bulk
+from cac_jira.core.client import parse_datetime
+from cac_jira.core.workflow import NEW
+
+# Fields needed to plan a transition without fetching each issue again
+TRANSITION_FIELDS = ["project", "issuetype", "status"]
 
 
 class JiraIssueCommand(JiraCommand):
@@ -55,49 +67,396 @@ class JiraIssueCommand(JiraCommand):
         """
         raise NotImplementedError("Subclasses must implement execute()")
 
-    def _transition_to(self, issue, transition_name, comment=None):
+    @staticmethod
+    def issue_keys(args):
         """
-        Transition an issue to the named state.
+        Collect the issue keys a command should act on.
+
+        Keys come from --issue (repeatable, and comma- or space-separated);
+        "-" or no --issue at all with piped input reads keys from stdin.
+
+        Args:
+            args: The parsed arguments
+
+        Returns:
+            A list of issue keys, de-duplicated, in the order given
+        """
+        values = getattr(args, "issue", None) or []
+        if isinstance(values, str):
+            values = [values]
+        if "-" in values or (not values and not sys.stdin.isatty()):
+            values = [v for v in values if v != "-"] + [sys.stdin.read()]
+        keys = [key for value in values for key in re.split(r"[\s,]+", value) if key]
+        # (`list` here is the issue.list submodule once it's imported, not the builtin)
+        return [*dict.fromkeys(key.upper() for key in keys)]
+
+    @staticmethod
+    def issue_row(issue):
+        """
+        Flatten an issue into the row shown by list-style commands.
 
         Args:
             issue: The Jira issue object
-            transition_name: The target transition name (case-insensitive)
-            comment: Optional comment to add after transitioning
 
         Returns:
-            True on success, False if the transition was not found or failed
+            A dict of column name to display value
         """
-        transitions = self.jira_client.transitions(issue)
+        assignee = (
+            issue.fields.assignee.displayName if issue.fields.assignee else "Unassigned"
+        )
+        resolution_date = (
+            parse_datetime(issue.fields.resolutiondate).strftime("%Y-%m-%d")
+            if issue.fields.resolutiondate
+            else "N/A"
+        )
+        return {
+            "ID": issue.key,
+            "Summary": issue.fields.summary,
+            "Status": issue.fields.status.name,
+            "Assignee": assignee,
+            "Issue Type": issue.fields.issuetype.name,
+            "Labels": ", ".join(issue.fields.labels),
+            "Resolution Date": resolution_date,
+        }
 
-        transition_id = None
-        matched_name = None
-        for transition in transitions:
-            if transition["name"].upper() == transition_name.upper():
-                transition_id = transition["id"]
-                matched_name = transition["name"]
-                self.log.debug(
-                    "Found '%s' transition with ID: %s", matched_name, transition_id
-                )
-                break
+    @classmethod
+    def index_issue(cls, index, issue):
+        """
+        Add or refresh an issue in the local search index.
 
-        if not transition_id:
-            self.log.error("No '%s' transition found for this issue", transition_name)
-            self.log.info("Available transitions:")
-            for transition in transitions:
-                self.log.info("  - %s (ID: %s)", transition["name"], transition["id"])
+        Args:
+            index: The IssueIndex to update
+            issue: The Jira issue object, fetched with at least the SYNC_FIELDS
+        """
+        # Webhook payloads carry no comments; None keeps the stored ones
+        comment = getattr(issue.fields, "comment", None)
+        comments = [(str(c.id), c.body) for c in comment.comments] if comment else None
+        index.upsert(
+            issue.key,
+            cls.issue_row(issue),
+            summary=issue.fields.summary,
+            description=getattr(issue.fields, "description", None),
+            comments=comments,
+            updated=getattr(issue.fields, "updated", None),
+        )
+
+    def _learn_status(self, graph, project, issuetype, status):
+        """
+        Learn the transitions out of a status from any issue currently in it.
+
+        Args:
+            graph: The WorkflowGraph to update
+            project: The project key
+            issuetype: The issue type name
+            status: The status name
+
+        Returns:
+            True if an issue in that status was found and its transitions learned
+        """
+        jql = (
+            f'project = "{project}" AND issuetype = "{issuetype}" '
+            f'AND status = "{status}"'
+        )
+        sample = self.jira_client.search_issues(jql, fields=["status"], max_results=1)
+        if not sample:
             return False
+        graph.learn(status, self.jira_client.transitions(sample[0]))
+        return True
+
+    def _plan_transition(self, issue, graph, where, target):
+        """
+        Find the transitions that take an issue to a target, learning the
+        workflow as needed.
+
+        The current status is learned from the issue itself. If no known path
+        reaches the target, statuses reachable from here that haven't been
+        seen yet are learned from other issues in them, which needs no writes.
+
+        Args:
+            issue: The Jira issue object
+            graph: The WorkflowGraph for the issue's project and type
+            where: (project key, issue type name, current status name)
+            target: The transition or status name to reach
+
+        Returns:
+            A list of transitions, or None if the target can't be reached
+        """
+        project, issuetype, status = where
+        if not graph.knows(status):
+            graph.learn(status, self.jira_client.transitions(issue))
+        path = graph.path(status, target)
+
+        tried = set()
+        while path is None:
+            frontier = [
+                t["to"]
+                # tuple() snapshots the statuses; bulk transitions share graphs
+                for known in tuple(graph.edges)
+                for t in graph.transitions(known)
+                if not graph.knows(t["to"]) and t["to"].lower() not in tried
+            ]
+            if not frontier:
+                break
+            tried.add(frontier[0].lower())
+            if self._learn_status(graph, project, issuetype, frontier[0]):
+                path = graph.path(status, target)
+        return path
+
+    def _transition_with_comment(self, issue, transition_id, comment):
+        """
+        Take a transition and add a comment in the same request.
+
+        Falls back to a separate comment if the transition's screen rejects
+        the comment field; any other failure is raised.
+
+        Args:
+            issue: The Jira issue object
+            transition_id: The transition ID
+            comment: The comment text
+
+        Returns:
+            True if the comment was added, False if only the transition was
+        """
+        try:
+            self.jira_client.transition_issue(issue, transition_id, comment=comment)
+            return True
+        except JIRAError as e:
+            if e.status_code != 400 or "comment" not in str(e.text).lower():
+                raise
+            self.log.debug(
+                "Transition rejected the comment (%s); adding it separately", e
+            )
+        self.jira_client.transition_issue(issue, transition_id)
+        return self._add_comment(issue, comment)
+
+    def _add_comment(self, issue, comment):
+        """
+        Add a comment to an issue, logging rather than raising on failure.
+
+        Args:
+            issue: The Jira issue object
+            comment: The comment text
 
+        Returns:
+            True if the comment was added, False otherwise
+        """
         try:
-            self.jira_client.transition_issue(issue, transition_id)
-            if comment:
-                self.jira_client.add_comment(issue, comment)
-                self.log.info('Added comment: "%s"', comment)
-            self.log.info('Issue %s transitioned to "%s"', issue.key, matched_name)
+            self.jira_client.add_comment(issue, comment)
             return True
         except Exception as e:  # pylint: disable=broad-exception-caught
-            self.log.error("Failed to transition issue: %s", str(e))
+            self.log.error("Failed to add comment: %s", str(e))
             return False
 
+    def _transition_to(
+        self,
+        issue,
+        transition_name,
+        comment=None,
+        project=None,
+        issuetype=None,
+        status=None,
+        graph=None,
+    ):
+        """
+        Transition an issue to the named state.
+
+        Transitions are resolved from a cached workflow graph for the issue's
+        project and type, so the common case is a single transition request.
+        Targets that aren't one hop away are reached along the shortest known
+        path. A failed transition re-reads the issue's status, refreshes the
+        graph from there and is re-planned once.
+
+        Args:
+            issue: The Jira issue object
+            transition_name: The target transition or status name (case-insensitive)
+            comment: Optional comment, sent with the (final) transition
+            project: The issue's project key (default: from the issue)
+            issuetype: The issue's type name (default: from the issue)
+            status: The issue's current status name (default: from the
+                issue); workflow.NEW for an issue that was just created
+            graph: Optional WorkflowGraph shared across many issues; the
+                caller is then responsible for saving it
+
+        Returns:
+            True on success, False if the transition was not found or failed
+        """
+        project = project or issue.fields.project.key
+        issuetype = issuetype or issue.fields.issuetype.name
+        status = status or issue.fields.status.name
+        shared = graph is not None
+        if not shared:
+            graph = self.jira_client.workflow(project, issuetype)
+        commented = False
+
+        for attempt in range(2):
+            path = self._plan_transition(
+                issue, graph, (project, issuetype, status), transition_name
+            )
+            if path is None:
+                if not shared:
+                    self.jira_client.save_workflow(project, issuetype, graph)
+                self.log.error(
+                    "No '%s' transition found for this issue", transition_name
+                )
+                self.log.info("Available transitions:")
+                for transition in graph.transitions(status):
+                    self.log.info(
+                        "  - %s (ID: %s)", transition["name"], transition["id"]
+                    )
+                return False
+            if not path:
+                self.log.info('Issue %s is already "%s"', issue.key, status)
+                if comment and self._add_comment(issue, comment):
+                    self.log.info('Added comment: "%s"', comment)
+                return True
+
+            try:
+                for step in path:
+                    self.log.debug(
+                        "Taking '%s' transition (ID: %s) to %s",
+                        step["name"],
+                        step["id"],
+                        step["to"],
+                    )
+                    if comment and step is path[-1]:
+                        commented = self._transition_with_comment(
+                            issue, step["id"], comment
+                        )
+                    else:
+                        self.jira_client.transition_issue(issue, step["id"])
+                    status = step["to"]
+                break
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                if retry_after(e, attempt) is not None:
+                    # Rate limited: let the caller back off and retry
+                    raise
+                if attempt:
+                    self.log.error("Failed to transition issue: %s", str(e))
+                    return False
+                # The cached workflow may be stale, or the issue may not be
+                # where we assumed; relearn from where it actually is
+                self.log.debug("Transition failed (%s); refreshing workflow", e)
+                current = self.jira_client.issue(issue.key, fields="status")
+                transitions = self.jira_client.transitions(issue)
+                if status == NEW:
+                    # Nothing was taken yet, so these are the create-time ones
+                    graph.learn(NEW, transitions)
+                status = current.fields.status.name
+                graph.learn(status, transitions)
+
+        if not shared:
+            self.jira_client.save_workflow(project, issuetype, graph)
+        if comment and commented:
+            self.log.info('Added comment: "%s"', comment)
+        self.log.info('Issue %s transitioned to "%s"', issue.key, path[-1]["name"])
+        return True
+
+    def target_issues(self, args, fields=None):
+        """
+        Resolve the issues a bulk command should act on.
+
+        With --jql the matching issues are streamed from a single search;
+        otherwise the keys from --issue or stdin are fetched in a few batched
+        searches.
+
+        Args:
+            args: The parsed arguments
+            fields: The fields to fetch for each issue
+
+        Returns:
+            A tuple of (iterable of issues, list of keys not found)
+        """
+        jql = getattr(args, "jql", None)
+        if jql:
+            self.log.debug("Finding issues matching: %s", jql)
+            return self.jira_client.iter_search(jql, fields=fields), []
+        return self.jira_client.issues_by_keys(self.issue_keys(args), fields=fields)
+
+    def transition_issues(self, args, transition_name, comment=None):
+        """
+        Transition the issues given by --issue, stdin or --jql.
+
+        A single key is transitioned directly. Otherwise the issues are
+        transitioned concurrently, sharing one workflow graph per project and
+        issue type so that transition IDs are looked up once per group.
+
+        Args:
+            args: The parsed arguments
+            transition_name: The target transition or status name
+            comment: Optional comment to add with each transition
+
+        Returns:
+            1 if no issues were given or any transition failed, None otherwise
+        """
+        keys = [] if getattr(args, "jql", None) else self.issue_keys(args)
+        if len(keys) == 1:
+            self.log.debug(
+                "Transitioning Jira issue %s to %s", keys[0], transition_name
+            )
+            issue = self.jira_client.issue(keys[0], fields=",".join(TRANSITION_FIELDS))
+            if not issue:
+                self.log.error("Issue not found")
+                return 1
+            if not self._transition_to(issue, transition_name, comment=comment):
+                return 1
+            return None
+        if not keys and not getattr(args, "jql", None):
+            self.log.error("No issues given; pass --issue, --jql or pipe keys on stdin")
+            return 1
+
+        issues, missing = self.target_issues(args, fields=TRANSITION_FIELDS)
+        graphs = {}
+        lock = threading.Lock()
+
+        def transition(issue):
+            group = (issue.fields.project.key, issue.fields.issuetype.name)
+            with lock:
+                if group not in graphs:
+                    graphs[group] = self.jira_client.workflow(*group)
+            if not self._transition_to(
+                issue, transition_name, comment=comment, graph=graphs[group]
+            ):
+                raise RuntimeError(f"Could not transition to '{transition_name}'")
+
+        results = run_bulk(transition, issues, self.jira_client.max_workers)
+        for (project, issuetype), graph in graphs.items():
+            self.jira_client.save_workflow(project, issuetype, graph)
+        return self.report_bulk(args, results, missing)
+
+    def report_bulk(self, args, results, missing=()):
+        """
+        Print the per-issue outcome of a bulk operation and a summary.
+
+        Args:
+            args: The parsed arguments
+            results: The BulkResults, one per issue (items are issues or keys)
+            missing: Keys that were asked for but not found
+
+        Returns:
+            1 if any issue failed or was missing, None otherwise
+        """
+        rows = [
+            {
+                "Key": getattr(result.item, "key", result.item),
+                "Result": "OK" if result.ok else "Failed",
+                "Error": result.error or "",
+            }
+            for result in results
+        ] + [{"Key": key, "Result": "Not found", "Error": ""} for key in missing]
+        if not rows:
+            self.log.info("No matching issues")
+            return None
+
+        output = cac.output.Output(args)
+        output.print_models([cac.model.Model(row) for row in rows])
+
+        failed = len(rows) - sum(1 for result in results if result.ok)
+        self.log.info("%d of %d issues succeeded", len(rows) - failed, len(rows))
+        if failed:
+            self.log.error("%d issues failed", failed)
+            return 1
+        return None
+
     # def get_issue_types(self, args) -> list:
     #     """
     #     Get available issue types for a project.
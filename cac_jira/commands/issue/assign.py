@@ -1,7 +1,25 @@
 # #!/usr/bin/env python
 # pylint: disable=no-member
 
+"""
+Command module for assigning Jira issues.
+
+The assignee is resolved to an account ID once (and cached), then issues are
+assigned by ID, so assigning many issues costs one request each.
+
+Example usage:
+    jira issue assign --issue PROJECT-123
+    jira issue assign --issue PROJECT-123 --to jane@example.com
+    jira issue assign --jql "sprint = 42 AND assignee is EMPTY" --to "Jane Doe"
+"""
+
+from jira.exceptions import JIRAError
+
 from cac_jira.commands.issue import JiraIssueCommand
+from cac_jira.core.bulk import run_bulk
+
+# --to values that clear the assignee
+UNASSIGNED = ("none", "unassigned")
 
 
 class IssueAssign(JiraIssueCommand):
@@ -21,9 +39,21 @@ class IssueAssign(JiraIssueCommand):
         parser.add_argument(
             "-i",
             "--issue",
-            help="Issue to match",
+            help="Issue to assign (repeatable; comma-separated lists and keys "
+            "piped on stdin also work)",
+            action="append",
+            default=None,
+        )
+        parser.add_argument(
+            "--jql",
+            help="Assign every issue matching this JQL query",
             default=None,
-            required=True,
+        )
+        parser.add_argument(
+            "--to",
+            help='Who to assign to: "me" (default), a name, an email address, '
+            'an account ID, or "none" to unassign',
+            default="me",
         )
         return parser
 
@@ -34,8 +64,34 @@ class IssueAssign(JiraIssueCommand):
         Args:
             args: The parsed arguments
         """
-        self.log.debug(
-            "Assigning Jira issue %s to %s", args.issue, self.config.username
+        assignee = getattr(args, "to", None) or "me"
+        jql = getattr(args, "jql", None)
+        keys = [] if jql else self.issue_keys(args)
+        if not keys and not jql:
+            self.log.error("No issues given; pass --issue, --jql or pipe keys on stdin")
+            return 1
+
+        if assignee.lower() in UNASSIGNED:
+            account_id = None
+        else:
+            try:
+                account_id = self.jira_client.resolve_user(assignee)
+            except JIRAError as e:
+                self.log.error("Could not resolve user '%s': %s", assignee, e.text)
+                return 1
+
+        if len(keys) == 1:
+            self.log.debug("Assigning Jira issue %s to %s", keys[0], assignee)
+            self.jira_client.assign_issue(keys[0], account_id)
+            self.log.info("Issue assigned")
+            return None
+
+        targets = keys or (
+            issue.key for issue in self.jira_client.iter_search(jql, fields=["key"])
+        )
+        results = run_bulk(
+            lambda key: self.jira_client.assign_issue(key, account_id),
+            targets,
+            self.jira_client.max_workers,
         )
-        self.jira_client.assign_issue(args.issue, self.config.username)
-        self.log.info("Issue assigned")
+        return self.report_bulk(args, results)
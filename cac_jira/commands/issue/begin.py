@@ -28,9 +28,15 @@ class IssueBegin(JiraIssueCommand):
         parser.add_argument(
             "-i",
             "--issue",
-            help="Issue to transition to In Progress",
+            help="Issue to transition to In Progress (repeatable; comma-separated "
+            "lists and keys piped on stdin also work)",
+            action="append",
+            default=None,
+        )
+        parser.add_argument(
+            "--jql",
+            help="Transition every issue matching this JQL query",
             default=None,
-            required=True,
         )
         return parser
 
@@ -41,9 +47,4 @@ class IssueBegin(JiraIssueCommand):
         Args:
             args: The parsed arguments
         """
-        self.log.debug("Transitioning Jira issue %s to In Progress", args.issue)
-        issue = self.jira_client.issue(args.issue)
-        if not issue:
-            self.log.error("Issue not found")
-            return
-        self._transition_to(issue, "In Progress")
+        return self.transition_issues(args, "In Progress")
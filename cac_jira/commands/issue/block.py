@@ -28,9 +28,15 @@ class IssueBlock(JiraIssueCommand):
         parser.add_argument(
             "-i",
             "--issue",
-            help="Issue to transition to Blocked",
+            help="Issue to transition to Blocked (repeatable; comma-separated "
+            "lists and keys piped on stdin also work)",
+            action="append",
+            default=None,
+        )
+        parser.add_argument(
+            "--jql",
+            help="Transition every issue matching this JQL query",
             default=None,
-            required=True,
         )
         parser.add_argument(
             "-c",
@@ -48,9 +54,4 @@ class IssueBlock(JiraIssueCommand):
         Args:
             args: The parsed arguments
         """
-        self.log.debug("Transitioning Jira issue %s to Blocked", args.issue)
-        issue = self.jira_client.issue(args.issue)
-        if not issue:
-            self.log.error("Issue not found")
-            return
-        self._transition_to(issue, "Blocked", comment=args.comment)
+        return self.transition_issues(args, "Blocked", comment=args.comment)
@@ -27,9 +27,15 @@ class IssueClose(JiraIssueCommand):
         parser.add_argument(
             "-i",
             "--issue",
-            help="Issue to match",
+            help="Issue to transition to Done (repeatable; comma-separated "
+            "lists and keys piped on stdin also work)",
+            action="append",
+            default=None,
+        )
+        parser.add_argument(
+            "--jql",
+            help="Transition every issue matching this JQL query",
             default=None,
-            required=True,
         )
         parser.add_argument(
             "-c",
@@ -41,9 +47,4 @@ class IssueClose(JiraIssueCommand):
         return parser
 
     def execute(self, args):
-        self.log.debug("Closing Jira issue %s", args.issue)
-        issue = self.jira_client.issue(args.issue)
-        if not issue:
-            self.log.error("Issue not found")
-            return
-        self._transition_to(issue, "Done", comment=args.comment)
+        return self.transition_issues(args, "Done", comment=args.comment)
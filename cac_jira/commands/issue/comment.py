@@ -1,7 +1,47 @@
 # #!/usr/bin/env python
 # pylint: disable=no-member
 
+"""
+Command module for commenting on Jira issues.
+
+A comment can be posted to one issue, or to many at once with --jql (or
+several keys). With --template, each issue gets its own comment body, rendered
+from the issue's fields: placeholders name a field by name or ID, plus {key}
+and any --var values. The fields are fetched in the search that finds the
+issues, so rendering needs no further requests.
+
+Example usage:
+    jira issue comment --issue PROJECT-123 --comment "Looks good"
+    jira issue comment --jql 'fixVersion = "1.2"' \\
+        --template "Released in {version} ({key}: {summary})" --var version=1.2
+"""
+
+import string
+
 from cac_jira.commands.issue import JiraIssueCommand
+from cac_jira.core.bulk import run_bulk
+
+
+def display_value(value):
+    """
+    Render a raw field value as text for a comment.
+
+    Args:
+        value: The field's raw JSON value
+
+    Returns:
+        The text: names for users, options and other objects, comma-separated
+        lists for arrays, and "" for empty fields
+    """
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return ", ".join(display_value(item) for item in value)
+    if isinstance(value, dict):
+        for key in ("displayName", "name", "value", "key"):
+            if key in value:
+                return str(value[key])
+    return str(value)
 
 
 class IssueComment(JiraIssueCommand):
@@ -21,19 +61,68 @@ class IssueComment(JiraIssueCommand):
         parser.add_argument(
             "-i",
             "--issue",
-            help="Issue to match",
+            help="Issue to comment on (repeatable; comma-separated lists and "
+            "keys piped on stdin also work)",
+            action="append",
             default=None,
-            required=True,
         )
         parser.add_argument(
+            "--jql",
+            help="Comment on every issue matching this JQL query",
+            default=None,
+        )
+        body = parser.add_mutually_exclusive_group(required=True)
+        body.add_argument(
             "-c",
             "--comment",
             help="Comment to add",
             default=None,
-            required=True,
+        )
+        body.add_argument(
+            "--template",
+            help="Comment to add, with {placeholders} filled in per issue from "
+            "its fields (by name or ID), {key} and --var values",
+            default=None,
+        )
+        parser.add_argument(
+            "--var",
+            action="append",
+            metavar="NAME=VALUE",
+            help="Value for a --template placeholder (repeatable)",
+            default=None,
         )
         return parser
 
+    def template_fields(self, template, variables):
+        """
+        Work out which fields a template's placeholders refer to.
+
+        Args:
+            template: The comment template
+            variables: Dict of --var values
+
+        Returns:
+            A dict of placeholder -> field ID, for placeholders that aren't
+            {key} or a --var
+
+        Raises:
+            ValueError: If a placeholder isn't a known field
+        """
+        placeholders = {
+            name
+            for _, name, _, _ in string.Formatter().parse(template)
+            if name is not None
+        }
+        fields = {}
+        catalog = None
+        for name in placeholders - set(variables) - {"key"}:
+            catalog = catalog or self.jira_client.field_catalog()
+            field_id = catalog.resolve(name)
+            if field_id is None:
+                raise ValueError(f"Unknown template placeholder {{{name}}}")
+            fields[name] = field_id
+        return fields
+
     def execute(self, args):
         """
         Execute the command with the provided arguments.
@@ -41,6 +130,47 @@ class IssueComment(JiraIssueCommand):
         Args:
             args: The parsed arguments
         """
-        self.log.debug("Commenting on Jira issue %s", args.issue)
-        self.jira_client.add_comment(args.issue, args.comment)
-        self.log.info("Added comment to %s", args.issue)
+        variables = dict(
+            var.split("=", 1) for var in getattr(args, "var", None) or [] if "=" in var
+        )
+        template = getattr(args, "template", None)
+        try:
+            fields = self.template_fields(template, variables) if template else {}
+        except ValueError as e:
+            self.log.error("%s", e)
+            return 1
+
+        def render(issue):
+            if not template:
+                return args.comment
+            raw = getattr(issue, "raw", None) or {}
+            values = dict(variables, key=getattr(issue, "key", issue))
+            for name, field_id in fields.items():
+                values[name] = display_value(raw.get("fields", {}).get(field_id))
+            return template.format_map(values)
+
+        jql = getattr(args, "jql", None)
+        keys = [] if jql else self.issue_keys(args)
+        if not keys and not jql:
+            self.log.error("No issues given; pass --issue, --jql or pipe keys on stdin")
+            return 1
+        if len(keys) == 1 and not fields:
+            self.log.debug("Commenting on Jira issue %s", keys[0])
+            self.jira_client.add_comment(keys[0], render(keys[0]))
+            self.log.info("Added comment to %s", keys[0])
+            return None
+
+        if fields or jql:
+            issues, missing = self.target_issues(
+                args, fields=sorted(set(fields.values())) or ["key"]
+            )
+        else:
+            issues, missing = keys, []
+        results = run_bulk(
+            lambda issue: self.jira_client.add_comment(
+                getattr(issue, "key", issue), render(issue)
+            ),
+            issues,
+            self.jira_client.max_workers,
+        )
+        return self.report_bulk(args, results, missing)
@@ -3,11 +3,76 @@
 
 """
 Command module for creating Jira issues.
+
+The lookups a create needs (project, create metadata and current user) don't
+depend on each other, so they are issued concurrently; --epic is sent as the
+parent by key without being looked up, and Jira rejects an unknown one. The
+assignee is set in the create request itself and --begin uses the cached
+workflow for new issues of the type, so create, assign and begin take two
+requests.
+
+--from-file creates many issues at once from a YAML, CSV or JSON-lines file.
+Every row is validated offline against the project's create metadata before
+anything is sent, then rows are submitted through the bulk create endpoint.
+
+Example usage:
+    jira issue create --project PROJ --type Task --title "Fix login" --description "..."
+    jira issue create --project PROJ --from-file sprint.yaml --assign
 """
 
+import csv
+import json
+import os
+import threading
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
+
+import cac_core as cac
+import yaml
 
 from cac_jira.commands.issue import JiraIssueCommand
+from cac_jira.core.bulk import run_bulk
+from cac_jira.core.fields import normalize_name
+from cac_jira.core.workflow import NEW
+
+# Row keys with a meaning of their own; any other key names a field
+ROW_KEYS = {"title", "summary", "description", "type", "labels", "epic", "assign"}
+
+
+def load_rows(path):
+    """
+    Read the issues to create from a file.
+
+    YAML files hold a list of mappings (or a mapping with an `issues` list),
+    CSV files have one issue per row with a header, and JSON-lines files have
+    one object per line. Empty values are dropped.
+
+    Args:
+        path: Path to a .yaml/.yml, .csv, .jsonl/.ndjson or .json file
+
+    Returns:
+        A list of dicts, one per issue
+    """
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if extension in (".yaml", ".yml"):
+            rows = yaml.safe_load(f) or []
+            if isinstance(rows, dict):
+                rows = rows.get("issues", [])
+        elif extension == ".csv":
+            rows = [dict(row) for row in csv.DictReader(f)]
+        elif extension in (".jsonl", ".ndjson"):
+            rows = [json.loads(line) for line in f if line.strip()]
+        elif extension == ".json":
+            rows = json.load(f)
+        else:
+            raise ValueError(f"Unsupported file type '{extension}'")
+    if not all(isinstance(row, dict) for row in rows):
+        raise ValueError("Every issue must be a mapping of field names to values")
+    return [
+        {str(k).strip().lower(): v for k, v in row.items() if v not in (None, "")}
+        for row in rows
+    ]
 
 
 class IssueCreate(JiraIssueCommand):
@@ -26,9 +91,14 @@ class IssueCreate(JiraIssueCommand):
         super().define_arguments(parser)
 
         # Add action-specific arguments
-        parser.add_argument("-t", "--title", help="Issue title", required=True)
+        parser.add_argument("-t", "--title", help="Issue title", default=None)
         parser.add_argument(
-            "-d", "--description", help="Issue description", required=True
+            "-d", "--description", help="Issue description", default=None
+        )
+        parser.add_argument(
+            "--from-file",
+            help="Create every issue in a YAML, CSV or JSON-lines file; other options apply to every row",
+            default=None,
         )
 
         # TODO: get list of valid types from Jira
@@ -84,13 +154,36 @@ class IssueCreate(JiraIssueCommand):
 
         return parser
 
-    def get_mandatory_fields(self, project_key, issuetype_name):
+    def prefetch(self, args):
+        """
+        Run the independent lookups needed to create an issue concurrently.
+
+        Args:
+            args: The parsed arguments
+
+        Returns:
+            dict: Lookup name -> completed Future (call result() to get the
+            value or raise the lookup's error)
+        """
+        calls = {
+            "project": lambda: self.jira_client.project(args.project),
+            "createmeta": lambda: self.jira_client.createmeta(
+                projectKeys=args.project, expand="projects.issuetypes.fields"
+            ),
+            "user": self.jira_client.current_user,
+        }
+
+        with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+            return {name: pool.submit(fn) for name, fn in calls.items()}
+
+    def get_mandatory_fields(self, project_key, issuetype_name, metadata=None):
         """
         Get mandatory fields for a specific issue type in a project.
 
         Args:
             project_key (str): Project key (e.g., 'TEST')
             issuetype_name (str): Issue type name (e.g., 'Bug', 'Task')
+            metadata (dict): Create metadata for the project, if already fetched
 
         Returns:
             dict: Dictionary of field_id -> field_name for mandatory fields
@@ -100,19 +193,34 @@ class IssueCreate(JiraIssueCommand):
         )
 
         # Get the create metadata for this project and issue type
-        metadata = self.jira_client.createmeta(
-            projectKeys=project_key,
-            issuetypeNames=issuetype_name,
-            expand="projects.issuetypes.fields",
-        )
+        if metadata is None:
+            metadata = self.jira_client.createmeta(
+                projectKeys=project_key,
+                issuetypeNames=issuetype_name,
+                expand="projects.issuetypes.fields",
+            )
 
         # Extract the fields from the metadata
         mandatory_fields = {}
 
         try:
-            # Navigate the nested structure to get to the fields
+            # Navigate the nested structure to get to the fields; metadata for
+            # the whole project has every issue type, so pick ours by name
             project_meta = metadata["projects"][0]
-            issuetype_meta = project_meta["issuetypes"][0]
+            issuetypes = project_meta["issuetypes"]
+            matching = [
+                it
+                for it in issuetypes
+                if it.get("name", "").lower() == issuetype_name.lower()
+            ]
+            if matching:
+                issuetype_meta = matching[0]
+            elif len(issuetypes) == 1:
+                # metadata already filtered to the requested issue type
+                issuetype_meta = issuetypes[0]
+            else:
+                self.log.debug(f"No create metadata for {issuetype_name}")
+                return {}
             fields = issuetype_meta["fields"]
 
             # Identify mandatory fields (required=True)
@@ -129,6 +237,259 @@ class IssueCreate(JiraIssueCommand):
             self.log.error(f"Error parsing metadata: {e}")
             return {}
 
+    def apply_custom_fields(self, fieldset, custom_fields, mandatory_fields):
+        """
+        Add custom field values to an issue's fields, mapping field names to
+        IDs and coercing values to the shape the field's schema expects.
+
+        Args:
+            fieldset (dict): The issue fields to add to
+            custom_fields: Iterable of (field name or ID, value) pairs
+            mandatory_fields (dict): As returned by get_mandatory_fields()
+        """
+        if not custom_fields:
+            return
+        catalog = self.jira_client.field_catalog()
+
+        # Mandatory fields are looked up first: their names are scoped to
+        # this issue type, so they win over same-named fields elsewhere
+        field_name_to_id = {}
+        for field_id, field_info in mandatory_fields.items():
+            field_name_to_id[normalize_name(field_info["name"])] = field_id
+
+        for field_name_or_id, value in custom_fields:
+            field_id = field_name_to_id.get(
+                normalize_name(field_name_or_id)
+            ) or catalog.resolve(field_name_or_id)
+            if field_id is None:
+                # Unknown to us; pass it through and let Jira judge
+                field_id = field_name_or_id
+            elif field_id != field_name_or_id:
+                self.log.debug(
+                    f"Mapped field name '{field_name_or_id}' to ID '{field_id}'"
+                )
+
+            schema = mandatory_fields.get(field_id, {}).get("schema")
+            fieldset[field_id] = catalog.coerce(field_id, value, schema)
+
+    def missing_fields(self, fieldset, mandatory_fields):
+        """
+        List the mandatory fields an issue's fields don't set.
+
+        Args:
+            fieldset (dict): The issue fields
+            mandatory_fields (dict): As returned by get_mandatory_fields()
+
+        Returns:
+            list: "field_label (field_id)" for each missing field
+        """
+        missing_fields = []
+        for field_id, field_info in mandatory_fields.items():
+            # Skip fields that we already handle (summary, description, project, issuetype, reporter)
+            if field_id in [
+                "summary",
+                "description",
+                "project",
+                "issuetype",
+                "reporter",
+            ]:
+                continue
+
+            # Check if this mandatory field is missing
+            if field_id not in fieldset:
+                field_label = normalize_name(field_info["name"])
+                missing_fields.append(f"{field_label} ({field_id})")
+        return missing_fields
+
+    def build_row(self, row, args, project, metadata, current_user, epic):
+        """
+        Build the fields for one issue of a --from-file batch.
+
+        Args:
+            row (dict): The issue as read by load_rows()
+            args: The parsed arguments, supplying defaults for every row
+            project: The project the issues are created in
+            metadata (dict): Create metadata for the whole project
+            current_user: Account ID of the current user
+            epic: Key of the --epic every row is added to, if any
+
+        Returns:
+            tuple: (fields, None) or (None, an error message)
+        """
+        summary = row.get("title", row.get("summary"))
+        if not summary:
+            return None, "missing title"
+
+        type_name = str(row.get("type", args.type))
+        issuetype = next(
+            (
+                it.name
+                for it in project.issueTypes
+                if it.name.lower() == type_name.lower()
+            ),
+            None,
+        )
+        if issuetype is None:
+            return None, f"invalid issue type '{type_name}'"
+
+        fieldset = {
+            "project": {"key": project.key},
+            "summary": str(summary),
+            "issuetype": {"name": issuetype},
+            "reporter": {"accountId": current_user},
+        }
+        if "description" in row or args.description:
+            fieldset["description"] = str(row.get("description", args.description))
+
+        labels = row.get("labels", args.labels)
+        if labels:
+            fieldset["labels"] = (
+                labels.split(",")
+                if isinstance(labels, str)
+                else [str(label) for label in labels]
+            )
+
+        assign = row.get("assign", args.assign)
+        if isinstance(assign, str):
+            assign = assign.strip().lower() in ("1", "true", "yes", "y")
+        if assign or args.begin:
+            fieldset["assignee"] = {"accountId": current_user}
+
+        parent = row.get("epic", epic)
+        if parent:
+            fieldset["parent"] = {"key": str(parent).upper()}
+
+        mandatory_fields = self.get_mandatory_fields(project.key, issuetype, metadata)
+        custom_fields = [(k, v) for k, v in row.items() if k not in ROW_KEYS]
+        self.apply_custom_fields(
+            fieldset, (args.custom_fields or []) + custom_fields, mandatory_fields
+        )
+        missing_fields = self.missing_fields(fieldset, mandatory_fields)
+        if missing_fields:
+            return None, f"missing mandatory fields: {', '.join(missing_fields)}"
+        return fieldset, None
+
+    def begin_created(self, project, created):
+        """
+        Move freshly bulk-created issues to In Progress.
+
+        The issues are transitioned concurrently, sharing one workflow graph
+        per issue type, so each type's transitions are looked up at most once
+        and its graph is saved once at the end.
+
+        Args:
+            project: The project the issues were created in
+            created: The create results (see JiraClient.create_issues()) of the
+                issues that were created
+
+        Returns:
+            A dict of issue key -> BulkResult
+        """
+        graphs = {}
+        lock = threading.Lock()
+
+        def begin(result):
+            issuetype = result["input_fields"]["issuetype"]["name"]
+            with lock:
+                if issuetype not in graphs:
+                    graphs[issuetype] = self.jira_client.workflow(
+                        project.key, issuetype
+                    )
+            if not self._transition_to(
+                result["issue"],
+                "In Progress",
+                project=project.key,
+                issuetype=issuetype,
+                status=NEW,
+                graph=graphs[issuetype],
+            ):
+                raise RuntimeError("Could not transition to 'In Progress'")
+
+        outcomes = run_bulk(begin, created, self.jira_client.max_workers)
+        for issuetype, graph in graphs.items():
+            self.jira_client.save_workflow(project.key, issuetype, graph)
+        return {outcome.item["issue"].key: outcome for outcome in outcomes}
+
+    def create_from_file(self, args, lookups, project):
+        """
+        Validate every issue in --from-file, then bulk-create them.
+
+        Nothing is created unless every row is valid. Rows Jira rejects are
+        reported; rows whose batch failed without an answer from Jira are
+        reported as "Unknown" rather than re-sent, since they may exist.
+
+        Args:
+            args: The parsed arguments
+            lookups (dict): As returned by prefetch()
+            project: The project the issues are created in
+
+        Returns:
+            int: 1 if any row could not be created (or begun), else None
+        """
+        try:
+            rows = load_rows(args.from_file)
+        except (OSError, ValueError, yaml.YAMLError) as e:
+            self.log.error("Failed to read %s: %s", args.from_file, e)
+            return 1
+        if not rows:
+            self.log.error("No issues found in %s", args.from_file)
+            return 1
+
+        metadata = lookups["createmeta"].result()
+        current_user = lookups["user"].result()
+        epic = args.epic.upper() if args.epic else None
+
+        field_list = []
+        invalid = 0
+        for number, row in enumerate(rows, 1):
+            fieldset, error = self.build_row(
+                row, args, project, metadata, current_user, epic
+            )
+            if error:
+                self.log.error("Row %d: %s", number, error)
+                invalid += 1
+            field_list.append(fieldset)
+        if invalid:
+            self.log.error(
+                "%d of %d rows are invalid; nothing created", invalid, len(rows)
+            )
+            return 1
+
+        results = self.jira_client.create_issues(field_list, prefetch=False)
+        unknown = sum(result["status"] == "Unknown" for result in results)
+        if unknown:
+            self.log.warning(
+                "%d rows may or may not have been created; check Jira before re-running them",
+                unknown,
+            )
+
+        created = [result for result in results if result["issue"]]
+        begun = self.begin_created(project, created) if args.begin else {}
+
+        models = []
+        for number, result in enumerate(results, 1):
+            row = {
+                "Row": number,
+                "Key": result["issue"].key if result["issue"] else "",
+                "Status": result["status"],
+                "Error": (
+                    "; ".join(f"{k}: {v}" for k, v in result["error"].items())
+                    if isinstance(result["error"], dict)
+                    else result["error"] or ""
+                ),
+            }
+            if args.begin:
+                outcome = begun.get(row["Key"])
+                row["Begun"] = "" if outcome is None else "Yes" if outcome.ok else "No"
+                if outcome is not None and not outcome.ok:
+                    row["Error"] = outcome.error
+            models.append(cac.model.Model(row))
+        printer = cac.output.Output(args)
+        printer.print_models(models)
+        self.log.info("Created %d of %d issues", len(created), len(results))
+        if len(created) < len(results) or not all(r.ok for r in begun.values()):
+            return 1
+
     def execute(self, args):
         """
         Execute the command with the provided arguments.
@@ -142,15 +503,26 @@ class IssueCreate(JiraIssueCommand):
         if not args.project:
             self.log.error("Project key is required for issue creation")
             return 1
+        from_file = getattr(args, "from_file", None)
+        if not from_file and not (args.title and args.description):
+            self.log.error(
+                "--title and --description are required (or use --from-file)"
+            )
+            return 1
+
+        lookups = self.prefetch(args)
 
         # validate project
         try:
-            project = self.jira_client.project(args.project)
+            project = lookups["project"].result()
             self.log.debug("Project %s found", project.key)
         except Exception as e:
             self.log.error("Failed to find project %s: %s", args.project, e)
             return 1
 
+        if from_file:
+            return self.create_from_file(args, lookups, project)
+
         # validate issue type
         matching_issuetype = None
         valid_types = []
@@ -169,23 +541,28 @@ class IssueCreate(JiraIssueCommand):
             )
             return 1
 
+        current_user = lookups["user"].result()
+
         # Prepare the issue data
         fieldset = {
-            "project": args.project,
+            # a bare key would make the jira library look the project up again
+            "project": {"key": project.key},
             "summary": args.title,
             "description": args.description,
             "issuetype": matching_issuetype,
-            "reporter": {"accountId": self.jira_client.current_user()},
+            "reporter": {"accountId": current_user},
         }
 
         if args.labels:
             self.log.debug("Adding labels: %s", args.labels)
             fieldset["labels"] = args.labels.split(",")
 
+        if args.assign:
+            fieldset["assignee"] = {"accountId": current_user}
+
         if args.epic:
-            epic = self.jira_client.issue(args.epic).key
-            self.log.debug("Adding to epic: %s", epic)
-            fieldset["parent"] = {"key": epic}
+            self.log.debug("Adding to epic: %s", args.epic)
+            fieldset["parent"] = {"key": args.epic.upper()}
 
         # if args.assignee:
         #     issue_data["assignee"] = args.assignee
@@ -201,101 +578,43 @@ class IssueCreate(JiraIssueCommand):
         #         fieldset[epic_name_field] = args.epic_name
 
         mandatory_fields = self.get_mandatory_fields(
-            args.project, matching_issuetype["name"]
+            args.project, matching_issuetype["name"], lookups["createmeta"].result()
         )
 
-        # Create a mapping from field names to field IDs (both lowercase for case-insensitive matching)
-        field_name_to_id = {}
-        for field_id, field_info in mandatory_fields.items():
-            field_name_to_id[field_info["name"].lower().replace(" ", "_")] = field_id
-
         # Print the mandatory fields
         if mandatory_fields:
             self.log.debug(
                 f"Mandatory fields for {matching_issuetype['name']} in {args.project}:"
             )
             for field_id, field_info in mandatory_fields.items():
-                field_label = field_info["name"].lower().replace(" ", "_")
+                field_label = normalize_name(field_info["name"])
                 self.log.debug(f"  {field_label} ({field_id})")
 
         # Apply individual field arguments
-        if args.custom_fields:
-            for field_name_or_id, value in args.custom_fields:
-                # First check if this is a field name
-                field_id = field_name_or_id
-
-                # Try to match the field name (case-insensitive)
-                if field_name_or_id.lower() in field_name_to_id:
-                    field_id = field_name_to_id[field_name_or_id.lower()]
-                    self.log.debug(
-                        f"Mapped field name '{field_name_or_id}' to ID '{field_id}'"
-                    )
-
-                # Handle special field types
-                if field_id.startswith("customfield_"):
-                    # Try to determine field type from schema
-                    field_schema = mandatory_fields.get(field_id, {}).get("schema", {})
-                    field_type = field_schema.get("type")
-
-                    if field_type == "array":
-                        # Handle array fields by splitting on comma
-                        fieldset[field_id] = value.split(",")
-                    elif field_type == "option":
-                        # Handle option fields
-                        fieldset[field_id] = {"value": value}
-                    else:
-                        fieldset[field_id] = value
-                else:
-                    fieldset[field_id] = value
-
-        # Check if we have all mandatory fields
-        missing_fields = []
-        for field_id, field_info in mandatory_fields.items():
-            # Skip fields that we already handle (summary, description, project, issuetype, reporter)
-            if field_id in [
-                "summary",
-                "description",
-                "project",
-                "issuetype",
-                "reporter",
-            ]:
-                continue
-
-            # Check if this mandatory field is missing
-            if field_id not in fieldset:
-                field_label = field_info["name"].lower().replace(" ", "_")
-                missing_fields.append(f"{field_label} ({field_id})")
+        self.apply_custom_fields(fieldset, args.custom_fields, mandatory_fields)
 
         # If there are missing mandatory fields, warn the user
+        missing_fields = self.missing_fields(fieldset, mandatory_fields)
         if missing_fields:
             raise ValueError(f"Missing mandatory fields: {', '.join(missing_fields)}")
 
         self.log.debug("Issue data: %s", fieldset)
-        issue = self.jira_client.create_issue(fields=fieldset)
+        # the created issue is built from the create response; no refetch
+        issue = self.jira_client.create_issue(fields=fieldset, prefetch=False)
         self.log.info("Issue %s created successfully", issue.key)
-
         if args.assign:
-            issue.update(assignee={"accountId": self.jira_client.current_user()})
             self.log.info("Issue %s assigned to you", issue.key)
 
         if args.begin:
-            try:
-                # Import the begin command module
-                from cac_jira.commands.issue.begin import IssueBegin
-
-                # Create a begin command instance
-                begin_cmd = IssueBegin()
-
-                # Prepare args for the begin command
-                # We need to simulate args with an 'issue' attribute containing the new issue key
-                from argparse import Namespace
-
-                begin_args = Namespace(issue=issue.key)
-
-                # Execute the begin command with our constructed args
-                begin_cmd.execute(begin_args)
-            except Exception as e:
-                self.log.error("Failed to transition issue to In Progress: %s", str(e))
+            # The create response has no status, but every new issue of a
+            # type starts in the same one
+            self._transition_to(
+                issue,
+                "In Progress",
+                project=project.key,
+                issuetype=matching_issuetype["name"],
+                status=NEW,
+            )
 
         if args.browse:
             webbrowser.open(issue.permalink())
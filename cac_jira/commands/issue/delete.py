@@ -1,7 +1,10 @@
 # #!/usr/bin/env python
 # pylint: disable=broad-exception-caught
 
+from functools import partial
+
 from cac_jira.commands.issue import JiraIssueCommand
+from cac_jira.core.bulk import run_bulk
 
 
 class IssueDelete(JiraIssueCommand):
@@ -21,9 +24,28 @@ class IssueDelete(JiraIssueCommand):
         parser.add_argument(
             "-i",
             "--issue",
-            help="Issue to match",
+            help="Issue to delete (repeatable; comma-separated lists and keys "
+            "piped on stdin also work)",
+            action="append",
+            default=None,
+        )
+        parser.add_argument(
+            "--jql",
+            help="Delete every issue matching this JQL query",
             default=None,
-            required=True,
+        )
+        parser.add_argument(
+            "--yes",
+            action="store_true",
+            default=False,
+            help="Actually delete when more than one issue is targeted; "
+            "without it, only report how many would be deleted",
+        )
+        parser.add_argument(
+            "--delete-subtasks",
+            action="store_true",
+            default=False,
+            help="Also delete subtasks (issues with subtasks can't be deleted otherwise)",
         )
         return parser
 
@@ -34,10 +56,36 @@ class IssueDelete(JiraIssueCommand):
         Args:
             args: The parsed arguments
         """
-        self.log.debug("Deleting Jira issue")
-        try:
-            self.jira_client.delete_issue(args.issue)
-        except Exception as e:
-            self.log.error("Failed to find issue %s: %s", args.issue, e)
-            return
-        self.log.info("Issue %s deleted", args.issue)
+        jql = getattr(args, "jql", None)
+        keys = [] if jql else self.issue_keys(args)
+        delete = partial(
+            self.jira_client.delete_issue,
+            delete_subtasks=getattr(args, "delete_subtasks", False),
+        )
+        if len(keys) == 1:
+            self.log.debug("Deleting Jira issue")
+            try:
+                delete(keys[0])
+            except Exception as e:
+                self.log.error("Failed to delete issue %s: %s", keys[0], e)
+                return None
+            self.log.info("Issue %s deleted", keys[0])
+            return None
+        if not keys and not jql:
+            self.log.error("No issues given; pass --issue, --jql or pipe keys on stdin")
+            return 1
+
+        if not getattr(args, "yes", False):
+            count = len(keys) if keys else self.jira_client.count_issues(jql)
+            self.log.info(
+                "%d issues would be deleted; re-run with --yes to delete them", count
+            )
+            return None
+
+        # Keys are deleted as the search streams them in; nothing is fetched
+        # beyond the keys themselves
+        targets = keys or (
+            issue.key for issue in self.jira_client.iter_search(jql, fields=["key"])
+        )
+        results = run_bulk(delete, targets, self.jira_client.max_workers)
+        return self.report_bulk(args, results)
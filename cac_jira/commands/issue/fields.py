@@ -3,6 +3,9 @@
 
 """
 Command module for listing mandatory fields for Jira issue types.
+
+--all lists every field on the server from the cached field catalog instead,
+with the names `--field` accepts on issue create and update.
 """
 
 # import webbrowser
@@ -19,19 +22,31 @@ class IssueFields(JiraIssueCommand):
         parser.add_argument(
             "--type", help="Issue type to check fields for", default=None
         )
+        parser.add_argument(
+            "--all",
+            help="List every field on the server, with its ID and type",
+            action="store_true",
+            default=False,
+        )
         return parser
 
     def execute(self, args):
         """List required fields for issue creation"""
+        if getattr(args, "all", False):
+            catalog = self.jira_client.field_catalog()
+            for field_id, field in sorted(
+                catalog.fields.items(), key=lambda item: item[1].get("name", "")
+            ):
+                field_type = catalog.schema(field_id).get("type", "unknown")
+                print(f"  {field.get('name', field_id)} [{field_type}] ({field_id})")
+            return
+
         project = args.project
         issuetype = args.type
 
-        # Get create metadata
-        metadata = self.jira_client.createmeta(
-            projectKeys=project,
-            issuetypeNames=issuetype,
-            # expand='projects.issuetypes.fields'
-        )
+        # Get create metadata for the whole project; it's the same (cached)
+        # request issue create makes
+        metadata = self.jira_client.createmeta(projectKeys=project)
 
         try:
             project_meta = metadata["projects"][0]
@@ -67,7 +82,7 @@ class IssueFields(JiraIssueCommand):
 
                     print(f"  {field['name']}{allowed} ({field_id})")
 
-            print("\nOptional fields:")
+            print("\nOptional fields (pass any of these by name with --field):")
             for field_id, field in issuetype_meta["fields"].items():
                 if not field.get("required", False):
                     print(f"  {field['name']} ({field_id})")
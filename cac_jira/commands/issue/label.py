@@ -2,6 +2,25 @@
 # pylint: disable=no-member
 
 from cac_jira.commands.issue import JiraIssueCommand
+from cac_jira.core.bulk import run_bulk
+
+
+def split_labels(values):
+    """
+    Flatten label arguments into a list.
+
+    Args:
+        values: The values given (each may be comma-separated), or None
+
+    Returns:
+        The labels, in the order given
+    """
+    return [
+        label.strip()
+        for value in values or []
+        for label in value.split(",")
+        if label.strip()
+    ]
 
 
 class IssueLabel(JiraIssueCommand):
@@ -21,16 +40,30 @@ class IssueLabel(JiraIssueCommand):
         parser.add_argument(
             "-i",
             "--issue",
-            help="Issue to match",
+            help="Issue to label (repeatable; comma-separated lists and keys "
+            "piped on stdin also work)",
+            action="append",
+            default=None,
+        )
+        parser.add_argument(
+            "--jql",
+            help="Label every issue matching this JQL query",
             default=None,
-            required=True,
         )
         parser.add_argument(
             "-l",
             "--labels",
-            help="Labels to add",
+            "--add",
+            dest="add",
+            help="Labels to add (comma-separated, repeatable)",
+            action="append",
+            default=None,
+        )
+        parser.add_argument(
+            "--remove",
+            help="Labels to remove (comma-separated, repeatable)",
+            action="append",
             default=None,
-            required=True,
         )
         return parser
 
@@ -41,6 +74,30 @@ class IssueLabel(JiraIssueCommand):
         Args:
             args: The parsed arguments
         """
-        self.log.debug("Adding lables to Jira issue %s", args.issue)
-        self.jira_client.add_labels(args.issue, args.labels)
-        self.log.info("Issue %s labels updated", args.issue)
+        add = split_labels(args.add)
+        remove = split_labels(args.remove)
+        if not add and not remove:
+            self.log.error("No labels given; pass --add and/or --remove")
+            return 1
+
+        jql = getattr(args, "jql", None)
+        keys = [] if jql else self.issue_keys(args)
+        if len(keys) == 1:
+            self.log.debug("Updating labels on Jira issue %s", keys[0])
+            self.jira_client.update_labels(keys[0], add=add, remove=remove)
+            self.log.info("Issue %s labels updated", keys[0])
+            return None
+        if not keys and not jql:
+            self.log.error("No issues given; pass --issue, --jql or pipe keys on stdin")
+            return 1
+
+        # Labels are edited by key, so only a search needs to fetch anything
+        targets = keys or (
+            issue.key for issue in self.jira_client.iter_search(jql, fields=["key"])
+        )
+        results = run_bulk(
+            lambda key: self.jira_client.update_labels(key, add=add, remove=remove),
+            targets,
+            self.jira_client.max_workers,
+        )
+        return self.report_bulk(args, results)
@@ -3,14 +3,24 @@
 
 """
 Command module for listing Jira issues.
+
+With --watch the table is re-rendered in place on an interval. After the first
+full fetch only issues updated since the newest `updated` timestamp seen are
+requested, and merged into the in-memory view.
 """
 
 # import argparse
-from datetime import datetime
+import sys
+import time
 
 import cac_core as cac
 
 from cac_jira.commands.issue import JiraIssueCommand
+from cac_jira.core.client import SEARCH_FIELDS, jql_datetime, parse_datetime
+
+# ANSI sequences used by --watch
+CLEAR_SCREEN = "\033[H\033[J"
+BOLD = "\033[1m{}\033[0m"
 
 
 class IssueList(JiraIssueCommand):
@@ -41,6 +51,16 @@ class IssueList(JiraIssueCommand):
             default=False,
             help="Include issues that are done",
         )
+        parser.add_argument(
+            "-w",
+            "--watch",
+            nargs="?",
+            type=int,
+            const=30,
+            default=None,
+            metavar="INTERVAL",
+            help="Re-render the list every INTERVAL seconds (default 30), fetching only changes",
+        )
 
         return parser
 
@@ -74,35 +94,98 @@ class IssueList(JiraIssueCommand):
 
         jql = " AND ".join(jql_parts) if jql_parts else ""
         self.log.debug("JQL query: %s", jql)
+        if getattr(args, "watch", None):
+            return self.watch(args, jql_parts[0], jql_parts[1:])
+
         total_issues = self.jira_client.search_issues(jql)
 
         models = []
         for issue in total_issues:
-            assignee = (
-                issue.fields.assignee.displayName
-                if issue.fields.assignee
-                else "Unassigned"
-            )
-            resolution_date = (
-                datetime.strptime(
-                    issue.fields.resolutiondate, "%Y-%m-%dT%H:%M:%S.%f%z"
-                ).strftime("%Y-%m-%d")
-                if issue.fields.resolutiondate
-                else "N/A"
-            )
-
-            model = cac.model.Model(
-                {
-                    "ID": issue.key,
-                    "Summary": issue.fields.summary,
-                    "Status": issue.fields.status.name,
-                    "Assignee": assignee,
-                    "Issue Type": issue.fields.issuetype.name,
-                    "Labels": ", ".join(issue.fields.labels),
-                    "Resolution Date": resolution_date,
-                }
-            )
+            model = cac.model.Model(self.issue_row(issue))
             models.append(model)
 
         printer = cac.output.Output(args)
         printer.print_models(models)
+
+    def watch(self, args, scope, filters):
+        """
+        Keep the list on screen, polling for changes until interrupted.
+
+        Each poll after the first asks only for issues updated since the last
+        one. Issues that were updated and still match are merged into the view
+        and highlighted; issues that were updated and no longer match the
+        filters (e.g. moved to Done) are dropped.
+
+        Args:
+            args: The parsed arguments
+            scope: The JQL clause selecting the project
+            filters: Additional JQL clauses the listed issues must match
+        """
+        fields = SEARCH_FIELDS + ["updated"]
+        jql = " AND ".join([scope] + filters)
+        view = {}
+        last_seen = None
+
+        try:
+            while True:
+                stale = []
+                if last_seen is None:
+                    updates = self.jira_client.search_issues(jql, fields=fields)
+                    changed = set()
+                else:
+                    since = f'updated >= "{jql_datetime(last_seen)}"'
+                    updates = self.jira_client.search_issues(
+                        f"{jql} AND {since}", fields=fields
+                    )
+                    # `since` has minute precision, so unchanged issues from the
+                    # last poll's final minute come back again; skip those
+                    changed = {
+                        issue.key
+                        for issue in updates
+                        if issue.key not in view
+                        or view[issue.key].fields.updated != issue.fields.updated
+                    }
+                    if filters:
+                        stale = self.jira_client.search_issues(
+                            f"{scope} AND {since} AND NOT ({' AND '.join(filters)})",
+                            fields=["key"],
+                        )
+
+                for issue in updates:
+                    view[issue.key] = issue
+                    updated = parse_datetime(issue.fields.updated)
+                    if last_seen is None or updated > parse_datetime(last_seen):
+                        last_seen = issue.fields.updated
+                for issue in stale:
+                    view.pop(issue.key, None)
+
+                self._render_watch(args, view, changed)
+                time.sleep(args.watch)
+        except KeyboardInterrupt:
+            pass
+
+    def _render_watch(self, args, view, changed):
+        """
+        Redraw the watched list, highlighting rows that just changed.
+
+        Args:
+            args: The parsed arguments
+            view: Mapping of issue key to issue
+            changed: Keys of issues that changed in the latest poll
+        """
+        highlight = args.output == "table" and sys.stdout.isatty()
+        models = []
+        for key, issue in view.items():
+            row = self.issue_row(issue)
+            if highlight and key in changed:
+                row = {column: BOLD.format(value) for column, value in row.items()}
+            models.append(cac.model.Model(row))
+
+        if sys.stdout.isatty():
+            print(CLEAR_SCREEN, end="")
+        printer = cac.output.Output(args)
+        printer.print_models(models)
+        print(
+            f"Watching every {args.watch}s, {len(changed)} changed (Ctrl-C to stop)",
+            flush=True,
+        )
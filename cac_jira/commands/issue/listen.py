@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+# pylint: disable=line-too-long
+
+"""
+Command module for receiving Jira webhooks into the local issue mirror.
+
+Runs a small HTTP endpoint that accepts Jira webhook payloads (issue created,
+updated or deleted, comment added, edited or deleted) and applies them to the
+local search index, so reads stay fresh without polling search_issues().
+Cached copies of the affected issues (and of project metadata, on project
+events) are dropped as events arrive. Recorded payloads can be replayed from a
+file with --replay to exercise the same code path offline.
+
+With --secret (the secret set on the Jira webhook), a payload is applied only
+if its X-Hub-Signature HMAC checks out; anything else gets a 401.
+
+Example usage:
+    jira issue listen --port 8765
+    jira issue listen --host 0.0.0.0 --secret "$JIRA_WEBHOOK_SECRET"
+    jira issue listen --replay webhooks.jsonl
+"""
+
+import hashlib
+import hmac
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from cac_jira.commands.issue import JiraIssueCommand
+from cac_jira.core.index import IssueIndex
+
+# X-Hub-Signature methods Jira signs webhooks with
+SIGNATURE_METHODS = {"sha256": hashlib.sha256, "sha1": hashlib.sha1}
+
+
+class IssueListen(JiraIssueCommand):
+    """
+    Command class for applying Jira webhook events to the local issue mirror.
+    """
+
+    def define_arguments(self, parser):
+        """
+        Define command-specific arguments.
+
+        Args:
+            parser: The argument parser to add arguments to
+        """
+        super().define_arguments(parser)
+        parser.add_argument(
+            "--host",
+            help="Address to listen on",
+            default="127.0.0.1",
+        )
+        parser.add_argument(
+            "--port",
+            help="Port to listen on",
+            type=int,
+            default=8765,
+        )
+        parser.add_argument(
+            "--secret",
+            help="Webhook secret; reject payloads without a matching X-Hub-Signature",
+            default=None,
+        )
+        parser.add_argument(
+            "--replay",
+            help="Apply recorded webhook payloads from a JSON or JSON-lines file instead of listening",
+            default=None,
+        )
+        return parser
+
+    def apply_event(self, index, payload):
+        """
+        Apply a single webhook payload to the index.
+
+        Args:
+            index: The IssueIndex to update
+            payload: The decoded webhook JSON
+
+        Returns:
+            A short description of what was done
+        """
+        event = payload.get("webhookEvent", "")
+        if event.startswith("project_"):
+            project = payload.get("project") or {}
+            self.jira_client.invalidate_metadata(project.get("key"), project.get("id"))
+            return f"dropped cached metadata for {project.get('key') or 'projects'}"
+
+        raw_issue = payload.get("issue") or {}
+        key = raw_issue.get("key")
+        if not key:
+            return f"ignored {event or 'unknown event'}"
+
+        # Any event on an issue makes cached copies of it stale
+        self.jira_client.invalidate_issue(key, raw_issue.get("id"))
+
+        if event == "jira:issue_deleted":
+            index.delete(key)
+            return f"deleted {key}"
+
+        if event in ("jira:issue_created", "jira:issue_updated"):
+            issue = self.jira_client.issue_from_raw(raw_issue)
+            self.index_issue(index, issue)
+            return f"indexed {key}"
+
+        if event in ("comment_created", "comment_updated", "comment_deleted"):
+            comment = payload.get("comment") or {}
+            if "id" not in comment:
+                raise ValueError(f"{event} payload has no comment ID")
+            body = None if event == "comment_deleted" else comment.get("body", "")
+            if index.set_comment(key, comment["id"], body):
+                return f"{event.split('_')[1]} comment on {key}"
+            return f"ignored {event} for unmirrored {key}"
+
+        return f"ignored {event} for {key}"
+
+    def replay(self, index, path):
+        """
+        Apply recorded payloads from a file.
+
+        The file may hold a single payload, a JSON array of payloads, or one
+        payload per line.
+
+        Args:
+            index: The IssueIndex to update
+            path: Path to the recorded payloads
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        try:
+            payloads = json.loads(text)
+        except json.JSONDecodeError:
+            payloads = [json.loads(line) for line in text.splitlines() if line.strip()]
+        if isinstance(payloads, dict):
+            payloads = [payloads]
+
+        for payload in payloads:
+            self.log.info("%s", self.apply_event(index, payload))
+
+    @staticmethod
+    def signature_valid(secret, body, signature):
+        """
+        Check a webhook's X-Hub-Signature against the shared secret.
+
+        Args:
+            secret: The webhook secret
+            body: The raw request body
+            signature: The header value, e.g. "sha256=<hex digest>"
+
+        Returns:
+            True if the signature is the body's HMAC under the secret
+        """
+        method, _, digest = (signature or "").partition("=")
+        digestmod = SIGNATURE_METHODS.get(method.lower())
+        if digestmod is None or not digest:
+            return False
+        expected = hmac.new(secret.encode(), body, digestmod).hexdigest()
+        return hmac.compare_digest(expected, digest.lower())
+
+    def make_server(self, index, host, port, secret=None):
+        """
+        Build the HTTP server that feeds webhook payloads to apply_event().
+
+        Args:
+            index: The IssueIndex to update
+            host: Address to listen on
+            port: Port to listen on (0 picks a free port)
+            secret: Optional webhook secret; unsigned or mis-signed payloads
+                are rejected with a 401
+
+        Returns:
+            The (not yet serving) HTTP server
+        """
+        command = self
+
+        class WebhookHandler(BaseHTTPRequestHandler):
+            """
+            Accepts POSTed webhook payloads.
+            """
+
+            def do_POST(self):  # pylint: disable=invalid-name
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length)
+                if secret and not command.signature_valid(
+                    secret, body, self.headers.get("X-Hub-Signature")
+                ):
+                    command.log.error("Rejected webhook with a bad signature")
+                    self.send_response(401)
+                    self.end_headers()
+                    return
+                try:
+                    payload = json.loads(body)
+                    if not isinstance(payload, dict):
+                        raise ValueError("payload is not a JSON object")
+                    command.log.info("%s", command.apply_event(index, payload))
+                except ValueError as e:
+                    # Covers undecodable JSON too; resending won't help
+                    command.log.error("Rejected webhook payload: %s", e)
+                    status = 400
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    # A 5xx tells Jira to retry the delivery later
+                    command.log.error("Failed to apply webhook: %s", e)
+                    status = 500
+                else:
+                    status = 204
+                self.send_response(status)
+                self.end_headers()
+
+            def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+                command.log.debug("webhook: " + format, *args)
+
+        return ThreadingHTTPServer((host, port), WebhookHandler)
+
+    def execute(self, args):
+        """
+        Execute the command with the provided arguments.
+
+        Args:
+            args: The parsed arguments
+        """
+        index = IssueIndex()
+        try:
+            if args.replay:
+                self.replay(index, args.replay)
+                return
+
+            server = self.make_server(
+                index, args.host, args.port, getattr(args, "secret", None)
+            )
+            self.log.info(
+                "Listening for Jira webhooks on http://%s:%d/", args.host, args.port
+            )
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                server.server_close()
+        finally:
+            index.close()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# pylint: disable=line-too-long
+
+"""
+Command module for full-text searching a local mirror of Jira issues.
+
+Issues are synced into a local SQLite FTS5 index (see cac_jira.core.index) and
+searched there, so repeated fuzzy lookups never touch Jira's search API. Each
+sync only fetches issues updated since the previous one.
+
+Example usage:
+    jira issue search "login timeout"
+    jira issue search --sync "login timeout" --prefix PROJ-1
+"""
+
+import cac_core as cac
+
+from cac_jira.commands.issue import JiraIssueCommand
+from cac_jira.core.client import SEARCH_FIELDS, jql_datetime, parse_datetime
+from cac_jira.core.index import IssueIndex
+
+# Fields needed to both display and index an issue
+SYNC_FIELDS = SEARCH_FIELDS + ["description", "comment", "updated"]
+
+
+class IssueSearch(JiraIssueCommand):
+    """
+    Command class for searching the local issue mirror.
+    """
+
+    def define_arguments(self, parser):
+        """
+        Define command-specific arguments.
+
+        Args:
+            parser: The argument parser to add arguments to
+        """
+        super().define_arguments(parser)
+        parser.add_argument(
+            "text",
+            nargs="?",
+            default=None,
+            help="Text to search summaries, descriptions and comments for",
+        )
+        parser.add_argument(
+            "--sync",
+            action="store_true",
+            default=False,
+            help="Pull issues updated since the last sync before searching",
+        )
+        parser.add_argument(
+            "--prefix",
+            action="append",
+            default=None,
+            help="Only return issues whose key starts with this prefix (repeatable)",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=20,
+            help="Maximum number of results",
+        )
+        return parser
+
+    def sync(self, index, project):
+        """
+        Bring the mirror of a project up to date.
+
+        Only issues updated since the last recorded watermark are fetched.
+
+        Args:
+            index: The IssueIndex to update
+            project: The project key
+
+        Returns:
+            The number of issues synced
+        """
+        watermark = index.last_synced(project)
+        jql = f"project = {project}"
+        if watermark:
+            jql += f' AND updated >= "{jql_datetime(watermark)}"'
+        jql += " ORDER BY updated ASC"
+        self.log.debug("Sync JQL: %s", jql)
+
+        count = 0
+        newest = watermark
+        for issue in self.jira_client.search_issues(jql, fields=SYNC_FIELDS):
+            self.index_issue(index, issue)
+            count += 1
+            updated = parse_datetime(issue.fields.updated)
+            if newest is None or updated > parse_datetime(newest):
+                newest = issue.fields.updated
+
+        if newest:
+            index.mark_synced(project, newest)
+        self.log.debug("Synced %d issues for %s", count, project)
+        return count
+
+    def execute(self, args):
+        """
+        Execute the command with the provided arguments.
+
+        Args:
+            args: The parsed arguments
+        """
+        index = IssueIndex()
+        try:
+            if args.project and (args.sync or not index.last_synced(args.project)):
+                synced = self.sync(index, args.project)
+                self.log.info("Synced %d issues from %s", synced, args.project)
+
+            if not args.text:
+                return
+
+            rows = index.search(args.text, prefixes=args.prefix, limit=args.limit)
+        finally:
+            index.close()
+
+        models = [cac.model.Model(row) for row in rows]
+        printer = cac.output.Output(args)
+        printer.print_models(models)
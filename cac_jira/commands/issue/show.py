@@ -3,14 +3,38 @@
 
 """
 Command module for showing Jira issues.
+
+Several issues can be shown at once, either by repeating --issue or by piping
+keys on stdin; they are fetched concurrently and printed as one table (or one
+JSON array).
+
+Only the fields the table shows are requested by default; --fields and
+--expand control exactly what is fetched (and so what --output json prints).
+
+--comments and --changelog page through the issue's comments and history,
+newest first, printing each entry as it arrives (with --output json they are
+nested in each issue's document as "comments" and "changelog" arrays instead);
+--since stops paging at the first entry older than the given time, so
+long-lived tickets stay cheap.
+
+Example usage:
+    jira issue show -i PROJ-1
+    jira issue show -i PROJ-1 -i PROJ-2,PROJ-3
+    git log --format=%s | grep -o 'PROJ-[0-9]*' | jira issue show --output json
+    jira issue show -i PROJ-1 --output json --fields summary,labels --expand changelog
+    jira issue show -i PROJ-1 --comments --changelog --since 2024-06-01
 """
 
 import json
+from datetime import datetime
 
 import cac_core as cac
 
 from cac_jira.commands.issue import JiraIssueCommand
 
+# Fields needed for the table view
+TABLE_FIELDS = "summary,status,issuetype,priority"
+
 
 class IssueShow(JiraIssueCommand):
     """
@@ -28,31 +52,204 @@ class IssueShow(JiraIssueCommand):
         parser.add_argument(
             "-i",
             "--issue",
-            help="Issue to match",
+            help="Issue to show (repeatable; use - or pipe keys to read them from stdin)",
+            action="append",
+            default=None,
+        )
+        parser.add_argument(
+            "--fields",
+            help="Comma-separated fields to fetch, on top of those the table shows (default for --output json: all)",
+            default=None,
+        )
+        parser.add_argument(
+            "--expand",
+            help="Comma-separated extra information to fetch (e.g. renderedFields,changelog)",
+            default=None,
+        )
+        parser.add_argument(
+            "--comments",
+            help="Also stream the issue's comments, newest first",
+            action="store_true",
+            default=False,
+        )
+        parser.add_argument(
+            "--changelog",
+            help="Also stream the issue's change history, newest first",
+            action="store_true",
+            default=False,
+        )
+        parser.add_argument(
+            "--since",
+            help="Only show comments/changes at or after this ISO date or datetime (local time if no offset)",
             default=None,
-            required=True,
         )
         return parser
 
+    @staticmethod
+    def parse_since(value):
+        """
+        Parse a --since value into an aware datetime.
+
+        Args:
+            value: An ISO 8601 date or datetime string
+
+        Returns:
+            The aware datetime, or None if no value was given
+        """
+        if not value:
+            return None
+        since = datetime.fromisoformat(value)
+        return since if since.tzinfo else since.astimezone()
+
+    @staticmethod
+    def comment_line(comment):
+        """
+        Format a comment as a single line of text.
+
+        Args:
+            comment: A raw comment dict
+
+        Returns:
+            The formatted line
+        """
+        author = (comment.get("author") or {}).get("displayName", "Unknown")
+        body = " ".join(str(comment.get("body", "")).split())
+        return f"{comment['created']}  {author}: {body}"
+
+    @staticmethod
+    def changelog_line(history):
+        """
+        Format a changelog entry as a single line of text.
+
+        Args:
+            history: A raw changelog history dict
+
+        Returns:
+            The formatted line
+        """
+        author = (history.get("author") or {}).get("displayName", "Unknown")
+        changes = "; ".join(
+            f"{item['field']}: {item.get('fromString') or ''} -> {item.get('toString') or ''}"
+            for item in history.get("items", [])
+        )
+        return f"{history['created']}  {author}: {changes}"
+
+    def history_streams(self, args):
+        """
+        Get the comment and changelog streams requested by the arguments.
+
+        Args:
+            args: The parsed arguments
+
+        Returns:
+            A list of (name, fetch function, line formatter) tuples
+        """
+        streams = []
+        if getattr(args, "comments", False):
+            streams.append(
+                ("comments", self.jira_client.iter_comments, self.comment_line)
+            )
+        if getattr(args, "changelog", False):
+            streams.append(
+                ("changelog", self.jira_client.iter_changelog, self.changelog_line)
+            )
+        return streams
+
+    def stream_history(self, key, args, since):
+        """
+        Print the requested comments and changelog for an issue as they are fetched.
+
+        Args:
+            key: The issue key
+            args: The parsed arguments
+            since: Optional aware datetime cutoff
+        """
+        for name, fetch, line in self.history_streams(args):
+            print(f"\n{name.capitalize()} for {key}:")
+            for entry in fetch(key, since=since):
+                print(f"  {line(entry)}", flush=True)
+
+    def issue_document(self, issue, args, since):
+        """
+        Build the JSON document for an issue, with any requested history nested in it.
+
+        Args:
+            issue: The issue
+            args: The parsed arguments
+            since: Optional aware datetime cutoff
+
+        Returns:
+            The issue's raw JSON, plus "comments"/"changelog" arrays if requested
+        """
+        document = dict(issue.raw)
+        for name, fetch, _ in self.history_streams(args):
+            document[name] = list(fetch(issue.key, since=since))
+        return document
+
+    def fetch(self, keys, fields=None, expand=None):
+        """
+        Fetch the issues to show.
+
+        Args:
+            keys: The issue keys
+            fields: Comma-separated fields to fetch (default: all)
+            expand: Comma-separated extra information to include
+
+        Returns:
+            The issues found, in the order requested
+        """
+        if len(keys) == 1:
+            return [self.jira_client.issue(keys[0], fields=fields, expand=expand)]
+
+        issues, missing = self.jira_client.issues_by_keys(
+            keys, fields=(fields or "*all").split(","), expand=expand
+        )
+        for key in missing:
+            self.log.error("Issue %s not found", key)
+        return issues
+
     def execute(self, args):
-        self.log.debug("Showing Jira issue %s", args.issue)
-        issue = self.jira_client.issue(args.issue)
+        keys = self.issue_keys(args)
+        if not keys:
+            self.log.error("No issues given; pass --issue or pipe keys on stdin")
+            return 1
+        try:
+            since = self.parse_since(getattr(args, "since", None))
+        except ValueError:
+            self.log.error("Invalid --since value: %s", args.since)
+            return 1
+
+        self.log.debug("Showing Jira issues %s", ", ".join(keys))
+        fields = getattr(args, "fields", None)
+        if args.output != "json":
+            # The table always needs its own columns, whatever else is asked for
+            requested = [f.strip() for f in (fields or "").split(",") if f.strip()]
+            fields = ",".join(dict.fromkeys(TABLE_FIELDS.split(",") + requested))
+        issues = self.fetch(keys, fields, getattr(args, "expand", None))
         if args.output == "json":
-            # skip the model JSON output and just print the raw issue
-            print(json.dumps(issue.raw, indent=4))
-            return
+            # skip the model JSON output and just print the raw issue(s)
+            raw = [self.issue_document(issue, args, since) for issue in issues]
+            print(json.dumps(raw[0] if len(keys) == 1 else raw, indent=4))
         else:
             models = []
-            model = cac.model.Model(
-                {
-                    "ID": issue.id,
-                    "Key": issue.key,
-                    "Summary": issue.fields.summary,
-                    "Status": issue.fields.status.name,
-                    "Type": issue.fields.issuetype.name,
-                    "Priority": issue.fields.priority.name,
-                }
-            )
-            models.append(model)
+            for issue in issues:
+                model = cac.model.Model(
+                    {
+                        "ID": issue.id,
+                        "Key": issue.key,
+                        "Summary": issue.fields.summary,
+                        "Status": issue.fields.status.name,
+                        "Type": issue.fields.issuetype.name,
+                        "Priority": (
+                            issue.fields.priority.name
+                            if issue.fields.priority
+                            else "None"
+                        ),
+                    }
+                )
+                models.append(model)
             printer = cac.output.Output(args)
             printer.print_models(models)
+
+            for issue in issues:
+                self.stream_history(issue.key, args, since)
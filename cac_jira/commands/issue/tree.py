@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+
+"""
+Command module for showing an issue's hierarchy.
+
+The tree below an issue (epic -> stories -> subtasks, or however deep the
+hierarchy goes) is fetched a level at a time: each level is one batch of
+concurrent `parent in (...)` searches for all of the previous level's keys,
+fetching only the fields shown. An epic with hundreds of descendants takes a
+few requests rather than one per issue.
+
+Each issue with children is shown with a count of its descendants' statuses.
+
+Example usage:
+    jira issue tree PROJ-1
+    jira issue tree PROJ-1 --depth 1
+    jira issue tree PROJ-1 --output json
+"""
+
+import json
+from collections import Counter
+
+from cac_jira.commands.issue import JiraIssueCommand
+
+# The only fields the tree shows (parent links each issue to its node)
+TREE_FIELDS = ["summary", "status", "issuetype", "parent"]
+
+
+def key_order(key):
+    """
+    Sort key for issue keys, so PROJ-9 comes before PROJ-10.
+
+    Args:
+        key: The issue key
+
+    Returns:
+        A (project, number) tuple
+    """
+    project, _, number = key.rpartition("-")
+    return (project, int(number) if number.isdigit() else 0)
+
+
+class IssueTree(JiraIssueCommand):
+    """
+    Command class for showing the hierarchy below a Jira issue.
+    """
+
+    def define_arguments(self, parser):
+        """
+        Define command-specific arguments.
+
+        Args:
+            parser: The argument parser to add arguments to
+        """
+        super().define_arguments(parser)
+        parser.add_argument("root", help="The issue at the top of the tree")
+        parser.add_argument(
+            "--depth",
+            type=int,
+            default=0,
+            help="How many levels below the root to fetch (default: all)",
+        )
+        return parser
+
+    @staticmethod
+    def node(issue):
+        """
+        Build a tree node for an issue.
+
+        Args:
+            issue: The Jira issue object, fetched with TREE_FIELDS
+
+        Returns:
+            A dict with the issue's key, type, status, summary and children
+        """
+        return {
+            "key": issue.key,
+            "type": issue.fields.issuetype.name,
+            "status": issue.fields.status.name,
+            "summary": issue.fields.summary,
+            "children": [],
+        }
+
+    def build_tree(self, root, depth=0):
+        """
+        Fetch the hierarchy below an issue, a level at a time.
+
+        Args:
+            root: The root issue
+            depth: How many levels to fetch (0 for all)
+
+        Returns:
+            The root node, with children nested and ordered by key
+        """
+        nodes = {root.key: self.node(root)}
+        level = [root.key]
+        levels = 0
+        while level and (not depth or levels < depth):
+            self.log.debug("Fetching children of %d issues", len(level))
+            next_level = []
+            for child in self.jira_client.issues_by_parents(level, TREE_FIELDS):
+                # A key seen before means a moved issue or a cycle; skip it
+                if child.key in nodes:
+                    continue
+                nodes[child.key] = self.node(child)
+                nodes[child.fields.parent.key]["children"].append(nodes[child.key])
+                next_level.append(child.key)
+            level = next_level
+            levels += 1
+
+        for node in nodes.values():
+            node["children"].sort(key=lambda n: key_order(n["key"]))
+        self.roll_up(nodes[root.key])
+        return nodes[root.key]
+
+    def roll_up(self, node):
+        """
+        Count the statuses of each node's descendants.
+
+        Args:
+            node: The node to roll up; its "rollup" (and its descendants')
+                is set to a dict of status name -> count
+
+        Returns:
+            A Counter of the statuses of node and its descendants
+        """
+        counts = Counter()
+        for child in node["children"]:
+            counts += self.roll_up(child)
+        node["rollup"] = dict(counts)
+        return counts + Counter([node["status"]])
+
+    def print_tree(self, node, indent=0):
+        """
+        Print a tree as indented lines.
+
+        Args:
+            node: The node to print, with its descendants
+            indent: The node's depth
+        """
+        line = "  " * indent + (
+            f"{node['key']} {node['type']} [{node['status']}] {node['summary']}"
+        )
+        if node["rollup"]:
+            counts = ", ".join(f"{s}: {n}" for s, n in sorted(node["rollup"].items()))
+            line += f" ({counts})"
+        print(line)
+        for child in node["children"]:
+            self.print_tree(child, indent + 1)
+
+    def execute(self, args):
+        """
+        Execute the command with the provided arguments.
+
+        Args:
+            args: The parsed arguments
+        """
+        root = self.jira_client.issue(args.root.upper(), fields=",".join(TREE_FIELDS))
+        if not root:
+            self.log.error("Issue not found")
+            return 1
+        tree = self.build_tree(root, getattr(args, "depth", 0))
+        if args.output == "json":
+            print(json.dumps(tree, indent=4))
+        else:
+            self.print_tree(tree)
+        return None
@@ -5,22 +5,34 @@
 Command module for updating Jira issues.
 
 This module provides functionality to update existing issues in Jira,
-allowing modification of the title (summary) and description fields.
-It leverages the JiraIssueCommand base class to handle Jira connectivity
-and authentication.
+allowing modification of the title (summary), description and any other
+field. It leverages the JiraIssueCommand base class to handle Jira
+connectivity and authentication.
 
 Key features:
 - Update issue titles/summaries
 - Update issue descriptions
-- Support for updating both fields simultaneously
+- Update any field by name or ID with --field
+- Support for updating several fields simultaneously
+- Update many issues at once with --jql, through Jira Cloud's bulk edit API
+  where the fields allow it
+- Only fields whose values actually change are sent, so re-running an update
+  costs a read and no writes; --no-notify keeps watchers from being emailed
 
 Example usage:
     jira issue update --issue PROJECT-123 --title "New title"
     jira issue update --issue PROJECT-123 --description "New description"
     jira issue update --issue PROJECT-123 --title "New title" --description "New description"
+    jira issue update --issue PROJECT-123 --field "Story Points" 3
+    jira issue update --jql "sprint = 42" --field "Story Points" 0
+    jira issue update --issue PROJECT-123 --field Team Core --no-notify
 """
 
+from jira.exceptions import JIRAError
+
 from cac_jira.commands.issue import JiraIssueCommand
+from cac_jira.core.bulk import BulkResult, run_bulk
+from cac_jira.core.fields import same_value
 
 
 class IssueUpdate(JiraIssueCommand):
@@ -40,9 +52,15 @@ class IssueUpdate(JiraIssueCommand):
         parser.add_argument(
             "-i",
             "--issue",
-            help="Issue to match",
+            help="Issue to update (repeatable; comma-separated lists and keys "
+            "piped on stdin also work)",
+            action="append",
+            default=None,
+        )
+        parser.add_argument(
+            "--jql",
+            help="Update every issue matching this JQL query",
             default=None,
-            required=True,
         )
         parser.add_argument(
             "-t",
@@ -56,8 +74,128 @@ class IssueUpdate(JiraIssueCommand):
             help="New issue description",
             default=None,
         )
+        parser.add_argument(
+            "--field",
+            action="append",
+            nargs=2,
+            metavar=("FIELD", "VALUE"),
+            help="Set a field, by name or ID (repeatable): --field 'Story Points' 3",
+            dest="custom_fields",
+        )
+        parser.add_argument(
+            "--no-notify",
+            action="store_true",
+            default=False,
+            help="Don't email watchers about the change (needs admin permission)",
+        )
         return parser
 
+    def requested_fields(self, args):
+        """
+        Collect the field values to set from the arguments.
+
+        Args:
+            args: The parsed arguments
+
+        Returns:
+            A dict of field ID -> value, or None if a --field isn't known
+        """
+        fields = {}
+        if args.title:
+            fields["summary"] = args.title
+        if args.description:
+            fields["description"] = args.description
+        custom_fields = getattr(args, "custom_fields", None)
+        if custom_fields:
+            catalog = self.jira_client.field_catalog()
+            for name_or_id, value in custom_fields:
+                field_id = catalog.resolve(name_or_id)
+                if field_id is None:
+                    self.log.error("Unknown field '%s'", name_or_id)
+                    return None
+                fields[field_id] = catalog.coerce(field_id, value)
+        return fields
+
+    @staticmethod
+    def changed_fields(issue, fields):
+        """
+        Pick out the fields whose values differ from the issue's.
+
+        Args:
+            issue: The issue, fetched with at least the fields being set
+            fields: Dict of field ID -> value to set
+
+        Returns:
+            A dict of the fields that would change
+        """
+        current = issue.raw.get("fields", {})
+        return {
+            field_id: value
+            for field_id, value in fields.items()
+            if not same_value(current.get(field_id), value)
+        }
+
+    def bulk_update(self, args, fields):
+        """
+        Set the same fields on many issues.
+
+        Issues that already hold the values are left alone. For the rest, one
+        bulk edit job is submitted when the server and the fields support it;
+        otherwise the issues are edited concurrently, one request each.
+
+        Args:
+            args: The parsed arguments
+            fields: Dict of field ID -> value
+
+        Returns:
+            1 if any issue failed or wasn't found, None otherwise
+        """
+        notify = not getattr(args, "no_notify", False)
+        targets, missing = self.target_issues(args, fields=list(fields))
+        issues, unchanged = [], []
+        for issue in targets:
+            if self.changed_fields(issue, fields):
+                issues.append(issue)
+            else:
+                unchanged.append(BulkResult(issue, True, None, None))
+        if unchanged:
+            self.log.info("%d issues already up to date", len(unchanged))
+        edited = self.jira_client.field_catalog().bulk_edit_input(fields)
+
+        if issues and edited is not None:
+            try:
+                outcomes = self.jira_client.bulk_edit(
+                    [issue.id for issue in issues], edited, notify=notify
+                )
+            except JIRAError as e:
+                if e.status_code not in (403, 404, 405):
+                    raise
+                self.log.info(
+                    "Bulk edit unavailable (HTTP %s); updating issues one at a time",
+                    e.status_code,
+                )
+            else:
+                self.jira_client.invalidate_issue(*(issue.key for issue in issues))
+                results = unchanged + [
+                    BulkResult(
+                        issue,
+                        not outcomes[str(issue.id)],
+                        "; ".join(map(str, outcomes[str(issue.id)])) or None,
+                        None,
+                    )
+                    for issue in issues
+                ]
+                return self.report_bulk(args, results, missing)
+
+        results = run_bulk(
+            lambda issue: self.jira_client.edit_issue(
+                issue.key, fields=self.changed_fields(issue, fields), notify=notify
+            ),
+            issues,
+            self.jira_client.max_workers,
+        )
+        return self.report_bulk(args, unchanged + results, missing)
+
     def execute(self, args):
         """
         Execute the command with the provided arguments.
@@ -65,19 +203,32 @@ class IssueUpdate(JiraIssueCommand):
         Args:
             args: The parsed arguments
         """
-        self.log.debug("Updating Jira issue %s", args.issue)
+        fields = self.requested_fields(args)
+        if fields is None:
+            return 1
+        if not fields:
+            self.log.error("Nothing to update; pass --title, --description or --field")
+            return 1
 
-        # Assign the issue to the user
-        issue = self.jira_client.issue(args.issue)
+        jql = getattr(args, "jql", None)
+        keys = [] if jql else self.issue_keys(args)
+        if not keys and not jql:
+            self.log.error("No issues given; pass --issue, --jql or pipe keys on stdin")
+            return 1
+        if len(keys) != 1:
+            return self.bulk_update(args, fields)
+
+        self.log.debug("Updating Jira issue %s", keys[0])
+        issue = self.jira_client.issue(keys[0], fields=",".join(fields))
         if not issue:
             self.log.error("Issue not found")
-            return
-        if args.title and args.description:
-            issue.update(summary=args.title, description=args.description)
-            self.log.info("Issue %s updated with new title and description", issue.key)
-        elif args.title:
-            issue.update(summary=args.title)
-            self.log.info("Issue %s updated with new title", issue.key)
-        elif args.description:
-            issue.update(description=args.description)
-            self.log.info("Issue %s updated with new description", issue.key)
+            return None
+        changed = self.changed_fields(issue, fields)
+        if not changed:
+            self.log.info("Issue %s already up to date", issue.key)
+            return None
+        self.jira_client.edit_issue(
+            issue.key, fields=changed, notify=not getattr(args, "no_notify", False)
+        )
+        self.log.info("Issue %s updated: %s", issue.key, ", ".join(changed))
+        return None
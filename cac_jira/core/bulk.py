@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+
+"""
+Bounded worker pool for applying one operation to many issues.
+
+Items are taken from an iterable (such as a streaming search) as workers free
+up, so work starts before the whole target set has been fetched. When Jira
+rate-limits a request (429, or 503 with Retry-After), every worker pauses for
+the time Jira asked for and the request is retried; other errors are recorded
+against the item and the run carries on.
+"""
+
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import cac_core as cac
+from jira.exceptions import JIRAError
+
+log = cac.logger.new(__name__)
+
+# Outcome of the operation for one item: ok is True when it succeeded, error
+# is the failure message otherwise, and value is what the operation returned
+BulkResult = namedtuple("BulkResult", ["item", "ok", "error", "value"])
+
+RETRYABLE_STATUS_CODES = (429, 503)
+
+
+def retry_after(error, attempt):
+    """
+    Work out how long to wait before retrying a failed request.
+
+    Args:
+        error: The exception raised by the request
+        attempt: How many times the request has been tried already
+
+    Returns:
+        Seconds to wait, or None if the error isn't worth retrying
+    """
+    if not isinstance(error, JIRAError):
+        return None
+    if error.status_code not in RETRYABLE_STATUS_CODES:
+        return None
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return float(2**attempt)
+
+
+class _Pause:
+    """
+    Shared "resume at" time that all workers wait for.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def extend(self, seconds):
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+    def wait(self):
+        with self._lock:
+            delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def run_bulk(fn, items, max_workers=8, max_retries=3):
+    """
+    Apply fn to every item with a bounded pool of workers.
+
+    Args:
+        fn: The operation, called with one item
+        items: An iterable of items, consumed lazily
+        max_workers: Maximum number of concurrent operations
+        max_retries: How many times a rate-limited operation is retried
+
+    Returns:
+        A list of BulkResult, in the order of items
+    """
+    pause = _Pause()
+
+    def call(item):
+        for attempt in range(max_retries + 1):
+            pause.wait()
+            try:
+                return BulkResult(item, True, None, fn(item))
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                delay = retry_after(e, attempt)
+                if delay is None or attempt == max_retries:
+                    return BulkResult(item, False, str(e), None)
+                log.debug("Rate limited; pausing %.1fs before retrying", delay)
+                pause.extend(delay)
+        return None  # unreachable; keeps pylint's inconsistent-return quiet
+
+    # Keep at most a couple of items per worker in flight so a long
+    # streaming search isn't drained into memory ahead of the workers
+    slots = threading.BoundedSemaphore(max(1, max_workers) * 2)
+    futures = []
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        for item in items:
+            slots.acquire()  # pylint: disable=consider-using-with
+            future = pool.submit(call, item)
+            future.add_done_callback(lambda _: slots.release())
+            futures.append(future)
+    return [future.result() for future in futures]
@@ -0,0 +1,333 @@
+#!/usr/bin/env python
+
+"""
+On-disk cache for Jira responses.
+
+Entries are raw JSON payloads stored in SQLite under a (kind, key) pair,
+alongside the validators (an `updated` timestamp and/or an ETag) needed to
+revalidate them cheaply instead of downloading them again. Metadata that
+can't be revalidated (projects, issue types, create metadata) instead expires
+after a per-kind TTL, and the least recently used entries are evicted once
+the cache outgrows its size limit.
+
+Reads don't write: access times, revalidations and hit counts are kept in
+memory and written in one transaction with the next store, or when the cache
+is closed (at the latest, at exit).
+"""
+
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import cac_core as cac
+
+log = cac.logger.new(__name__)
+
+DEFAULT_PATH = os.path.expanduser(os.path.join("~", ".cache", "cac_jira", "cache.db"))
+
+# Seconds each kind of entry stays fresh; kinds not listed never expire
+DEFAULT_TTLS = {
+    "project": 24 * 60 * 60,
+    "projects": 24 * 60 * 60,
+    "issue_types": 7 * 24 * 60 * 60,
+    "createmeta": 24 * 60 * 60,
+    "fields": 24 * 60 * 60,
+    "workflow": 7 * 24 * 60 * 60,
+    "users": 24 * 60 * 60,
+}
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class DiskCache:
+    """
+    SQLite-backed cache of raw Jira payloads.
+
+    The database is only opened on first use, so creating a cache costs
+    nothing for commands that never touch it.
+    """
+
+    def __init__(self, path=DEFAULT_PATH, ttls=None, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Create the cache.
+
+        Args:
+            path: Path to the SQLite database file
+            ttls: Optional overrides of DEFAULT_TTLS, in seconds per kind
+            max_bytes: Total payload size above which old entries are evicted
+        """
+        self.path = path
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = None
+        # Pending writes, flushed by _flush(): (kind, key) -> accessed_at,
+        # (kind, key) -> revalidated stored_at, and kind -> [hits, misses]
+        self._accessed = {}
+        self._touched = {}
+        self._counts = {}
+
+    @property
+    def db(self):
+        """
+        The database connection, opened (and created if needed) on first use.
+        """
+        if self._conn is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    kind TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    validator TEXT,
+                    etag TEXT,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    size INTEGER NOT NULL,
+                    PRIMARY KEY (kind, key)
+                );
+                CREATE TABLE IF NOT EXISTS stats (
+                    kind TEXT PRIMARY KEY,
+                    hits INTEGER NOT NULL DEFAULT 0,
+                    misses INTEGER NOT NULL DEFAULT 0
+                );
+                """)
+            atexit.register(self.close)
+        return self._conn
+
+    def get(self, kind, key):
+        """
+        Look up an entry. Entries older than their kind's TTL count as missing.
+
+        Args:
+            kind: The kind of payload (e.g. "issue")
+            key: The entry key
+
+        Returns:
+            A dict with the value, validator, etag and stored_at, or None
+        """
+        with self._lock:
+            result = self.db.execute(
+                "SELECT value, validator, etag, stored_at FROM entries WHERE kind = ? AND key = ?",
+                (kind, key),
+            ).fetchone()
+            if result:
+                self._accessed[(kind, key)] = time.time()
+                stored_at = max(result[3], self._touched.get((kind, key), 0))
+                result = result[:3] + (stored_at,)
+        ttl = self.ttls.get(kind)
+        if result and ttl is not None and time.time() - result[3] > ttl:
+            log.debug("Cached %s %s expired", kind, key)
+            result = None
+        self.record(kind, hit=result is not None)
+        if not result:
+            return None
+        return {
+            "value": json.loads(result[0]),
+            "validator": result[1],
+            "etag": result[2],
+            "stored_at": result[3],
+        }
+
+    def put(self, kind, key, value, validator=None, etag=None):
+        """
+        Store an entry, replacing any existing one, then evict the least
+        recently used entries if the cache is over its size limit.
+
+        Values that can't be serialized to JSON are silently not cached.
+
+        Args:
+            kind: The kind of payload (e.g. "issue")
+            key: The entry key
+            value: The JSON-serializable payload
+            validator: Optional `updated` timestamp to revalidate against
+            etag: Optional ETag to revalidate against
+        """
+        try:
+            text = json.dumps(value)
+        except (TypeError, ValueError):
+            log.debug("Not caching unserializable %s %s", kind, key)
+            return
+        now = time.time()
+        with self._lock, self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(kind, key, value, validator, etag, stored_at, accessed_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (kind, key, text, validator, etag, now, now, len(text)),
+            )
+            self._touched.pop((kind, key), None)
+            # Eviction needs current access times, and this is a write anyway
+            self._flush()
+            self._evict()
+
+    def _evict(self):
+        """
+        Drop least recently used entries until the cache fits in max_bytes.
+
+        Must be called with the lock held, inside a transaction.
+        """
+        total = self.db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self.db.execute(
+            "SELECT kind, key, size FROM entries ORDER BY accessed_at ASC"
+        ).fetchall()
+        for kind, key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self.db.execute(
+                "DELETE FROM entries WHERE kind = ? AND key = ?", (kind, key)
+            )
+            total -= size
+            log.debug("Evicted cached %s %s", kind, key)
+
+    def touch(self, kind, key):
+        """
+        Mark an entry as freshly validated.
+
+        Args:
+            kind: The kind of payload
+            key: The entry key
+        """
+        with self._lock:
+            self._touched[(kind, key)] = time.time()
+
+    def record(self, kind, hit):
+        """
+        Count a lookup towards the hit rate reported by stats().
+
+        Args:
+            kind: The kind of payload looked up
+            hit: Whether the lookup was served from the cache
+        """
+        with self._lock:
+            counts = self._counts.setdefault(kind, [0, 0])
+            counts[0 if hit else 1] += 1
+
+    def _flush(self):
+        """
+        Write pending access times, revalidations and hit counts.
+
+        Must be called with the lock held, inside a transaction.
+        """
+        if self._accessed:
+            self.db.executemany(
+                "UPDATE entries SET accessed_at = MAX(accessed_at, ?) "
+                "WHERE kind = ? AND key = ?",
+                [(at, kind, key) for (kind, key), at in self._accessed.items()],
+            )
+        if self._touched:
+            self.db.executemany(
+                "UPDATE entries SET stored_at = MAX(stored_at, ?) "
+                "WHERE kind = ? AND key = ?",
+                [(at, kind, key) for (kind, key), at in self._touched.items()],
+            )
+        if self._counts:
+            self.db.executemany(
+                "INSERT INTO stats (kind, hits, misses) VALUES (?, ?, ?) "
+                "ON CONFLICT (kind) DO UPDATE SET "
+                "hits = hits + excluded.hits, misses = misses + excluded.misses",
+                [(kind, hits, misses) for kind, (hits, misses) in self._counts.items()],
+            )
+        self._accessed, self._touched, self._counts = {}, {}, {}
+
+    def stats(self):
+        """
+        Summarize the cache by kind.
+
+        Returns:
+            A list of dicts with each kind's entry count, total size, the
+            stored_at times of its oldest and newest entries, and its hit and
+            miss counts
+        """
+        with self._lock, self.db:
+            self._flush()
+            sizes = self.db.execute(
+                "SELECT kind, COUNT(*), SUM(size), MIN(stored_at), MAX(stored_at) "
+                "FROM entries GROUP BY kind"
+            ).fetchall()
+            counts = self.db.execute("SELECT kind, hits, misses FROM stats").fetchall()
+        summary = {
+            kind: {
+                "kind": kind,
+                "entries": 0,
+                "size": 0,
+                "oldest": None,
+                "newest": None,
+                "hits": 0,
+                "misses": 0,
+            }
+            for kind in [row[0] for row in sizes] + [row[0] for row in counts]
+        }
+        for kind, entries, size, oldest, newest in sizes:
+            summary[kind].update(
+                entries=entries, size=size, oldest=oldest, newest=newest
+            )
+        for kind, hits, misses in counts:
+            summary[kind].update(hits=hits, misses=misses)
+        return [summary[kind] for kind in sorted(summary)]
+
+    def clear(self, kind=None):
+        """
+        Drop entries and their hit counts.
+
+        Args:
+            kind: Only clear this kind (default: everything)
+
+        Returns:
+            The number of entries dropped
+        """
+        dropped = self.invalidate(kind)
+        with self._lock, self.db:
+            if kind:
+                self.db.execute("DELETE FROM stats WHERE kind = ?", (kind,))
+                self._counts.pop(kind, None)
+            else:
+                self.db.execute("DELETE FROM stats")
+                self._counts = {}
+        return dropped
+
+    def invalidate(self, kind=None, prefix=None, key=None):
+        """
+        Drop entries.
+
+        Args:
+            kind: Only drop entries of this kind (default: every kind)
+            prefix: Only drop entries whose key starts with this prefix
+            key: Only drop the entry with exactly this key
+
+        Returns:
+            The number of entries dropped
+        """
+        sql = "DELETE FROM entries WHERE 1 = 1"
+        params = []
+        if kind:
+            sql += " AND kind = ?"
+            params.append(kind)
+        if prefix:
+            sql += " AND substr(key, 1, ?) = ?"
+            params.extend([len(prefix), prefix])
+        if key:
+            sql += " AND key = ?"
+            params.append(key)
+        with self._lock, self.db:
+            cursor = self.db.execute(sql, params)
+        return cursor.rowcount
+
+    def close(self):
+        """
+        Write pending updates and close the underlying database, if it was opened.
+        """
+        if self._conn is not None:
+            with self._lock, self._conn:
+                self._flush()
+            self._conn.close()
+            self._conn = None
@@ -5,12 +5,109 @@
 Jira client module.
 """
 
+import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
 import cac_core as cac
 import jira
 from jira.exceptions import JIRAError
+from requests.adapters import HTTPAdapter
+
+from cac_jira.core.bulk import retry_after
+from cac_jira.core.fields import FieldCatalog
+from cac_jira.core.workflow import WorkflowGraph
 
 log = cac.logger.new(__name__)
 
+JIRA_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+# Fields fetched by search_issues() unless the caller asks for others
+SEARCH_FIELDS = [
+    "key",
+    "summary",
+    "status",
+    "assignee",
+    "issuetype",
+    "labels",
+    "resolutiondate",
+]
+
+# Limits for `field in (...)` searches; long JQL is sent as a query string
+MAX_VALUES_PER_QUERY = 100
+MAX_JQL_LENGTH = 2000
+
+# Most issues Jira accepts in one bulk create request
+MAX_BULK_CREATE = 50
+
+# Largest number of issues the agile API moves into an epic per request
+MAX_EPIC_ISSUES = 50
+
+# Largest number of issues one bulk edit job accepts, and how long to wait
+# for a job to finish
+MAX_BULK_EDIT = 1000
+BULK_EDIT_TIMEOUT = 600
+
+ISSUE_KEY_PATTERN = re.compile(r"^[A-Z][A-Z0-9_]*-\d+$")
+
+
+def parse_datetime(timestamp):
+    """
+    Parse a timestamp as returned by Jira (e.g. an issue's `updated`).
+
+    Args:
+        timestamp: The timestamp string
+
+    Returns:
+        A timezone-aware datetime
+    """
+    return datetime.strptime(timestamp, JIRA_DATETIME_FORMAT)
+
+
+def jql_datetime(timestamp):
+    """
+    Convert a Jira timestamp into the minute-precision form JQL accepts.
+
+    Args:
+        timestamp: A timestamp as returned by Jira (e.g. an issue's `updated`)
+
+    Returns:
+        The timestamp formatted as "YYYY-MM-DD HH:MM"
+    """
+    return parse_datetime(timestamp).strftime("%Y-%m-%d %H:%M")
+
+
+def chunk_values(field, values):
+    """
+    Split values into batches whose `field in (...)` JQL stays within limits.
+
+    Args:
+        field: The JQL field the values will be matched against
+        values: The values to match
+
+    Returns:
+        A list of lists of values
+    """
+    chunks = []
+    chunk = []
+    length = len(field) + len(" in ()")
+    for value in values:
+        added = len(value) + (2 if chunk else 0)
+        if chunk and (
+            len(chunk) >= MAX_VALUES_PER_QUERY or length + added > MAX_JQL_LENGTH
+        ):
+            chunks.append(chunk)
+            chunk = []
+            length = len(field) + len(" in ()")
+            added = len(value)
+        chunk.append(value)
+        length += added
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
 
 class JiraAuthenticationError(Exception):
     pass
@@ -21,7 +118,7 @@ class JiraClient:
     Jira client class.
     """
 
-    def __init__(self, server, username, api_token=None):
+    def __init__(self, server, username, api_token=None, max_workers=8, cache=None):
         """
         Initialize the Jira client.
 
@@ -29,10 +126,16 @@ class JiraClient:
             server: The Jira server
             username: The Jira username
             api_token: The Jira API token
+            max_workers: Maximum number of concurrent requests
+            cache: Optional DiskCache for revalidating repeated fetches
         """
         self.server = server
         self.username = username
         self.api_token = api_token
+        self.max_workers = max_workers
+        self.cache = cache
+        self._field_catalog = None
+        self._myself = None
         self.client = None
         self.connect()
 
@@ -46,7 +149,14 @@ class JiraClient:
                 f"https://{self.server}",
                 basic_auth=(self.username, self.api_token),
             )
-            self.client.myself()
+            # Size the connection pool for concurrent requests so they reuse
+            # connections instead of opening and discarding extra ones
+            adapter = HTTPAdapter(
+                pool_connections=self.max_workers, pool_maxsize=self.max_workers
+            )
+            self.client._session.mount("https://", adapter)
+            # Verifies the credentials, and is kept so current_user() is free
+            self._myself = self.client.myself()
         except JIRAError as e:
             response = getattr(e, "response", None)
             login_reason = (
@@ -66,17 +176,183 @@ class JiraClient:
             raise
 
     # Pass through methods to the Jira client
-    def issue(self, issue_id):
+    def issue(self, issue_id, fields=None, expand=None):
         """
         Get an issue.
 
+        With a cache, a stored copy is revalidated rather than downloaded
+        again: by ETag when Jira sent one, otherwise with a probe for just the
+        `updated` field. An unchanged issue costs one small request.
+
         Args:
             issue_id: The issue ID
+            fields: Comma-separated fields to fetch (default: all)
+            expand: Comma-separated extra information to include
 
         Returns:
             The issue
         """
-        return self.client.issue(issue_id)
+        if self.cache is None:
+            return self.client.issue(issue_id, fields=fields, expand=expand)
+
+        cache_key = f"{str(issue_id).upper()}|{fields or ''}|{expand or ''}"
+        params = {}
+        if fields:
+            # Always fetch `updated` so the stored copy can be revalidated
+            wanted = fields.split(",")
+            params["fields"] = (
+                fields
+                if "*all" in wanted or "updated" in wanted
+                else f"{fields},updated"
+            )
+        if expand:
+            params["expand"] = expand
+
+        entry = self.cache.get("issue", cache_key)
+        if entry and not entry["etag"]:
+            probe = None
+            if entry["validator"]:
+                probe, _ = self._get_issue_json(issue_id, {"fields": "updated"})
+            if probe and probe["fields"].get("updated") == entry["validator"]:
+                log.debug("Issue %s unchanged; using cached copy", issue_id)
+                self.cache.touch("issue", cache_key)
+                return self.issue_from_raw(entry["value"])
+            entry = None
+
+        raw, etag = self._get_issue_json(
+            issue_id, params, etag=entry["etag"] if entry else None
+        )
+        if raw is None:
+            log.debug("Issue %s not modified; using cached copy", issue_id)
+            self.cache.touch("issue", cache_key)
+            return self.issue_from_raw(entry["value"])
+
+        self.cache.put(
+            "issue",
+            cache_key,
+            raw,
+            validator=raw.get("fields", {}).get("updated"),
+            etag=etag,
+        )
+        return self.issue_from_raw(raw)
+
+    def _get_issue_json(self, issue_id, params, etag=None):
+        """
+        GET an issue's JSON, conditionally if an ETag is given.
+
+        Args:
+            issue_id: The issue ID or key
+            params: Query parameters (fields, expand)
+            etag: Optional ETag of the copy we already have
+
+        Returns:
+            A tuple of (issue JSON, or None if not modified; the response ETag)
+        """
+        headers = {"If-None-Match": etag} if etag else {}
+        response = self.client._session.get(
+            self.client._get_url(f"issue/{issue_id}"), params=params, headers=headers
+        )
+        if response.status_code == 304:
+            return None, etag
+        return response.json(), response.headers.get("ETag")
+
+    def invalidate_issue(self, *issue_ids):
+        """
+        Drop any cached copies of an issue.
+
+        Args:
+            *issue_ids: The issue's key and/or ID
+        """
+        if self.cache is None:
+            return
+        for issue_id in issue_ids:
+            if issue_id:
+                self.cache.invalidate("issue", prefix=f"{str(issue_id).upper()}|")
+
+    def issue_from_raw(self, raw):
+        """
+        Build an issue object from its raw JSON without fetching it.
+
+        Args:
+            raw: The issue JSON, as returned by the REST API or a webhook
+
+        Returns:
+            The issue
+        """
+        return jira.resources.Issue(self.client._options, self.client._session, raw=raw)
+
+    def iter_comments(self, issue_id, since=None, page_size=50):
+        """
+        Stream an issue's comments, newest first, one page at a time.
+
+        Args:
+            issue_id: The issue ID or key
+            since: Optional aware datetime; stop at the first older comment
+            page_size: Comments per request
+
+        Yields:
+            Raw comment dicts
+        """
+        start = 0
+        while True:
+            page = self.client._get_json(
+                f"issue/{issue_id}/comment",
+                params={
+                    "startAt": start,
+                    "maxResults": page_size,
+                    "orderBy": "-created",
+                },
+            )
+            comments = page.get("comments", [])
+            for comment in comments:
+                if since and parse_datetime(comment["created"]) < since:
+                    return
+                yield comment
+            start += len(comments)
+            if not comments or start >= page.get("total", 0):
+                return
+
+    def iter_changelog(self, issue_id, since=None, page_size=100):
+        """
+        Stream an issue's change history, newest first, one page at a time.
+
+        The changelog endpoint pages oldest first, so pages are requested from
+        the end backwards. Servers without the endpoint fall back to the
+        (truncated) changelog embedded in the issue.
+
+        Args:
+            issue_id: The issue ID or key
+            since: Optional aware datetime; stop at the first older entry
+            page_size: Entries per request
+
+        Yields:
+            Raw changelog history dicts
+        """
+        path = f"issue/{issue_id}/changelog"
+        try:
+            total = self.client._get_json(path, params={"maxResults": 1})["total"]
+        except JIRAError as e:
+            if e.status_code != 404:
+                raise
+            issue = self.client.issue(issue_id, fields="created", expand="changelog")
+            histories = issue.raw.get("changelog", {}).get("histories", [])
+            for history in sorted(histories, key=lambda h: h["created"], reverse=True):
+                if since and parse_datetime(history["created"]) < since:
+                    return
+                yield history
+            return
+
+        end = total
+        while end > 0:
+            start = max(0, end - page_size)
+            page = self.client._get_json(
+                path, params={"startAt": start, "maxResults": end - start}
+            )
+            for history in reversed(page.get("values", [])):
+                if since and parse_datetime(history["created"]) < since:
+                    return
+                yield history
+            end = start
 
     def transitions(self, issue):
         """
@@ -90,6 +366,34 @@ class JiraClient:
         """
         return self.client.transitions(issue)
 
+    def workflow(self, project_key, issuetype):
+        """
+        Get the cached workflow graph for an issue type in a project.
+
+        Args:
+            project_key: The project key
+            issuetype: The issue type name
+
+        Returns:
+            A WorkflowGraph (empty if nothing has been learned yet)
+        """
+        key = f"{project_key}|{issuetype}".upper()
+        entry = self.cache.get("workflow", key) if self.cache is not None else None
+        return WorkflowGraph(entry["value"] if entry else None)
+
+    def save_workflow(self, project_key, issuetype, graph):
+        """
+        Cache a workflow graph.
+
+        Args:
+            project_key: The project key
+            issuetype: The issue type name
+            graph: The WorkflowGraph
+        """
+        if self.cache is not None:
+            key = f"{project_key}|{issuetype}".upper()
+            self.cache.put("workflow", key, graph.to_json())
+
     def transition_issue(self, issue_id, transition_id, **kwargs):
         """
         Transition an issue.
@@ -112,20 +416,209 @@ class JiraClient:
         Returns:
             The created comment
         """
-        return self.client.add_comment(issue_id, comment)
+        comment = self.client.add_comment(issue_id, comment)
+        self.invalidate_issue(str(issue_id))
+        return comment
+
+    def assign_issue(self, issue_id, account_id):
+        """
+        Assign an issue to a user, without looking the user up again.
+
+        Args:
+            issue_id: The issue ID or key (or an issue object)
+            account_id: The account ID to assign to (see resolve_user()), or
+                None to unassign
+        """
+        self.client._session.put(
+            self.client._get_latest_url(f"issue/{issue_id}/assignee"),
+            data=json.dumps({"accountId": account_id}),
+        )
+        self.invalidate_issue(str(issue_id))
+
+    def resolve_user(self, query):
+        """
+        Find a user's account ID.
+
+        The query must match exactly one user's email address, display name
+        or account ID (case-insensitively); a user search only narrows down
+        the candidates. Since Jira Cloud usually hides email addresses, an
+        email search with a single result that shows none is accepted too. Resolved users are cached (kind "users"), so assigning
+        to the same person again doesn't search for them again.
+
+        Args:
+            query: "me", or a display name, email address or account ID
+
+        Returns:
+            The account ID
+
+        Raises:
+            JIRAError: If no user, or more than one, matches
+        """
+        if query.lower() == "me":
+            return self.current_user()
+
+        def find():
+            users = self.client.search_users(query=query)
+            matches = [
+                user
+                for user in users
+                if query.lower()
+                in (
+                    str(getattr(user, "accountId", None) or "").lower(),
+                    str(getattr(user, "emailAddress", None) or "").lower(),
+                    str(getattr(user, "displayName", None) or "").lower(),
+                )
+            ]
+            if not matches and "@" in query and len(users) == 1:
+                # Cloud usually hides email addresses in search results; a
+                # lone result for an email search is taken to be its owner
+                if not getattr(users[0], "emailAddress", None):
+                    matches = users
+            if len(matches) == 1:
+                return matches[0].accountId
+            candidates = ", ".join(
+                f"{getattr(user, 'displayName', '?')} ({user.accountId})"
+                for user in matches or users
+            )
+            if matches:
+                problem = f"{len(matches)} users match '{query}'"
+            else:
+                problem = f"No user matches '{query}' exactly"
+            raise JIRAError(
+                text=f"{problem}; candidates: {candidates}" if candidates else problem
+            )
+
+        # Only unique matches are returned, so only they are cached
+        return self._cached("users", query.lower(), find)
+
+    def edit_issue(self, issue_id, fields=None, update=None, notify=True):
+        """
+        Edit an issue in a single request, without fetching it first.
+
+        Args:
+            issue_id: The issue ID or key (or an issue object)
+            fields: Optional dict of field ID -> new value
+            update: Optional dict of field ID -> list of operations
+                (e.g. {"labels": [{"add": "x"}]}), applied to the current value
+            notify: Whether Jira emails watchers about the change (turning
+                this off needs admin or project admin permission)
+        """
+        body = {}
+        if fields:
+            body["fields"] = fields
+        if update:
+            body["update"] = update
+        self.client._session.put(
+            self.client._get_url(f"issue/{issue_id}"),
+            params=None if notify else {"notifyUsers": "false"},
+            data=json.dumps(body),
+        )
+        self.invalidate_issue(str(issue_id))
+
+    def bulk_edit(self, issue_ids, edited_fields, notify=True):
+        """
+        Set fields on many issues with Jira Cloud's asynchronous bulk edit API.
+
+        Issues are submitted in jobs of up to MAX_BULK_EDIT, and each job is
+        polled until it finishes.
+
+        Args:
+            issue_ids: The issue IDs
+            edited_fields: The editedFieldsInput dict, as built by
+                FieldCatalog.bulk_edit_input()
+            notify: Whether Jira sends its bulk change notification
+
+        Returns:
+            A dict of issue ID -> list of errors (empty if the edit succeeded);
+            IDs Jira didn't report on are treated as failed
+
+        Raises:
+            JIRAError: If the bulk edit API isn't available (e.g. on Server or
+                Data Center) or rejects the request
+        """
+        actions = [
+            edit["fieldId"] for edits in edited_fields.values() for edit in edits
+        ]
+        outcomes = {}
+        for n in range(0, len(issue_ids), MAX_BULK_EDIT):
+            batch = [str(issue_id) for issue_id in issue_ids[n : n + MAX_BULK_EDIT]]
+            response = self.client._session.post(
+                self._cloud_url("bulk/issues/fields"),
+                data=json.dumps(
+                    {
+                        "selectedIssueIdsOrKeys": batch,
+                        "selectedActions": actions,
+                        "editedFieldsInput": edited_fields,
+                        "sendBulkNotification": notify,
+                    }
+                ),
+            )
+            task = self._wait_bulk_task(response.json()["taskId"])
+            processed = {str(i) for i in task.get("processedAccessibleIssues", [])}
+            failed = task.get("failedAccessibleIssues", {})
+            for issue_id in batch:
+                if issue_id in failed:
+                    outcomes[issue_id] = failed[issue_id]
+                elif issue_id in processed:
+                    outcomes[issue_id] = []
+                else:
+                    outcomes[issue_id] = [f"Bulk edit {task.get('status')}"]
+        return outcomes
+
+    def _wait_bulk_task(self, task_id):
+        """
+        Poll a bulk operation until it stops running.
+
+        Args:
+            task_id: The task ID returned when the job was submitted
+
+        Returns:
+            The final task progress dict
+        """
+        deadline = time.monotonic() + BULK_EDIT_TIMEOUT
+        delay = 0.5
+        while True:
+            task = self.client._session.get(
+                self._cloud_url(f"bulk/queue/{task_id}")
+            ).json()
+            log.debug(
+                "Bulk task %s: %s (%s%%)",
+                task_id,
+                task.get("status"),
+                task.get("progressPercent", 0),
+            )
+            if task.get("status") not in ("ENQUEUED", "RUNNING"):
+                return task
+            if time.monotonic() > deadline:
+                log.error("Gave up waiting for bulk task %s", task_id)
+                return task
+            time.sleep(delay)
+            delay = min(delay * 2, 5)
 
-    def assign_issue(self, issue_id, username):
+    def _cloud_url(self, path):
         """
-        Assign an issue to a user.
+        Build a URL for an endpoint that only exists in the Cloud v3 API.
 
         Args:
-            issue: The issue to assign
-            username: The username to assign the issue to
+            path: The path under /rest/api/3/
 
         Returns:
-            The response from the assignment operation
+            The full URL
+        """
+        return f"{self.client._options['server']}/rest/api/3/{path}"
+
+    def update_labels(self, issue_id, add=None, remove=None):
         """
-        return self.client.assign_issue(issue_id, username)
+        Add and remove labels, leaving the issue's other labels alone.
+
+        Args:
+            issue_id: The issue ID or key (or an issue object)
+            add: The labels to add
+            remove: The labels to remove
+        """
+        operations = [{"add": label} for label in add or []]
+        operations += [{"remove": label} for label in remove or []]
+        self.edit_issue(issue_id, update={"labels": operations})
 
     def add_labels(self, issue_id, labels):
         """
@@ -133,13 +626,11 @@ class JiraClient:
 
         Args:
             issue_id: The issue
-            labels: The labels to add
+            labels: The labels to add, as a list or a comma-separated string
         """
-        issue = self.issue(issue_id)
-        if not issue:
-            log.error("Issue not found")
-            return
-        return issue.update(fields={"labels": labels.split(",")})
+        if isinstance(labels, str):
+            labels = [label.strip() for label in labels.split(",") if label.strip()]
+        self.update_labels(issue_id, add=labels)
 
     def create_issue(self, **kwargs):
         """
@@ -153,48 +644,242 @@ class JiraClient:
         """
         return self.client.create_issue(**kwargs)
 
-    def search_issues(self, jql):
+    def create_issues(self, field_list, prefetch=True, max_retries=3):
+        """
+        Create many issues through the bulk create endpoint.
+
+        Issues are sent in batches of MAX_BULK_CREATE, concurrently. Pass
+        projects and issue types as dicts (e.g. {"key": "PROJ"}); names make
+        the jira library look each one up first.
+
+        Creating isn't idempotent, so a batch is only re-sent when Jira turned
+        it away unprocessed (429 or 503). A batch that fails any other way
+        without Jira rejecting it (a dropped connection, a timeout, a 5xx) may
+        still have been created, and its rows are reported as "Unknown".
+
+        Args:
+            field_list: A list of field dicts, one per issue
+            prefetch: Fetch each created issue in full (otherwise issues are
+                built from the create response)
+            max_retries: How many times a rate-limited batch is re-sent
+
+        Returns:
+            A list with a dict per input row, in order: status ("Success",
+            "Error" or "Unknown"), error, issue (or None) and input_fields
+        """
+
+        def create(batch):
+            for attempt in range(max_retries + 1):
+                try:
+                    return self.client.create_issues(batch, prefetch=prefetch)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    delay = retry_after(e, attempt)
+                    if delay is not None and attempt < max_retries:
+                        log.debug("Rate limited; retrying batch in %.1fs", delay)
+                        time.sleep(delay)
+                        continue
+                    log.debug("Bulk create of %d issues failed: %s", len(batch), e)
+                    rejected = isinstance(e, JIRAError) and (
+                        delay is not None or 400 <= (e.status_code or 0) < 500
+                    )
+                    return [
+                        {
+                            "status": "Error" if rejected else "Unknown",
+                            "error": str(e),
+                            "issue": None,
+                            "input_fields": fields,
+                        }
+                        for fields in batch
+                    ]
+            return None  # unreachable; keeps pylint's inconsistent-return quiet
+
+        batches = [
+            field_list[n : n + MAX_BULK_CREATE]
+            for n in range(0, len(field_list), MAX_BULK_CREATE)
+        ]
+        return [
+            result
+            for results in self.concurrent_map(create, batches)
+            for result in results
+        ]
+
+    def search_issues(self, jql, fields=None, expand=None, max_results=False):
         """
         Search for issues.
 
         Args:
-            **kwargs: The search parameters
+            jql: The JQL query
+            fields: The fields to fetch (defaults to SEARCH_FIELDS)
+            expand: Comma-separated extra information to include
+            max_results: Cap on the number of issues, or False to page through
+                them all
 
         Returns:
             The list of issues
         """
-        max_results = False  # set to an int to cap the return count, or False to paginate them all
         issues = self.client.enhanced_search_issues(
             jql_str=jql,
             maxResults=max_results,
-            fields=[
-                "key",
-                "summary",
-                "status",
-                "assignee",
-                "issuetype",
-                "labels",
-                "resolutiondate",
-            ],
+            fields=list(fields or SEARCH_FIELDS),
+            expand=expand,
         )
 
         return issues
 
-    def delete_issue(self, issue_id):
+    def iter_search(self, jql, fields=None, expand=None, page_size=100):
         """
-        Delete an issue.
+        Stream the issues matching a search, a page at a time.
+
+        Unlike search_issues(), which collects every page before returning,
+        issues are yielded as each page arrives, so callers can start working
+        on the first page while later ones are still being fetched.
 
         Args:
-            issue_id: The issue ID
+            jql: The JQL query
+            fields: The fields to fetch (defaults to SEARCH_FIELDS)
+            expand: Comma-separated extra information to include
+            page_size: Issues per page
+
+        Yields:
+            The matching issues
+        """
+        token = None
+        while True:
+            page = self.client.enhanced_search_issues(
+                jql_str=jql,
+                nextPageToken=token,
+                maxResults=page_size,
+                fields=list(fields or SEARCH_FIELDS),
+                expand=expand,
+                json_result=True,
+            )
+            for raw in page.get("issues", []):
+                yield self.issue_from_raw(raw)
+            token = page.get("nextPageToken")
+            if not token or page.get("isLast", False):
+                return
+
+    def issues_by_keys(self, keys, fields=None, expand=None):
+        """
+        Fetch many issues by key in a handful of searches.
+
+        Keys are batched into `key in (...)` queries that run concurrently.
+        Keys Jira rejects as nonexistent are dropped from their batch and the
+        batch retried, so one bad key doesn't sink the rest. Issues that have
+        moved come back under their new key and so count as missing.
+
+        Args:
+            keys: The issue keys
+            fields: The fields to fetch (defaults to SEARCH_FIELDS)
+            expand: Comma-separated extra information to include
 
         Returns:
-            The response from the delete operation
+            A tuple of (issues in input order, list of keys not found)
         """
-        issue = self.issue(issue_id)
-        if not issue:
-            log.error("Issue not found")
-            return
-        return issue.delete()
+        wanted = list(dict.fromkeys(key.strip().upper() for key in keys))
+        valid = [key for key in wanted if ISSUE_KEY_PATTERN.match(key)]
+
+        def fetch(chunk):
+            while chunk:
+                try:
+                    return list(
+                        self.search_issues(
+                            f"key in ({', '.join(chunk)})", fields, expand
+                        )
+                    )
+                except JIRAError as e:
+                    bad = _rejected_keys(e, chunk)
+                    if e.status_code != 400 or not bad:
+                        raise
+                    chunk = [key for key in chunk if key not in bad]
+            return []
+
+        found = {}
+        for issues in self.concurrent_map(fetch, chunk_values("key", valid)):
+            for issue in issues:
+                found[issue.key] = issue
+
+        missing = [key for key in wanted if key not in found]
+        return [found[key] for key in wanted if key in found], missing
+
+    def issues_by_parents(self, parent_keys, fields=None):
+        """
+        Fetch the direct children of many issues in a handful of searches.
+
+        Parent keys are batched into `parent in (...)` queries that run
+        concurrently.
+
+        Args:
+            parent_keys: The parents' issue keys
+            fields: The fields to fetch (defaults to SEARCH_FIELDS)
+
+        Returns:
+            The child issues, in no particular order
+        """
+        return [
+            issue
+            for issues in self.concurrent_map(
+                lambda chunk: self.search_issues(
+                    f"parent in ({', '.join(chunk)})", fields
+                ),
+                chunk_values("parent", list(parent_keys)),
+            )
+            for issue in issues
+        ]
+
+    def concurrent_map(self, fn, items):
+        """
+        Apply a function to items concurrently, preserving order.
+
+        Args:
+            fn: The function to call for each item
+            items: The items
+
+        Returns:
+            A list of results in the same order as items
+        """
+        items = list(items)
+        if len(items) <= 1 or self.max_workers <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as pool:
+            return list(pool.map(fn, items))
+
+    def delete_issue(self, issue_id, delete_subtasks=False):
+        """
+        Delete an issue in a single request, without fetching it first.
+
+        Args:
+            issue_id: The issue ID or key (or an issue object)
+            delete_subtasks: Also delete the issue's subtasks; without this,
+                Jira refuses to delete an issue that has any
+        """
+        self.client._session.delete(
+            self.client._get_url(f"issue/{issue_id}"),
+            params={"deleteSubtasks": "true"} if delete_subtasks else None,
+        )
+        self.invalidate_issue(str(issue_id))
+
+    def count_issues(self, jql):
+        """
+        Count the issues matching a search.
+
+        Jira Cloud's approximate count is used where available; elsewhere the
+        matching keys are paged through and counted.
+
+        Args:
+            jql: The JQL query
+
+        Returns:
+            The number of matching issues (possibly approximate)
+        """
+        try:
+            count = self.client.approximate_issue_count(jql_str=jql)
+        except (JIRAError, ValueError) as e:
+            log.debug("Approximate count unavailable: %s", e)
+            count = None
+        if count is None:
+            count = sum(1 for _ in self.iter_search(jql, fields=["key"]))
+        return count
 
     def projects(self):
         """
@@ -203,7 +888,9 @@ class JiraClient:
         Returns:
             The list of projects
         """
-        return self.client.projects()
+        return self._cached(
+            "projects", "all", self.client.projects, jira.resources.Project
+        )
 
     def project(self, project_id):
         """
@@ -215,7 +902,12 @@ class JiraClient:
         Returns:
             The project
         """
-        return self.client.project(project_id)
+        return self._cached(
+            "project",
+            str(project_id).upper(),
+            lambda: self.client.project(project_id),
+            jira.resources.Project,
+        )
 
     def project_by_key(self, project_key):
         """
@@ -233,16 +925,24 @@ class JiraClient:
         """
         Get the current user.
 
+        The user is read once, when connecting, and kept for the life of the
+        client.
+
         Returns:
-            The current user
+            The current user's account ID (username on Server/DC)
         """
-        return self.client.current_user()
+        if not isinstance(self._myself, dict):
+            self._myself = self.client.myself()
+        # Same choice as the jira library: Server/DC users have no account ID
+        return self._myself["accountId" if self.client._is_cloud else "name"]
 
     def issue_types(self):
         """
         Get all issue types.
         """
-        return self.client.issue_types()
+        return self._cached(
+            "issue_types", "all", self.client.issue_types, jira.resources.IssueType
+        )
 
     def issue_type(self, issue_type_id):
         """
@@ -280,18 +980,23 @@ class JiraClient:
         """
         return self.client.issue_type_by_project_key(project_key)
 
-    def add_issues_to_epic(self, epic_key, issue_key):
+    def add_issues_to_epic(self, epic_key, issue_keys):
         """
-        Add issues to an epic.
+        Move issues into an epic in one request.
 
         Args:
-            epic_key: The epic issue
-            issue_key: The Jira key of the issue to add
+            epic_key: The epic's key
+            issue_keys: The keys of the issues to move (at most
+                MAX_EPIC_ISSUES), as a list or a comma-separated string
 
         Returns:
             The response from the add operation
         """
-        return self.client.add_issues_to_epic(epic_key, issue_key)
+        if isinstance(issue_keys, str):
+            issue_keys = issue_keys.split(",")
+        response = self.client.add_issues_to_epic(epic_key, list(issue_keys))
+        self.invalidate_issue(*issue_keys)
+        return response
 
     def createmeta(self, projectKeys=None, issuetypeNames=None, expand=None):
         """
@@ -302,12 +1007,102 @@ class JiraClient:
         Returns:
             The create metadata
         """
-        return self.client.createmeta(
-            projectKeys=projectKeys,
-            issuetypeNames=issuetypeNames,
-            expand=expand or "projects.issuetypes.fields",
+        expand = expand or "projects.issuetypes.fields"
+        return self._cached(
+            "createmeta",
+            f"{projectKeys or ''}|{issuetypeNames or ''}|{expand}".upper(),
+            lambda: self.client.createmeta(
+                projectKeys=projectKeys,
+                issuetypeNames=issuetypeNames,
+                expand=expand,
+            ),
         )
 
+    def fields(self):
+        """
+        Get every field (system and custom) defined on the server.
+
+        Returns:
+            A list of raw field dicts
+        """
+        return self._cached("fields", "all", self.client.fields)
+
+    def field_catalog(self):
+        """
+        Get the catalog of fields, for resolving fields by name.
+
+        Built once per client from the (cached) field list.
+
+        Returns:
+            A FieldCatalog
+        """
+        if self._field_catalog is None:
+            self._field_catalog = FieldCatalog(self.fields())
+        return self._field_catalog
+
+    def _cached(self, kind, key, fetch, resource=None):
+        """
+        Return a cached metadata payload, fetching and storing it on a miss.
+
+        Args:
+            kind: The cache kind, which sets the TTL (see cache.DEFAULT_TTLS)
+            key: The cache key
+            fetch: Callable that fetches the payload from Jira
+            resource: Optional resource class; the payload (or each item of a
+                list payload) is stored as raw JSON and rebuilt as this class
+
+        Returns:
+            The payload
+        """
+        if self.cache is None:
+            return fetch()
+
+        entry = self.cache.get(kind, key)
+        if entry is not None:
+            log.debug("Using cached %s %s", kind, key)
+            value = entry["value"]
+            if resource is None:
+                return value
+            if isinstance(value, list):
+                return [self._resource(resource, raw) for raw in value]
+            return self._resource(resource, value)
+
+        result = fetch()
+        if resource is None:
+            value = result
+        elif isinstance(result, list):
+            value = [item.raw for item in result]
+        else:
+            value = result.raw
+        self.cache.put(kind, key, value)
+        return result
+
+    def _resource(self, resource, raw):
+        """
+        Build a jira resource object from its raw JSON.
+        """
+        return resource(self.client._options, self.client._session, raw=raw)
+
+    def invalidate_metadata(self, *projects):
+        """
+        Drop cached project metadata.
+
+        Args:
+            *projects: Keys and/or IDs of the projects whose metadata changed
+                (the project list is always dropped); default: all metadata
+        """
+        if self.cache is None:
+            return
+        self.cache.invalidate("projects")
+        if not projects:
+            for kind in ("project", "issue_types", "createmeta", "fields"):
+                self.cache.invalidate(kind)
+            return
+        for project in filter(None, projects):
+            project = str(project).upper()
+            self.cache.invalidate("project", key=project)
+            self.cache.invalidate("createmeta", prefix=f"{project}|")
+
     # def project(self, project_id):
     #     """
     #     Get a project.
@@ -316,3 +1111,11 @@ class JiraClient:
     #         The project
     #     """
     #     return self.client.project(project_id)
+
+
+def _rejected_keys(error, keys):
+    """
+    Find which of the searched keys a JQL error complains about.
+    """
+    text = str(getattr(error, "text", "") or error)
+    return {key for key in keys if f"'{key}'" in text}
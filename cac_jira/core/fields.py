@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+
+"""
+Catalog of the Jira fields defined on a server.
+
+Built from the (cached) field list, the catalog resolves fields by ID or by a
+normalized form of their name, so commands can accept `--field "Story Points" 3`
+for any field rather than only raw `customfield_*` IDs, and coerces values into
+the shape each field's schema expects.
+"""
+
+import re
+
+import cac_core as cac
+
+log = cac.logger.new(__name__)
+
+# Array item types whose values are referenced by name or by value
+_NAMED_ITEMS = {"component", "version", "priority"}
+_VALUED_ITEMS = {"option"}
+
+# Custom field types the bulk edit API takes as plain numbers or text
+_BULK_NUMBER_TYPES = {"com.atlassian.jira.plugin.system.customfieldtypes:float"}
+_BULK_TEXT_TYPES = {"com.atlassian.jira.plugin.system.customfieldtypes:textfield"}
+
+_NO_MATCH = object()
+
+
+def normalize_name(name):
+    """
+    Normalize a field name for lookup.
+
+    "Story Points", "story points" and "story_points" all normalize to
+    "story_points".
+
+    Args:
+        name: The field name
+
+    Returns:
+        The normalized name
+    """
+    return re.sub(r"[^a-z0-9]+", "_", str(name).lower()).strip("_")
+
+
+def same_value(current, wanted):
+    """
+    Check whether a field already holds a value.
+
+    The wanted value is in the shape sent when setting the field (e.g.
+    {"value": "x"}), which is a subset of what Jira returns when reading it
+    (e.g. {"self": ..., "id": ..., "value": "x"}), so objects match when every
+    key that would be sent matches. Arrays match regardless of order.
+
+    Args:
+        current: The field's raw value, as read from the issue
+        wanted: The value that would be sent
+
+    Returns:
+        True if setting the field would not change it
+    """
+    empty = (None, "", [], {})
+    if current in empty and wanted in empty:
+        return True
+    if isinstance(wanted, dict):
+        return isinstance(current, dict) and all(
+            same_value(current.get(key), value) for key, value in wanted.items()
+        )
+    if isinstance(wanted, list):
+        if not isinstance(current, list) or len(current) != len(wanted):
+            return False
+        remaining = list(current)
+        for item in wanted:
+            match = next((c for c in remaining if same_value(c, item)), _NO_MATCH)
+            if match is _NO_MATCH:
+                return False
+            remaining.remove(match)
+        return True
+    if isinstance(wanted, (int, float)) and isinstance(current, (int, float)):
+        return float(current) == float(wanted)
+    return current == wanted
+
+
+class FieldCatalog:
+    """
+    Index of field definitions by ID and normalized name.
+    """
+
+    def __init__(self, fields):
+        """
+        Build the catalog.
+
+        Args:
+            fields: A list of raw field dicts, as returned by JiraClient.fields()
+        """
+        self.fields = {field["id"]: field for field in fields}
+        self.by_name = {}
+        for field in fields:
+            name = normalize_name(field.get("name", ""))
+            if name in self.by_name and self.by_name[name] != field["id"]:
+                # Prefer system fields over custom fields that share a name
+                if not field.get("custom", False):
+                    self.by_name[name] = field["id"]
+                log.debug("Field name '%s' is ambiguous", field.get("name"))
+                continue
+            self.by_name[name] = field["id"]
+
+    def resolve(self, name_or_id):
+        """
+        Find a field's ID.
+
+        Args:
+            name_or_id: A field ID (e.g. "customfield_10016") or name
+
+        Returns:
+            The field ID, or None if no field matches
+        """
+        if name_or_id in self.fields:
+            return name_or_id
+        return self.by_name.get(normalize_name(name_or_id))
+
+    def name(self, field_id):
+        """
+        Get a field's display name.
+
+        Args:
+            field_id: The field ID
+
+        Returns:
+            The field's name, or the ID if it isn't in the catalog
+        """
+        return self.fields.get(field_id, {}).get("name", field_id)
+
+    def schema(self, field_id):
+        """
+        Get a field's schema.
+
+        Args:
+            field_id: The field ID
+
+        Returns:
+            The schema dict (empty if unknown)
+        """
+        return self.fields.get(field_id, {}).get("schema", {})
+
+    def coerce(self, field_id, value, schema=None):
+        """
+        Shape a value for a field as Jira expects it when setting the field.
+
+        Strings for array fields are split on commas; options, users and
+        named resources are wrapped in the object Jira expects; numbers are
+        parsed. Values that are already structured are left alone.
+
+        Args:
+            field_id: The field ID
+            value: The value as given (usually a string)
+            schema: Optional schema to use instead of the catalog's (e.g. from
+                create metadata)
+
+        Returns:
+            The value to send
+        """
+        schema = schema or self.schema(field_id)
+        field_type = schema.get("type")
+
+        if field_type == "array":
+            values = (
+                [v.strip() for v in value.split(",")]
+                if isinstance(value, str)
+                else list(value)
+            )
+            items = schema.get("items")
+            if items in _VALUED_ITEMS:
+                return [v if isinstance(v, dict) else {"value": v} for v in values]
+            if items in _NAMED_ITEMS:
+                return [v if isinstance(v, dict) else {"name": v} for v in values]
+            return values
+
+        if isinstance(value, (dict, list)):
+            return value
+        if field_type == "option":
+            return {"value": value}
+        if field_type == "user":
+            return {"accountId": value}
+        if field_type in _NAMED_ITEMS:
+            return {"name": value}
+        if field_type == "number" and isinstance(value, str):
+            try:
+                return int(value)
+            except ValueError:
+                try:
+                    return float(value)
+                except ValueError:
+                    return value
+        return value
+
+    def bulk_edit_input(self, fields):
+        """
+        Express field values in the form the bulk edit API expects.
+
+        Only labels, number custom fields and single-line text custom fields
+        are supported; other fields need IDs (options, priorities, users) or
+        rich text that plain values don't carry.
+
+        Args:
+            fields: Dict of field ID -> value, as coerced by coerce()
+
+        Returns:
+            The editedFieldsInput dict, or None if any field isn't supported
+        """
+        edited = {}
+        for field_id, value in fields.items():
+            schema = self.schema(field_id)
+            custom = schema.get("custom")
+            if schema.get("system") == "labels":
+                edited.setdefault("labelsFields", []).append(
+                    {
+                        "fieldId": field_id,
+                        "bulkEditMultiSelectFieldOption": "REPLACE",
+                        "labels": [{"name": label} for label in value],
+                    }
+                )
+            elif custom in _BULK_NUMBER_TYPES and isinstance(value, (int, float)):
+                edited.setdefault("numberCustomFields", []).append(
+                    {"fieldId": field_id, "value": value}
+                )
+            elif custom in _BULK_TEXT_TYPES and isinstance(value, str):
+                edited.setdefault("singleLineTextFields", []).append(
+                    {"fieldId": field_id, "text": value}
+                )
+            else:
+                log.debug("Field '%s' can't be bulk edited", self.name(field_id))
+                return None
+        return edited
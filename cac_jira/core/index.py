@@ -0,0 +1,300 @@
+#!/usr/bin/env python
+
+"""
+Local full-text index over a mirror of Jira issues.
+
+Issues are stored in a SQLite database alongside an FTS5 table covering their
+summaries, descriptions and comments, so text lookups can be answered locally
+without a round-trip to Jira's search API.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+
+import cac_core as cac
+
+log = cac.logger.new(__name__)
+
+DEFAULT_PATH = os.path.expanduser(os.path.join("~", ".cache", "cac_jira", "issues.db"))
+
+# Relative bm25 weights for the key, summary, description and comments columns
+_RANK = "bm25(issues_fts, 0.0, 10.0, 2.0, 1.0)"
+
+# Bumped when the schema changes; older mirrors are dropped and re-synced
+SCHEMA_VERSION = 2
+
+
+def _escape_like(text):
+    """
+    Escape LIKE wildcards so text matches literally (with ESCAPE '\\').
+
+    Args:
+        text: The text to match
+
+    Returns:
+        The escaped text
+    """
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class IssueIndex:
+    """
+    SQLite-backed issue mirror with an FTS5 index.
+    """
+
+    def __init__(self, path=DEFAULT_PATH):
+        """
+        Open (creating if needed) the index database.
+
+        Args:
+            path: Path to the SQLite database file
+        """
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        if self.db.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            # The mirror is rebuilt by the next sync, so there is nothing to
+            # migrate; dropping sync_state makes that sync a full one
+            self.db.executescript(f"""
+                DROP TABLE IF EXISTS issues;
+                DROP TABLE IF EXISTS issues_fts;
+                DROP TABLE IF EXISTS comments;
+                DROP TABLE IF EXISTS sync_state;
+                PRAGMA user_version = {SCHEMA_VERSION};
+                """)
+        # Each issue's FTS row shares its rowid with the issues row, so it is
+        # replaced by rowid rather than by a scan for the (unindexed) key
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS issues (
+                id INTEGER PRIMARY KEY,
+                key TEXT NOT NULL UNIQUE,
+                project TEXT NOT NULL,
+                updated TEXT,
+                row TEXT NOT NULL
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS issues_fts
+                USING fts5(key UNINDEXED, summary, description, comments);
+            CREATE TABLE IF NOT EXISTS comments (
+                issue_id INTEGER NOT NULL,
+                comment_id TEXT NOT NULL,
+                body TEXT NOT NULL,
+                PRIMARY KEY (issue_id, comment_id)
+            );
+            CREATE TABLE IF NOT EXISTS sync_state (
+                project TEXT PRIMARY KEY,
+                synced_at TEXT
+            );
+            """)
+
+    def _rowid(self, key):
+        """
+        Get the rowid an issue is stored under.
+
+        Args:
+            key: The issue key
+
+        Returns:
+            The rowid, or None if the issue is not mirrored
+        """
+        result = self.db.execute(
+            "SELECT id FROM issues WHERE key = ?", (key,)
+        ).fetchone()
+        return result[0] if result else None
+
+    def upsert(self, key, row, summary="", description="", comments=None, updated=None):
+        """
+        Insert or replace an issue in the mirror.
+
+        Args:
+            key: The issue key
+            row: The display row for the issue (see JiraIssueCommand.issue_row)
+            summary: The issue summary
+            description: The issue description
+            comments: An iterable of comment bodies, or of (comment ID, body)
+                pairs; None keeps the comments already stored (webhook
+                payloads don't carry them)
+            updated: The issue's `updated` timestamp
+        """
+        project = key.rsplit("-", 1)[0]
+        with self._lock, self.db:
+            self.db.execute(
+                "INSERT INTO issues (key, project, updated, row) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET "
+                "project = excluded.project, updated = excluded.updated, row = excluded.row",
+                (key, project, updated, json.dumps(row)),
+            )
+            rowid = self._rowid(key)
+            if comments is not None:
+                self.db.execute("DELETE FROM comments WHERE issue_id = ?", (rowid,))
+                self.db.executemany(
+                    "INSERT OR REPLACE INTO comments (issue_id, comment_id, body) "
+                    "VALUES (?, ?, ?)",
+                    [
+                        (rowid, *(c if isinstance(c, tuple) else (f"#{n}", c)))
+                        for n, c in enumerate(comments)
+                    ],
+                )
+            self.db.execute("DELETE FROM issues_fts WHERE rowid = ?", (rowid,))
+            self.db.execute(
+                "INSERT INTO issues_fts (rowid, key, summary, description, comments) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (rowid, key, summary or "", description or "", self._comments(rowid)),
+            )
+
+    def _comments(self, rowid):
+        """
+        Get an issue's stored comments as one searchable text.
+
+        Args:
+            rowid: The issue's rowid
+
+        Returns:
+            The comment bodies, one per line, oldest first
+        """
+        bodies = self.db.execute(
+            "SELECT body FROM comments WHERE issue_id = ? ORDER BY rowid", (rowid,)
+        ).fetchall()
+        return "\n".join(body for (body,) in bodies)
+
+    def set_comment(self, key, comment_id, body=None):
+        """
+        Add, replace or (with no body) remove one comment on an indexed issue.
+
+        Args:
+            key: The issue key
+            comment_id: The comment's ID
+            body: The comment's current body, or None if it was deleted
+
+        Returns:
+            True if the issue was mirrored and updated, False otherwise
+        """
+        with self._lock, self.db:
+            rowid = self._rowid(key)
+            if rowid is None:
+                return False
+            if body is None:
+                self.db.execute(
+                    "DELETE FROM comments WHERE issue_id = ? AND comment_id = ?",
+                    (rowid, str(comment_id)),
+                )
+            else:
+                # Upsert keeps the comment's position when it is edited
+                self.db.execute(
+                    "INSERT INTO comments (issue_id, comment_id, body) VALUES (?, ?, ?) "
+                    "ON CONFLICT (issue_id, comment_id) DO UPDATE SET body = excluded.body",
+                    (rowid, str(comment_id), body),
+                )
+            self.db.execute(
+                "UPDATE issues_fts SET comments = ? WHERE rowid = ?",
+                (self._comments(rowid), rowid),
+            )
+        return True
+
+    def delete(self, key):
+        """
+        Remove an issue from the mirror.
+
+        Args:
+            key: The issue key
+        """
+        with self._lock, self.db:
+            self.db.execute(
+                "DELETE FROM issues_fts WHERE rowid = ?", (self._rowid(key),)
+            )
+            self.db.execute("DELETE FROM issues WHERE key = ?", (key,))
+
+    def get(self, key):
+        """
+        Get the stored display row for an issue.
+
+        Args:
+            key: The issue key
+
+        Returns:
+            The row dict, or None if the issue is not mirrored
+        """
+        with self._lock:
+            result = self.db.execute(
+                "SELECT row FROM issues WHERE key = ?", (key,)
+            ).fetchone()
+        return json.loads(result[0]) if result else None
+
+    def search(self, text, prefixes=None, limit=20):
+        """
+        Search the mirror, best matches first.
+
+        Every whitespace-separated term in `text` is matched as a prefix, so
+        partial words typed in an editor still hit.
+
+        Args:
+            text: The search text
+            prefixes: Optional list of issue key prefixes to restrict results to
+            limit: Maximum number of results
+
+        Returns:
+            A list of display rows
+        """
+        terms = [t.replace('"', '""') for t in text.split()]
+        if not terms:
+            return []
+        query = " ".join(f'"{term}"*' for term in terms)
+
+        sql = (
+            "SELECT issues.row FROM issues_fts "
+            "JOIN issues ON issues.id = issues_fts.rowid "
+            "WHERE issues_fts MATCH ?"
+        )
+        params = [query]
+        if prefixes:
+            sql += (
+                " AND ("
+                + " OR ".join("issues.key LIKE ? ESCAPE '\\'" for _ in prefixes)
+                + ")"
+            )
+            params.extend(f"{_escape_like(p.upper())}%" for p in prefixes)
+        sql += f" ORDER BY {_RANK} LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self.db.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def last_synced(self, project):
+        """
+        Get the `updated` watermark of the last sync for a project.
+
+        Args:
+            project: The project key
+
+        Returns:
+            The newest `updated` timestamp seen, or None if never synced
+        """
+        with self._lock:
+            result = self.db.execute(
+                "SELECT synced_at FROM sync_state WHERE project = ?", (project,)
+            ).fetchone()
+        return result[0] if result else None
+
+    def mark_synced(self, project, synced_at):
+        """
+        Record the `updated` watermark for a project.
+
+        Args:
+            project: The project key
+            synced_at: The newest `updated` timestamp seen
+        """
+        with self._lock, self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO sync_state (project, synced_at) VALUES (?, ?)",
+                (project, synced_at),
+            )
+
+    def close(self):
+        """
+        Close the underlying database.
+        """
+        self.db.close()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+
+"""
+Workflow graphs learned from transition lookups.
+
+Jira only exposes the transitions available from an issue's current status
+(reading whole workflows needs admin rights), so the graph for a project and
+issue type is filled in one status at a time from transitions() responses and
+cached. Once a status is known, moving an issue out of it needs no lookup, and
+targets several hops away are reached along the shortest known path.
+"""
+
+from collections import deque
+
+# Pseudo-status for a just-created issue, whose create response has no status
+NEW = "(new)"
+
+
+class WorkflowGraph:
+    """
+    The statuses and transitions of one workflow, as far as they are known.
+    """
+
+    def __init__(self, edges=None):
+        """
+        Create the graph.
+
+        Args:
+            edges: Optional dict of status name -> list of transitions, each a
+                dict with the transition's id, name and destination status
+                ("to"), as returned by to_json()
+        """
+        self.edges = {status.lower(): list(ts) for status, ts in (edges or {}).items()}
+
+    def to_json(self):
+        """
+        Get the graph as JSON-serializable data for caching.
+
+        Returns:
+            The edges dict
+        """
+        return self.edges
+
+    def knows(self, status):
+        """
+        Check whether the transitions out of a status are known.
+
+        Args:
+            status: The status name
+
+        Returns:
+            True if the status has been learned
+        """
+        return status.lower() in self.edges
+
+    def transitions(self, status):
+        """
+        Get the known transitions out of a status.
+
+        Args:
+            status: The status name
+
+        Returns:
+            A list of transition dicts (empty if the status isn't known)
+        """
+        return self.edges.get(status.lower(), [])
+
+    def learn(self, status, transitions):
+        """
+        Record the transitions available from a status.
+
+        Args:
+            status: The status name
+            transitions: The transitions, as returned by JiraClient.transitions()
+        """
+        self.edges[status.lower()] = [
+            {
+                "id": str(t["id"]),
+                "name": t["name"],
+                "to": (t.get("to") or {}).get("name", t["name"]),
+            }
+            for t in transitions
+        ]
+
+    def path(self, status, target):
+        """
+        Find the shortest known path from a status to a target.
+
+        The target matches a transition by its name or by its destination
+        status, case-insensitively.
+
+        Args:
+            status: The current status name
+            target: The transition or status name to reach
+
+        Returns:
+            A list of transitions to take in order (empty if the issue is
+            already in the target status), or None if no known path reaches it
+        """
+        target = target.lower()
+        if status.lower() == target:
+            return []
+
+        queue = deque([(status.lower(), [])])
+        seen = {status.lower()}
+        while queue:
+            current, path = queue.popleft()
+            for transition in self.edges.get(current, []):
+                step = path + [transition]
+                if target in (transition["name"].lower(), transition["to"].lower()):
+                    return step
+                destination = transition["to"].lower()
+                if destination not in seen:
+                    seen.add(destination)
+                    queue.append((destination, step))
+        return None
@@ -11,6 +11,8 @@ from unittest.mock import patch
 os.environ.setdefault("CAC_JIRA_SERVER", "test.atlassian.net")
 os.environ.setdefault("CAC_JIRA_USERNAME", "test@example.com")
 os.environ.setdefault("CAC_JIRA_PROJECT", "TEST")
+# Keep tests away from the developer's real on-disk cache
+os.environ.setdefault("CAC_JIRA_CACHE", "false")
 
 patch("keyring.get_password", return_value="fake-api-token").start()
 patch("jira.JIRA").start()
@@ -0,0 +1,72 @@
+"""
+Tests for the bulk worker pool.
+"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+from jira.exceptions import JIRAError
+
+from cac_jira.core.bulk import retry_after, run_bulk
+
+
+def _rate_limited(retry_after_header=None):
+    response = MagicMock()
+    response.headers = {"Retry-After": retry_after_header} if retry_after_header else {}
+    return JIRAError(status_code=429, text="Too many requests", response=response)
+
+
+class TestRetryAfter:
+    def test_uses_header_or_backs_off(self):
+        assert retry_after(_rate_limited("3"), 0) == 3.0
+        assert retry_after(_rate_limited(), 2) == 4.0
+
+    def test_other_errors_not_retried(self):
+        assert retry_after(JIRAError(status_code=400, text="Bad"), 0) is None
+        assert retry_after(ValueError("boom"), 0) is None
+
+
+class TestRunBulk:
+    def test_results_in_input_order(self):
+        def slow_square(n):
+            time.sleep(0.01 * (5 - n))
+            return n * n
+
+        results = run_bulk(slow_square, iter(range(5)), max_workers=4)
+
+        assert [r.item for r in results] == [0, 1, 2, 3, 4]
+        assert [r.value for r in results] == [0, 1, 4, 9, 16]
+        assert all(r.ok for r in results)
+
+    def test_failures_recorded_per_item(self):
+        def fail_odd(n):
+            if n % 2:
+                raise ValueError(f"odd {n}")
+            return n
+
+        results = run_bulk(fail_odd, [1, 2, 3], max_workers=2)
+
+        assert [r.ok for r in results] == [False, True, False]
+        assert results[0].error == "odd 1"
+
+    def test_rate_limited_items_pause_and_retry(self):
+        calls = []
+
+        def flaky(n):
+            calls.append(n)
+            if calls.count(n) == 1 and n == 1:
+                raise _rate_limited("0.5")
+            return n
+
+        with patch("cac_jira.core.bulk.time.sleep") as sleep:
+            results = run_bulk(flaky, [1], max_workers=1)
+
+        assert results[0].ok
+        assert calls == [1, 1]
+        assert 0 < sleep.call_args[0][0] <= 0.5
+
+    def test_gives_up_after_max_retries(self):
+        fn = MagicMock(side_effect=_rate_limited("0"))
+        results = run_bulk(fn, ["a"], max_workers=1, max_retries=2)
+        assert not results[0].ok
+        assert fn.call_count == 3
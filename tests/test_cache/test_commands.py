@@ -0,0 +1,108 @@
+"""
+Tests for the cache warm, stats and clear commands.
+"""
+
+import argparse
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cac_jira.commands.cache.clear import CacheClear
+from cac_jira.commands.cache.stats import CacheStats
+from cac_jira.commands.cache.warm import CacheWarm
+from cac_jira.core.cache import DiskCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = DiskCache(str(tmp_path / "cache.db"))
+    yield c
+    c.close()
+
+
+def make(command_class, cache):
+    command = command_class()
+    command.log = MagicMock()
+    command.jira_client = MagicMock()
+    command.jira_client.cache = cache
+    command.jira_client.concurrent_map.side_effect = lambda fn, items: [
+        fn(item) for item in items
+    ]
+    return command
+
+
+class TestCacheWarm:
+    def test_warms_metadata_for_each_project(self, cache):
+        cmd = make(CacheWarm, cache)
+        args = argparse.Namespace(project="a,B", output="table")
+        with patch("cac_core.output.Output"):
+            assert cmd.execute(args) is None
+
+        client = cmd.jira_client
+        client.invalidate_metadata.assert_called_once_with("A", "B")
+        client.projects.assert_called_once()
+        client.issue_types.assert_called_once()
+        client.fields.assert_called_once()
+        assert [c.args for c in client.project.call_args_list] == [("A",), ("B",)]
+        assert [c.args for c in client.createmeta.call_args_list] == [("A",), ("B",)]
+
+    def test_workflows_learned_per_type_and_status(self, cache):
+        cmd = make(CacheWarm, cache)
+        issues = []
+        for issuetype, status in [
+            ("Task", "To Do"),
+            ("Task", "Done"),
+            ("Task", "To Do"),
+        ]:
+            issue = MagicMock()
+            issue.fields.issuetype.name = issuetype
+            issue.fields.status.name = status
+            issues.append(issue)
+        cmd.jira_client.search_issues.return_value = issues
+        cmd.jira_client.transitions.return_value = [{"id": "1", "name": "Go"}]
+
+        cmd.warm_workflows("A")
+
+        assert cmd.jira_client.transitions.call_count == 2
+        project, issuetype, graph = cmd.jira_client.save_workflow.call_args[0]
+        assert (project, issuetype) == ("A", "Task")
+        assert graph.knows("To Do") and graph.knows("Done")
+
+    def test_failures_are_reported(self, cache):
+        cmd = make(CacheWarm, cache)
+        cmd.jira_client.fields.side_effect = RuntimeError("boom")
+        with patch("cac_core.output.Output"):
+            assert cmd.execute(argparse.Namespace(project="A", output="table")) == 1
+
+    def test_disabled_cache(self):
+        cmd = make(CacheWarm, None)
+        assert cmd.execute(argparse.Namespace(project="A", output="table")) == 1
+        cmd.jira_client.projects.assert_not_called()
+
+
+class TestCacheStats:
+    def test_reports_hit_rate(self, cache):
+        cache.put("project", "A", {"key": "A"})
+        cache.get("project", "A")
+        cache.get("project", "B")
+        cmd = make(CacheStats, cache)
+        with patch("cac_core.model.Model") as model, patch("cac_core.output.Output"):
+            cmd.execute(argparse.Namespace(output="table"))
+        row = model.call_args[0][0]
+        assert row["Kind"] == "project"
+        assert row["Entries"] == 1
+        assert row["Hit Rate"] == "50%"
+
+
+class TestCacheClear:
+    def test_clear_kind(self, cache):
+        cache.put("project", "A", {})
+        cache.put("issue", "A-1||", {})
+        cmd = make(CacheClear, cache)
+        cmd.execute(argparse.Namespace(kind="project"))
+        assert cache.get("project", "A") is None
+        assert cache.get("issue", "A-1||") is not None
+        assert [k["kind"] for k in cache.stats()] == ["issue", "project"]
+
+        cmd.execute(argparse.Namespace(kind=None))
+        assert cache.stats() == []
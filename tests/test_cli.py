@@ -8,7 +8,11 @@ invoking different commands and actions.
 """
 
 import argparse
+import io
 import sys
+from unittest.mock import patch
+
+import pytest
 
 from cac_jira.cli.main import main
 from cac_jira.commands.issue.list import IssueList
@@ -28,12 +32,24 @@ def test_cli_direct():
         "--project",
         "TEST",
     ]  # , "--limit", "5"] #, "--verbose"]
-    main()
+    with pytest.raises(SystemExit) as exit_info:
+        main()
+    assert exit_info.value.code == 0
 
     # Test 2: Project list command
     print("\n-- Testing 'jira project list' command --")
     sys.argv = ["jira", "project", "list"]  # , "--archived"] #, "--verbose"]
-    main()
+    with pytest.raises(SystemExit) as exit_info:
+        main()
+    assert exit_info.value.code == 0
+
+
+def test_cli_exit_status():
+    """Test that a command's failure reaches the shell as a non-zero exit."""
+    sys.argv = ["jira", "issue", "close"]
+    with patch("sys.stdin", io.StringIO("")), pytest.raises(SystemExit) as exit_info:
+        main()
+    assert exit_info.value.code == 1
 
     # # Test 3: Issue create command
     # print("\n-- Testing 'jira issue create' command --")
@@ -2,12 +2,22 @@
 Tests for JiraClient authentication handling.
 """
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 from jira.exceptions import JIRAError
+from jira.resilientsession import ResilientSession
 
-from cac_jira.core.client import JiraAuthenticationError, JiraClient
+from cac_jira.core.cache import DiskCache
+from cac_jira.core.client import (
+    MAX_JQL_LENGTH,
+    JiraAuthenticationError,
+    JiraClient,
+    chunk_values,
+    parse_datetime,
+)
 
 
 def _make_auth_failure():
@@ -52,3 +62,575 @@ class TestJiraClientAuth:
 
         assert client.client is mock_client
         mock_client.myself.assert_called_once()
+
+    def test_current_user_kept_from_connect(self, mock_jira_class):
+        mock_client = MagicMock()
+        mock_client.myself.return_value = {"accountId": "123"}
+        mock_jira_class.return_value = mock_client
+
+        client = JiraClient("test.atlassian.net", "user@example.com", "good-token")
+
+        assert client.current_user() == "123"
+        assert client.current_user() == "123"
+        mock_client.myself.assert_called_once()
+        mock_client.current_user.assert_not_called()
+
+
+def _search_result(jql_str, **_kwargs):
+    """Fake enhanced_search_issues: return an issue for every key in the JQL."""
+    keys = jql_str[len("key in (") : -1].split(", ")
+    missing = [key for key in keys if key.startswith("GONE-")]
+    if missing:
+        raise JIRAError(
+            status_code=400,
+            text=f"An issue with key '{missing[0]}' does not exist for field 'key'.",
+        )
+    issues = []
+    for key in reversed(keys):
+        issue = MagicMock()
+        issue.key = key
+        issues.append(issue)
+    return issues
+
+
+@patch("jira.JIRA")
+class TestIssuesByKeys:
+    def make_client(self, mock_jira_class):
+        mock_client = MagicMock()
+        mock_client.enhanced_search_issues.side_effect = _search_result
+        mock_jira_class.return_value = mock_client
+        return JiraClient("test.atlassian.net", "user@example.com", "token")
+
+    def test_batches_keys_and_preserves_order(self, mock_jira_class):
+        client = self.make_client(mock_jira_class)
+        keys = [f"TEST-{n}" for n in range(500, 0, -1)]
+
+        issues, missing = client.issues_by_keys(keys)
+
+        assert [issue.key for issue in issues] == keys
+        assert missing == []
+        assert client.client.enhanced_search_issues.call_count == 5
+
+    def test_reports_missing_keys(self, mock_jira_class):
+        client = self.make_client(mock_jira_class)
+
+        issues, missing = client.issues_by_keys(
+            ["test-1", "GONE-1", "not a key", "TEST-2", "TEST-1"]
+        )
+
+        assert [issue.key for issue in issues] == ["TEST-1", "TEST-2"]
+        assert missing == ["GONE-1", "NOT A KEY"]
+
+    def test_children_fetched_by_parent_batches(self, mock_jira_class):
+        client = self.make_client(mock_jira_class)
+        client.client.enhanced_search_issues.side_effect = None
+        client.client.enhanced_search_issues.return_value = [MagicMock()]
+
+        children = client.issues_by_parents(
+            [f"TEST-{n}" for n in range(150)], ["status"]
+        )
+
+        assert len(children) == 2
+        calls = client.client.enhanced_search_issues.call_args_list
+        assert [c[1]["jql_str"].startswith("parent in (") for c in calls] == [
+            True,
+            True,
+        ]
+        assert calls[0][1]["fields"] == ["status"]
+
+    def test_chunks_respect_jql_length(self, mock_jira_class):
+        keys = [f"LONGPROJECTKEY{n}-{n}" for n in range(200)]
+        chunks = chunk_values("key", keys)
+        assert sum(len(chunk) for chunk in chunks) == 200
+        for chunk in chunks:
+            assert len(f"key in ({', '.join(chunk)})") <= MAX_JQL_LENGTH
+
+
+def _search_pages(jql_str, nextPageToken=None, **_kwargs):
+    """Fake enhanced_search_issues(json_result=True): three issues, two per page."""
+    start = int(nextPageToken or 0)
+    keys = [f"TEST-{n}" for n in range(1, 4)][start : start + 2]
+    page = {"issues": [{"key": key, "fields": {}} for key in keys]}
+    if start + 2 < 3:
+        page["nextPageToken"] = str(start + 2)
+    return page
+
+
+@patch("jira.JIRA")
+class TestIterSearch:
+    def test_streams_pages_until_the_last(self, mock_jira_class):
+        mock_client = MagicMock()
+        mock_client._options = {
+            "server": "https://test.atlassian.net",
+            "rest_path": "api",
+            "rest_api_version": "2",
+            "agile_rest_path": "agile",
+            "agile_rest_api_version": "1.0",
+        }
+        mock_client.enhanced_search_issues.side_effect = _search_pages
+        mock_jira_class.return_value = mock_client
+        client = JiraClient("test.atlassian.net", "user@example.com", "token")
+
+        stream = client.iter_search("project = TEST", fields=["status"], page_size=2)
+        assert next(stream).key == "TEST-1"
+        assert mock_client.enhanced_search_issues.call_count == 1
+        assert [issue.key for issue in stream] == ["TEST-2", "TEST-3"]
+
+        calls = mock_client.enhanced_search_issues.call_args_list
+        assert [c[1]["nextPageToken"] for c in calls] == [None, "2"]
+        assert all(c[1]["json_result"] and c[1]["maxResults"] == 2 for c in calls)
+
+
+def _created(n):
+    return f"2024-01-{n:02d}T12:00:00.000+0000"
+
+
+def _comment_pages(path, params=None):
+    """Fake _get_json for the comment endpoint: 25 comments, newest first."""
+    comments = [{"id": str(n), "created": _created(n)} for n in range(25, 0, -1)]
+    start, size = params["startAt"], params["maxResults"]
+    return {"total": len(comments), "comments": comments[start : start + size]}
+
+
+def _changelog_pages(path, params=None):
+    """Fake _get_json for the changelog endpoint: 25 entries, oldest first."""
+    values = [{"id": str(n), "created": _created(n)} for n in range(1, 26)]
+    start, size = params.get("startAt", 0), params["maxResults"]
+    return {"total": len(values), "values": values[start : start + size]}
+
+
+@patch("jira.JIRA")
+class TestHistoryPaging:
+    def make_client(self, mock_jira_class, pages):
+        mock_client = MagicMock()
+        mock_client._get_json.side_effect = pages
+        mock_jira_class.return_value = mock_client
+        return JiraClient("test.atlassian.net", "user@example.com", "token")
+
+    def test_comments_page_newest_first(self, mock_jira_class):
+        client = self.make_client(mock_jira_class, _comment_pages)
+
+        ids = [c["id"] for c in client.iter_comments("TEST-1", page_size=10)]
+
+        assert ids == [str(n) for n in range(25, 0, -1)]
+        assert client.client._get_json.call_count == 3
+
+    def test_comments_stop_at_since(self, mock_jira_class):
+        client = self.make_client(mock_jira_class, _comment_pages)
+        since = parse_datetime(_created(20))
+
+        ids = [c["id"] for c in client.iter_comments("TEST-1", since, page_size=4)]
+
+        assert ids == ["25", "24", "23", "22", "21", "20"]
+        assert client.client._get_json.call_count == 2
+
+    def test_changelog_pages_backwards(self, mock_jira_class):
+        client = self.make_client(mock_jira_class, _changelog_pages)
+        since = parse_datetime(_created(18))
+
+        ids = [h["id"] for h in client.iter_changelog("TEST-1", since, page_size=5)]
+
+        assert ids == [str(n) for n in range(25, 17, -1)]
+        # one request for the total, then only the two newest pages
+        assert client.client._get_json.call_count == 3
+
+    def test_changelog_falls_back_to_expand(self, mock_jira_class):
+        client = self.make_client(
+            mock_jira_class, JIRAError(status_code=404, text="Not found")
+        )
+        issue = MagicMock()
+        issue.raw = {"changelog": {"histories": [{"id": "1", "created": _created(1)}]}}
+        client.client.issue.return_value = issue
+
+        assert [h["id"] for h in client.iter_changelog("TEST-1")] == ["1"]
+        client.client.issue.assert_called_once_with(
+            "TEST-1", fields="created", expand="changelog"
+        )
+
+
+def _response(raw=None, status_code=200, etag=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = raw
+    response.headers = {"ETag": etag} if etag else {}
+    return response
+
+
+class _CannedAdapter(requests.adapters.BaseAdapter):
+    """Transport adapter that answers every request with the next canned response."""
+
+    def __init__(self, *responses):
+        super().__init__()
+        self.responses = list(responses)
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        raw, status_code, etag = self.responses.pop(0)
+        response = requests.Response()
+        response.status_code = status_code
+        response.url = request.url
+        response.request = request
+        response._content = json.dumps(raw).encode() if raw is not None else b""
+        if etag:
+            response.headers["ETag"] = etag
+        return response
+
+    def close(self):
+        pass
+
+
+def _issue_raw(updated, summary="Crash"):
+    return {
+        "id": "10001",
+        "key": "TEST-1",
+        "fields": {"summary": summary, "updated": updated},
+    }
+
+
+@patch("jira.JIRA")
+class TestIssueCache:
+    def make_client(self, mock_jira_class, tmp_path):
+        mock_client = MagicMock()
+        mock_client._options = {
+            "server": "https://test.atlassian.net",
+            "rest_path": "api",
+            "rest_api_version": "2",
+            "agile_rest_path": "agile",
+            "agile_rest_api_version": "1.0",
+        }
+        mock_client._get_url.side_effect = lambda path: f"https://jira/{path}"
+        mock_jira_class.return_value = mock_client
+        return JiraClient(
+            "test.atlassian.net",
+            "user@example.com",
+            "token",
+            cache=DiskCache(str(tmp_path / "cache.db")),
+        )
+
+    def test_unchanged_issue_costs_one_probe(self, mock_jira_class, tmp_path):
+        client = self.make_client(mock_jira_class, tmp_path)
+        session = client.client._session
+        v1 = "2024-05-01T10:00:00.000+0000"
+        session.get.return_value = _response(_issue_raw(v1))
+        client.issue("TEST-1")
+
+        session.get.reset_mock()
+        session.get.return_value = _response({"fields": {"updated": v1}})
+        issue = client.issue("test-1")
+
+        assert issue.fields.summary == "Crash"
+        session.get.assert_called_once()
+        assert session.get.call_args[1]["params"] == {"fields": "updated"}
+
+    def test_changed_issue_is_refetched(self, mock_jira_class, tmp_path):
+        client = self.make_client(mock_jira_class, tmp_path)
+        session = client.client._session
+        session.get.return_value = _response(_issue_raw("2024-05-01T10:00:00.000+0000"))
+        client.issue("TEST-1", fields="summary")
+
+        session.get.reset_mock()
+        v2 = "2024-05-02T10:00:00.000+0000"
+        session.get.side_effect = [
+            _response({"fields": {"updated": v2}}),
+            _response(_issue_raw(v2, summary="Crash on login")),
+        ]
+        issue = client.issue("TEST-1", fields="summary")
+
+        assert issue.fields.summary == "Crash on login"
+        assert session.get.call_args[1]["params"] == {"fields": "summary,updated"}
+
+    def test_etag_revalidation(self, mock_jira_class, tmp_path):
+        client = self.make_client(mock_jira_class, tmp_path)
+        session = client.client._session
+        session.get.return_value = _response(
+            _issue_raw("2024-05-01T10:00:00.000+0000"), etag='"abc"'
+        )
+        client.issue("TEST-1")
+
+        session.get.reset_mock()
+        session.get.return_value = _response(status_code=304)
+        issue = client.issue("TEST-1")
+
+        assert issue.fields.summary == "Crash"
+        session.get.assert_called_once()
+        assert session.get.call_args[1]["headers"] == {"If-None-Match": '"abc"'}
+
+    def test_real_session(self, mock_jira_class, tmp_path):
+        client = self.make_client(mock_jira_class, tmp_path)
+        adapter = _CannedAdapter(
+            (_issue_raw("2024-05-01T10:00:00.000+0000"), 200, '"abc"'),
+            (None, 304, None),
+        )
+        session = ResilientSession()
+        session.mount("https://", adapter)
+        client.client._session = session
+
+        client.issue("TEST-1")
+        issue = client.issue("TEST-1")
+
+        assert issue.fields.summary == "Crash"
+        first, second = adapter.requests
+        assert "If-None-Match" not in first.headers
+        assert second.headers["If-None-Match"] == '"abc"'
+
+    def test_invalidate_issue(self, mock_jira_class, tmp_path):
+        client = self.make_client(mock_jira_class, tmp_path)
+        client.client._session.get.return_value = _response(
+            _issue_raw("2024-05-01T10:00:00.000+0000")
+        )
+        client.issue("TEST-1")
+        client.invalidate_issue("TEST-1", "10001")
+        assert client.cache.get("issue", "TEST-1||") is None
+
+
+@patch("jira.JIRA")
+class TestMetadataCache:
+    def make_client(self, mock_jira_class, tmp_path):
+        mock_client = MagicMock()
+        mock_client._options = {
+            "server": "https://test.atlassian.net",
+            "rest_path": "api",
+            "rest_api_version": "2",
+        }
+        mock_jira_class.return_value = mock_client
+        return JiraClient(
+            "test.atlassian.net",
+            "user@example.com",
+            "token",
+            cache=DiskCache(str(tmp_path / "cache.db")),
+        )
+
+    def test_project_rebuilt_from_cache(self, mock_jira_class, tmp_path):
+        client = self.make_client(mock_jira_class, tmp_path)
+        project = MagicMock()
+        project.raw = {"id": "1", "key": "TEST", "name": "Test"}
+        client.client.project.return_value = project
+
+        client.project("test")
+        cached = client.project("TEST")
+
+        client.client.project.assert_called_once_with("test")
+        assert cached.key == "TEST"
+        assert cached.name == "Test"
+
+    def test_createmeta_cached_until_invalidated(self, mock_jira_class, tmp_path):
+        client = self.make_client(mock_jira_class, tmp_path)
+        client.client.createmeta.return_value = {"projects": [{"key": "TEST"}]}
+
+        client.createmeta(projectKeys="TEST")
+        assert client.createmeta(projectKeys="TEST") == {"projects": [{"key": "TEST"}]}
+        assert client.client.createmeta.call_count == 1
+
+        client.invalidate_metadata("TEST")
+        client.createmeta(projectKeys="TEST")
+        assert client.client.createmeta.call_count == 2
+
+    def test_projects_list(self, mock_jira_class, tmp_path):
+        client = self.make_client(mock_jira_class, tmp_path)
+        projects = [MagicMock(raw={"id": str(n), "key": f"P{n}"}) for n in range(2)]
+        client.client.projects.return_value = projects
+
+        client.projects()
+        assert [p.key for p in client.projects()] == ["P0", "P1"]
+        client.client.projects.assert_called_once()
+
+    def test_uncacheable_results_pass_through(self, mock_jira_class, tmp_path):
+        client = self.make_client(mock_jira_class, tmp_path)
+        client.project("TEST")
+        client.project("TEST")
+        assert client.client.project.call_count == 2
+
+
+@patch("jira.JIRA")
+class TestCreateIssues:
+    def test_batches_and_retries_rate_limited_batches(self, mock_jira_class):
+        mock_client = MagicMock()
+        mock_jira_class.return_value = mock_client
+        client = JiraClient("test.atlassian.net", "user@example.com", "token")
+        calls = []
+
+        def create(batch, prefetch=True):
+            calls.append(batch[0]["n"])
+            if calls.count(50) == 1 and batch[0]["n"] == 50:
+                raise JIRAError(status_code=503, text="Unavailable")
+            return [{"status": "Success", "input_fields": f} for f in batch]
+
+        mock_client.create_issues.side_effect = create
+        with patch("time.sleep") as sleep:
+            results = client.create_issues(
+                [{"n": n} for n in range(120)], prefetch=False
+            )
+
+        assert sorted(calls) == [0, 50, 50, 100]
+        sleep.assert_called_once_with(1.0)
+        assert [r["input_fields"]["n"] for r in results] == list(range(120))
+        assert all(r["status"] == "Success" for r in results)
+
+    def test_unanswered_batches_are_not_resent(self, mock_jira_class):
+        mock_client = MagicMock()
+        mock_jira_class.return_value = mock_client
+        client = JiraClient("test.atlassian.net", "user@example.com", "token")
+
+        def create(batch, prefetch=True):
+            if batch[0]["n"] == 0:
+                raise requests.ConnectionError("Connection reset")
+            raise JIRAError(status_code=400, text="Bad request")
+
+        mock_client.create_issues.side_effect = create
+        results = client.create_issues([{"n": n} for n in range(60)], prefetch=False)
+
+        assert mock_client.create_issues.call_count == 2
+        assert {r["status"] for r in results[:50]} == {"Unknown"}
+        assert {r["status"] for r in results[50:]} == {"Error"}
+
+
+@patch("jira.JIRA")
+class TestEditIssue:
+    def test_labels_added_and_removed_in_one_request(self, mock_jira_class):
+        mock_client = MagicMock()
+        mock_client._get_url.side_effect = lambda path: f"https://jira/{path}"
+        mock_jira_class.return_value = mock_client
+        client = JiraClient("test.atlassian.net", "user@example.com", "token")
+
+        client.update_labels("TEST-1", add=["a", "b"], remove=["c"])
+
+        mock_client.issue.assert_not_called()
+        url = mock_client._session.put.call_args[0][0]
+        body = json.loads(mock_client._session.put.call_args[1]["data"])
+        assert url == "https://jira/issue/TEST-1"
+        assert body == {
+            "update": {"labels": [{"add": "a"}, {"add": "b"}, {"remove": "c"}]}
+        }
+
+        client.edit_issue("TEST-1", fields={"summary": "x"}, notify=False)
+        params = mock_client._session.put.call_args[1]["params"]
+        assert params == {"notifyUsers": "false"}
+
+    def test_user_lookup_cached(self, mock_jira_class, tmp_path):
+        mock_client = MagicMock()
+        mock_client.myself.return_value = {"accountId": "me-1"}
+        mock_client.search_users.return_value = [
+            MagicMock(
+                accountId="acct-9",
+                emailAddress="jane@example.com",
+                displayName="Jane Doe",
+            ),
+            MagicMock(
+                accountId="acct-10",
+                emailAddress="jane.roe@example.com",
+                displayName="Jane Roe",
+            ),
+        ]
+        mock_client._get_latest_url.side_effect = lambda path: f"https://jira/{path}"
+        mock_jira_class.return_value = mock_client
+        client = JiraClient(
+            "test.atlassian.net",
+            "user@example.com",
+            "token",
+            cache=DiskCache(tmp_path / "cache.db"),
+        )
+
+        assert client.resolve_user("Jane@example.com") == "acct-9"
+        assert client.resolve_user("jane@example.com") == "acct-9"
+        assert client.resolve_user("me") == "me-1"
+        mock_client.search_users.assert_called_once_with(query="Jane@example.com")
+
+        client.assign_issue("TEST-1", "acct-9")
+        url = mock_client._session.put.call_args[0][0]
+        body = json.loads(mock_client._session.put.call_args[1]["data"])
+        assert url == "https://jira/issue/TEST-1/assignee"
+        assert body == {"accountId": "acct-9"}
+
+    def test_email_hidden_by_privacy_settings(self, mock_jira_class):
+        mock_client = MagicMock()
+        mock_client.search_users.return_value = [
+            MagicMock(accountId="acct-9", emailAddress=None, displayName="Jane Doe")
+        ]
+        mock_jira_class.return_value = mock_client
+        client = JiraClient("test.atlassian.net", "user@example.com", "token")
+
+        assert client.resolve_user("jane@example.com") == "acct-9"
+        with pytest.raises(JIRAError):
+            client.resolve_user("Jane")
+
+    def test_current_user_on_server(self, mock_jira_class):
+        mock_client = MagicMock()
+        mock_client._is_cloud = False
+        mock_client.myself.return_value = {"name": "jdoe", "key": "JIRAUSER1"}
+        mock_jira_class.return_value = mock_client
+        client = JiraClient("jira.example.com", "jdoe", "token")
+
+        assert client.current_user() == "jdoe"
+        assert client.current_user() == "jdoe"
+        mock_client.myself.assert_called_once()
+
+    def test_ambiguous_user_not_resolved_or_cached(self, mock_jira_class, tmp_path):
+        mock_client = MagicMock()
+        mock_client.search_users.return_value = [
+            MagicMock(accountId="acct-9", emailAddress=None, displayName="Jane Doe"),
+            MagicMock(accountId="acct-10", emailAddress=None, displayName="Jane Doe"),
+        ]
+        mock_jira_class.return_value = mock_client
+        client = JiraClient(
+            "test.atlassian.net",
+            "user@example.com",
+            "token",
+            cache=DiskCache(tmp_path / "cache.db"),
+        )
+
+        with pytest.raises(JIRAError, match="2 users match 'jane doe'") as error:
+            client.resolve_user("jane doe")
+        assert "Jane Doe (acct-9), Jane Doe (acct-10)" in error.value.text
+        with pytest.raises(JIRAError, match="No user matches 'Jane' exactly"):
+            client.resolve_user("Jane")
+        with pytest.raises(JIRAError):
+            client.resolve_user("jane doe")
+        assert mock_client.search_users.call_count == 3
+
+    def test_delete_without_prefetch(self, mock_jira_class):
+        mock_client = MagicMock()
+        mock_client._get_url.side_effect = lambda path: f"https://jira/{path}"
+        mock_jira_class.return_value = mock_client
+        client = JiraClient("test.atlassian.net", "user@example.com", "token")
+
+        client.delete_issue("TEST-1", delete_subtasks=True)
+
+        mock_client.issue.assert_not_called()
+        mock_client._session.delete.assert_called_once_with(
+            "https://jira/issue/TEST-1", params={"deleteSubtasks": "true"}
+        )
+
+
+@patch("jira.JIRA")
+class TestBulkEdit:
+    def test_job_submitted_and_polled(self, mock_jira_class):
+        mock_client = MagicMock()
+        mock_client._options = {"server": "https://test.atlassian.net"}
+        mock_client._session.post.return_value.json.return_value = {"taskId": "7"}
+        mock_client._session.get.return_value.json.side_effect = [
+            {"status": "RUNNING", "progressPercent": 50},
+            {
+                "status": "COMPLETE",
+                "processedAccessibleIssues": [10001],
+                "failedAccessibleIssues": {"10002": ["Field is not editable"]},
+            },
+        ]
+        mock_jira_class.return_value = mock_client
+        client = JiraClient("test.atlassian.net", "user@example.com", "token")
+        edited = {"numberCustomFields": [{"fieldId": "customfield_1", "value": 3}]}
+
+        with patch("cac_jira.core.client.time.sleep"):
+            outcomes = client.bulk_edit([10001, 10002, 10003], edited)
+
+        url, kwargs = mock_client._session.post.call_args
+        assert url[0] == "https://test.atlassian.net/rest/api/3/bulk/issues/fields"
+        body = json.loads(kwargs["data"])
+        assert body["selectedIssueIdsOrKeys"] == ["10001", "10002", "10003"]
+        assert body["selectedActions"] == ["customfield_1"]
+        assert mock_client._session.get.call_args[0][0].endswith("/bulk/queue/7")
+        assert outcomes == {
+            "10001": [],
+            "10002": ["Field is not editable"],
+            "10003": ["Bulk edit COMPLETE"],
+        }
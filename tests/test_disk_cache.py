@@ -0,0 +1,85 @@
+"""
+Tests for the on-disk response cache.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from cac_jira.core.cache import DiskCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = DiskCache(str(tmp_path / "cache" / "cache.db"))
+    yield c
+    c.close()
+
+
+class TestDiskCache:
+    def test_round_trip(self, cache):
+        cache.put("issue", "TEST-1||", {"key": "TEST-1"}, validator="v1", etag='"e1"')
+        entry = cache.get("issue", "TEST-1||")
+        assert entry["value"] == {"key": "TEST-1"}
+        assert entry["validator"] == "v1"
+        assert entry["etag"] == '"e1"'
+        assert cache.get("issue", "TEST-2||") is None
+
+    def test_unserializable_values_are_skipped(self, cache):
+        cache.put("issue", "TEST-1||", {"key": MagicMock()})
+        assert cache.get("issue", "TEST-1||") is None
+
+    def test_invalidate_by_kind_and_prefix(self, cache):
+        cache.put("issue", "TEST-1||", {})
+        cache.put("issue", "TEST-1|summary|", {})
+        cache.put("issue", "TEST-10||", {})
+        cache.put("project", "TEST", {})
+
+        assert cache.invalidate("issue", prefix="TEST-1|") == 2
+        assert cache.get("issue", "TEST-10||") is not None
+        assert cache.invalidate() == 2
+        assert cache.get("project", "TEST") is None
+
+    def test_database_opened_lazily(self, tmp_path):
+        path = tmp_path / "lazy" / "cache.db"
+        DiskCache(str(path))
+        assert not path.exists()
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        cache = DiskCache(str(tmp_path / "cache.db"), ttls={"project": 60})
+        cache.put("project", "TEST", {"key": "TEST"})
+        cache.put("issue", "TEST-1||", {})
+        cache.db.execute("UPDATE entries SET stored_at = stored_at - 120")
+
+        assert cache.get("project", "TEST") is None
+        assert cache.get("issue", "TEST-1||") is not None
+
+    def test_reads_are_written_back_in_one_go(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        cache = DiskCache(path)
+        cache.put("project", "TEST", {"key": "TEST"})
+        changes = cache.db.total_changes
+
+        cache.get("project", "TEST")
+        cache.get("project", "OTHER")
+        cache.touch("project", "TEST")
+        assert cache.db.total_changes == changes
+        cache.close()
+
+        reopened = DiskCache(path)
+        [kind] = reopened.stats()
+        assert (kind["hits"], kind["misses"]) == (1, 1)
+        reopened.close()
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = DiskCache(str(tmp_path / "cache.db"), max_bytes=250)
+        for n in range(3):
+            cache.put("project", f"P{n}", {"pad": "x" * 60})
+            cache.db.execute(
+                "UPDATE entries SET accessed_at = ? WHERE key = ?", (n, f"P{n}")
+            )
+        cache.get("project", "P0")  # P0 is now the most recently used
+        cache.put("project", "P3", {"pad": "x" * 60})
+
+        assert cache.get("project", "P1") is None
+        assert all(cache.get("project", key) for key in ("P0", "P2", "P3"))
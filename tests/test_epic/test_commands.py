@@ -0,0 +1,107 @@
+"""
+Tests for the epic add and children commands.
+"""
+
+import argparse
+import json
+from unittest.mock import MagicMock, patch
+
+from cac_jira.commands.epic.add import EpicAdd, batched
+from cac_jira.commands.epic.children import EpicChildren
+
+
+def make(command_class):
+    command = command_class()
+    command.log = MagicMock()
+    command.jira_client = MagicMock()
+    command.jira_client.max_workers = 4
+    return command
+
+
+class TestEpicAdd:
+    def test_issues_sent_in_batches_of_fifty(self):
+        cmd = make(EpicAdd)
+        keys = [MagicMock(key=f"TEST-{n}") for n in range(2, 122)]
+        cmd.jira_client.iter_search.return_value = iter(keys)
+        args = argparse.Namespace(
+            project="TEST", epic="test-1", issue=None, jql="labels = q3", output="table"
+        )
+
+        with patch("cac_core.output.Output") as output:
+            assert cmd.execute(args) is None
+
+        calls = cmd.jira_client.add_issues_to_epic.call_args_list
+        assert sorted(len(c[0][1]) for c in calls) == [20, 50, 50]
+        assert {c[0][0] for c in calls} == {"TEST-1"}
+        assert len(output.return_value.print_models.call_args[0][0]) == 120
+
+    def test_failed_batch_reported_per_issue(self):
+        cmd = make(EpicAdd)
+        cmd.jira_client.add_issues_to_epic.side_effect = Exception("not an epic")
+        args = argparse.Namespace(
+            project="TEST",
+            epic="TEST-1",
+            issue=["TEST-2,TEST-3,TEST-1"],
+            jql=None,
+            output="table",
+        )
+
+        with patch("cac_core.output.Output") as output:
+            assert cmd.execute(args) == 1
+
+        cmd.jira_client.add_issues_to_epic.assert_called_once_with(
+            "TEST-1", ["TEST-2", "TEST-3"]
+        )
+        rows = [m.to_dict() for m in output.return_value.print_models.call_args[0][0]]
+        assert [row["Result"] for row in rows] == ["Failed", "Failed"]
+
+    def test_batched(self):
+        assert list(batched(iter(range(5)), 2)) == [[0, 1], [2, 3], [4]]
+
+
+class TestEpicChildren:
+    def test_children_streamed_with_narrow_fields(self):
+        cmd = make(EpicChildren)
+        child = MagicMock()
+        child.key = "TEST-2"
+        child.fields.assignee = None
+        cmd.jira_client.iter_search.return_value = iter([child])
+        args = argparse.Namespace(project="TEST", epic="test-1", output="table")
+
+        with patch("cac_core.output.Output") as output:
+            cmd.execute(args)
+
+        jql, kwargs = cmd.jira_client.iter_search.call_args
+        assert jql == ("parent = TEST-1 ORDER BY key",)
+        assert kwargs["fields"] == ["summary", "status", "assignee", "issuetype"]
+        row = output.return_value.print_models.call_args[0][0][0].to_dict()
+        assert row["ID"] == "TEST-2"
+        assert row["Assignee"] == "Unassigned"
+
+    def test_json_rows_printed_as_they_arrive(self, capsys):
+        cmd = make(EpicChildren)
+        printed = []
+
+        def children():
+            for n in (2, 3):
+                child = MagicMock()
+                child.key = f"TEST-{n}"
+                child.fields.assignee = None
+                child.fields.summary = f"Child {n}"
+                child.fields.status.name = "To Do"
+                child.fields.issuetype.name = "Task"
+                yield child
+                printed.append(capsys.readouterr().out)
+
+        cmd.jira_client.iter_search.return_value = children()
+        cmd.execute(argparse.Namespace(project="TEST", epic="TEST-1", output="json"))
+
+        assert '"TEST-2"' in printed[0]
+        rows = json.loads("".join(printed) + capsys.readouterr().out)
+        assert [row["ID"] for row in rows] == ["TEST-2", "TEST-3"]
+
+    def test_json_without_children(self, capsys):
+        cmd = make(EpicChildren)
+        cmd.jira_client.iter_search.return_value = iter([])
+        cmd.execute(argparse.Namespace(project="TEST", epic="TEST-1", output="json"))
+        assert json.loads(capsys.readouterr().out) == []
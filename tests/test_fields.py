@@ -0,0 +1,89 @@
+"""
+Tests for the field catalog.
+"""
+
+from cac_jira.core.fields import FieldCatalog, normalize_name, same_value
+
+FIELDS = [
+    {"id": "priority", "name": "Priority", "schema": {"type": "priority"}},
+    {
+        "id": "components",
+        "name": "Component/s",
+        "schema": {"type": "array", "items": "component"},
+    },
+    {
+        "id": "customfield_1",
+        "name": "Story Points",
+        "custom": True,
+        "schema": {
+            "type": "number",
+            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:float",
+        },
+    },
+    {
+        "id": "customfield_2",
+        "name": "Team",
+        "custom": True,
+        "schema": {"type": "array", "items": "option"},
+    },
+    {"id": "customfield_3", "name": "Priority", "custom": True, "schema": {}},
+    {
+        "id": "labels",
+        "name": "Labels",
+        "schema": {"type": "array", "items": "string", "system": "labels"},
+    },
+]
+
+
+class TestFieldCatalog:
+    def test_normalize_name(self):
+        assert normalize_name("Story Points") == "story_points"
+        assert normalize_name("component/s") == "component_s"
+
+    def test_resolve_by_id_or_name(self):
+        catalog = FieldCatalog(FIELDS)
+        assert catalog.resolve("customfield_1") == "customfield_1"
+        assert catalog.resolve("story points") == "customfield_1"
+        assert catalog.resolve("Story_Points") == "customfield_1"
+        assert catalog.resolve("nope") is None
+
+    def test_system_field_wins_name_clash(self):
+        assert FieldCatalog(FIELDS).resolve("priority") == "priority"
+
+    def test_coerce(self):
+        catalog = FieldCatalog(FIELDS)
+        assert catalog.coerce("customfield_1", "2.5") == 2.5
+        assert catalog.coerce("customfield_2", "a, b") == [
+            {"value": "a"},
+            {"value": "b"},
+        ]
+        assert catalog.coerce("components", "api") == [{"name": "api"}]
+        assert catalog.coerce("priority", "High") == {"name": "High"}
+        assert catalog.coerce("unknown", "x") == "x"
+        assert catalog.coerce("customfield_1", "x", {"type": "option"}) == {
+            "value": "x"
+        }
+
+    def test_bulk_edit_input(self):
+        catalog = FieldCatalog(FIELDS)
+        assert catalog.bulk_edit_input({"customfield_1": 3, "labels": ["a"]}) == {
+            "numberCustomFields": [{"fieldId": "customfield_1", "value": 3}],
+            "labelsFields": [
+                {
+                    "fieldId": "labels",
+                    "bulkEditMultiSelectFieldOption": "REPLACE",
+                    "labels": [{"name": "a"}],
+                }
+            ],
+        }
+        assert catalog.bulk_edit_input({"priority": {"name": "High"}}) is None
+
+    def test_same_value(self):
+        assert same_value({"self": "url", "id": "1", "value": "x"}, {"value": "x"})
+        assert not same_value({"value": "y"}, {"value": "x"})
+        assert same_value(["b", "a"], ["a", "b"])
+        assert not same_value(["a"], ["a", "b"])
+        assert same_value([{"name": "api", "id": "5"}], [{"name": "api"}])
+        assert same_value(3.0, 3)
+        assert same_value(None, "")
+        assert not same_value(None, "x")
@@ -0,0 +1,103 @@
+"""
+Tests for the local issue search index.
+"""
+
+import sqlite3
+
+import pytest
+
+from cac_jira.core.index import IssueIndex
+
+
+def make_row(key, summary):
+    return {"ID": key, "Summary": summary}
+
+
+@pytest.fixture
+def index(tmp_path):
+    idx = IssueIndex(str(tmp_path / "issues.db"))
+    idx.upsert(
+        "TEST-1",
+        make_row("TEST-1", "Login page times out"),
+        summary="Login page times out",
+        description="Users see a spinner",
+        comments=["Reproduced on staging"],
+    )
+    idx.upsert(
+        "TEST-2",
+        make_row("TEST-2", "Update docs"),
+        summary="Update docs",
+        description="Mention the login flow",
+    )
+    idx.upsert(
+        "OPS-7",
+        make_row("OPS-7", "Rotate login certificates"),
+        summary="Rotate login certificates",
+    )
+    yield idx
+    idx.close()
+
+
+class TestIssueIndex:
+    def test_summary_matches_rank_above_description(self, index):
+        keys = [row["ID"] for row in index.search("login")]
+        assert keys.index("TEST-1") < keys.index("TEST-2")
+        assert keys.index("OPS-7") < keys.index("TEST-2")
+
+    def test_prefix_terms(self, index):
+        assert [row["ID"] for row in index.search("reprod")] == ["TEST-1"]
+
+    def test_key_prefix_filter(self, index):
+        keys = {row["ID"] for row in index.search("login", prefixes=["test"])}
+        assert keys == {"TEST-1", "TEST-2"}
+
+    def test_upsert_replaces_text(self, index):
+        index.upsert("TEST-2", make_row("TEST-2", "Update docs"), summary="Update docs")
+        assert {row["ID"] for row in index.search("login")} == {"TEST-1", "OPS-7"}
+
+    def test_delete(self, index):
+        index.delete("TEST-1")
+        assert index.get("TEST-1") is None
+        assert "TEST-1" not in [row["ID"] for row in index.search("login")]
+
+    def test_sync_watermark(self, index):
+        assert index.last_synced("TEST") is None
+        index.mark_synced("TEST", "2024-05-01T10:00:00.000+0000")
+        assert index.last_synced("TEST") == "2024-05-01T10:00:00.000+0000"
+
+    def test_blank_query(self, index):
+        assert index.search("   ") == []
+
+    def test_reindexing_replaces_the_fts_row(self, index):
+        for _ in range(3):
+            index.upsert("TEST-1", make_row("TEST-1", "Login"), summary="Login")
+        count = index.db.execute("SELECT count(*) FROM issues_fts").fetchone()[0]
+        assert count == 3
+        fts = index.db.execute(
+            "SELECT issues_fts.key FROM issues_fts JOIN issues "
+            "ON issues.id = issues_fts.rowid"
+        ).fetchall()
+        assert sorted(key for (key,) in fts) == ["OPS-7", "TEST-1", "TEST-2"]
+
+    def test_key_prefix_wildcards_match_literally(self, index):
+        index.upsert("AB_C-1", make_row("AB_C-1", "Login"), summary="Login")
+        index.upsert("ABXC-1", make_row("ABXC-1", "Login"), summary="Login")
+        keys = {row["ID"] for row in index.search("login", prefixes=["ab_c"])}
+        assert keys == {"AB_C-1"}
+
+
+def test_old_schema_is_rebuilt(tmp_path):
+    path = str(tmp_path / "issues.db")
+    old = sqlite3.connect(path)
+    old.executescript("""
+        CREATE TABLE issues (key TEXT PRIMARY KEY, project TEXT, updated TEXT, row TEXT);
+        CREATE TABLE sync_state (project TEXT PRIMARY KEY, synced_at TEXT);
+        INSERT INTO sync_state VALUES ('TEST', '2024-01-01');
+        """)
+    old.close()
+
+    idx = IssueIndex(path)
+    idx.upsert("TEST-1", make_row("TEST-1", "Login"), summary="Login")
+    assert idx.last_synced("TEST") is None
+    assert [row["ID"] for row in idx.search("login")] == ["TEST-1"]
+    idx.close()
@@ -0,0 +1,64 @@
+"""
+Tests for the IssueAssign command.
+"""
+
+import argparse
+from unittest.mock import MagicMock, patch
+
+import pytest
+from jira.exceptions import JIRAError
+
+from cac_jira.commands.issue.assign import IssueAssign
+
+
+def make_args(**kwargs):
+    defaults = {
+        "project": "TEST",
+        "issue": ["TEST-1"],
+        "jql": None,
+        "to": "me",
+        "output": "table",
+    }
+    defaults.update(kwargs)
+    return argparse.Namespace(**defaults)
+
+
+@pytest.fixture
+def cmd():
+    command = IssueAssign()
+    command.log = MagicMock()
+    command.jira_client = MagicMock()
+    command.jira_client.max_workers = 4
+    command.jira_client.resolve_user.return_value = "acct-1"
+    return command
+
+
+class TestIssueAssign:
+    def test_assigns_to_me_by_default(self, cmd):
+        cmd.execute(make_args())
+        cmd.jira_client.resolve_user.assert_called_once_with("me")
+        cmd.jira_client.assign_issue.assert_called_once_with("TEST-1", "acct-1")
+
+    def test_unassign(self, cmd):
+        cmd.execute(make_args(to="none"))
+        cmd.jira_client.resolve_user.assert_not_called()
+        cmd.jira_client.assign_issue.assert_called_once_with("TEST-1", None)
+
+    def test_unknown_user(self, cmd):
+        cmd.jira_client.resolve_user.side_effect = JIRAError(text="No matching user")
+        assert cmd.execute(make_args(to="nobody")) == 1
+        cmd.jira_client.assign_issue.assert_not_called()
+
+    def test_jql_resolves_user_once(self, cmd):
+        issues = [MagicMock(key=f"TEST-{n}") for n in range(1, 4)]
+        cmd.jira_client.iter_search.return_value = iter(issues)
+
+        with patch("cac_core.output.Output"):
+            result = cmd.execute(
+                make_args(issue=None, jql="sprint = 42", to="jane@example.com")
+            )
+
+        assert result is None
+        cmd.jira_client.resolve_user.assert_called_once_with("jane@example.com")
+        assigned = sorted(c[0] for c in cmd.jira_client.assign_issue.call_args_list)
+        assert assigned == [(f"TEST-{n}", "acct-1") for n in range(1, 4)]
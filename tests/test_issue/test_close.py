@@ -0,0 +1,227 @@
+"""
+Tests for the IssueClose command and workflow-based transitions.
+"""
+
+import argparse
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+from jira.exceptions import JIRAError
+
+from cac_jira.commands.issue.close import IssueClose
+from cac_jira.core.workflow import WorkflowGraph
+
+
+def transition(tid, name, to=None):
+    return {"id": tid, "name": name, "to": {"name": to or name}}
+
+
+@pytest.fixture
+def cmd():
+    command = IssueClose()
+    command.log = MagicMock()
+    command.jira_client = MagicMock()
+    issue = command.jira_client.issue.return_value
+    issue.key = "TEST-1"
+    issue.fields.project.key = "TEST"
+    issue.fields.issuetype.name = "Task"
+    issue.fields.status.name = "To Do"
+    return command
+
+
+def close(cmd, comment=None):
+    return cmd.execute(
+        argparse.Namespace(project="TEST", issue="TEST-1", comment=comment)
+    )
+
+
+class TestIssueClose:
+    def test_cached_workflow_needs_only_the_transition(self, cmd):
+        graph = WorkflowGraph()
+        graph.learn("To Do", [transition(31, "Done")])
+        cmd.jira_client.workflow.return_value = graph
+
+        close(cmd)
+
+        cmd.jira_client.issue.assert_called_once_with(
+            "TEST-1", fields="project,issuetype,status"
+        )
+        cmd.jira_client.transitions.assert_not_called()
+        cmd.jira_client.transition_issue.assert_called_once_with(
+            cmd.jira_client.issue.return_value, "31"
+        )
+
+    def test_multi_hop_learns_unknown_statuses(self, cmd):
+        cmd.jira_client.workflow.return_value = WorkflowGraph()
+        sample = MagicMock()
+        cmd.jira_client.search_issues.return_value = [sample]
+        cmd.jira_client.transitions.side_effect = lambda issue: (
+            [transition(21, "Done")]
+            if issue is sample
+            else [transition(11, "Start", "In Progress")]
+        )
+
+        close(cmd)
+
+        jql = cmd.jira_client.search_issues.call_args[0][0]
+        assert 'status = "In Progress"' in jql
+        ids = [c[0][1] for c in cmd.jira_client.transition_issue.call_args_list]
+        assert ids == ["11", "21"]
+        saved = cmd.jira_client.save_workflow.call_args[0]
+        assert saved[:2] == ("TEST", "Task")
+        assert saved[2].knows("In Progress")
+
+    def test_unreachable_target(self, cmd):
+        cmd.jira_client.workflow.return_value = WorkflowGraph()
+        cmd.jira_client.transitions.return_value = [transition(12, "Block", "Blocked")]
+        cmd.jira_client.search_issues.return_value = []
+
+        assert close(cmd) == 1
+
+        cmd.jira_client.transition_issue.assert_not_called()
+        assert "No '%s' transition found" in cmd.log.error.call_args[0][0]
+
+    def test_failed_transition_replans_from_actual_status(self, cmd):
+        graph = WorkflowGraph()
+        graph.learn("To Do", [transition(31, "Done")])
+        cmd.jira_client.workflow.return_value = graph
+        issue = cmd.jira_client.issue.return_value
+        moved = MagicMock()
+        moved.fields.status.name = "In Progress"
+        cmd.jira_client.issue.side_effect = [issue, moved]
+        cmd.jira_client.transitions.return_value = [transition(41, "Done")]
+        cmd.jira_client.transition_issue.side_effect = [Exception("bad id"), None]
+
+        close(cmd)
+
+        assert cmd.jira_client.issue.call_args == call("TEST-1", fields="status")
+        assert cmd.jira_client.transition_issue.call_args == call(issue, "41")
+        assert graph.transitions("In Progress")[0]["id"] == "41"
+        assert graph.transitions("To Do")[0]["id"] == "31"
+
+    def test_comment_sent_with_transition(self, cmd):
+        graph = WorkflowGraph()
+        graph.learn("To Do", [transition(31, "Done")])
+        cmd.jira_client.workflow.return_value = graph
+
+        close(cmd, comment="Fixed in 1.2")
+
+        cmd.jira_client.transition_issue.assert_called_once_with(
+            cmd.jira_client.issue.return_value, "31", comment="Fixed in 1.2"
+        )
+        cmd.jira_client.add_comment.assert_not_called()
+
+    def test_comment_falls_back_when_screen_rejects_it(self, cmd):
+        graph = WorkflowGraph()
+        graph.learn("To Do", [transition(31, "Done")])
+        cmd.jira_client.workflow.return_value = graph
+        cmd.jira_client.transition_issue.side_effect = [
+            JIRAError(status_code=400, text="Field 'comment' cannot be set"),
+            None,
+        ]
+
+        close(cmd, comment="Fixed in 1.2")
+
+        issue = cmd.jira_client.issue.return_value
+        assert cmd.jira_client.transition_issue.call_args_list[1] == call(issue, "31")
+        cmd.jira_client.add_comment.assert_called_once_with(issue, "Fixed in 1.2")
+
+    def test_other_bad_requests_are_not_retried_without_comment(self, cmd):
+        graph = WorkflowGraph()
+        graph.learn("To Do", [transition(31, "Done")])
+        cmd.jira_client.workflow.return_value = graph
+        cmd.jira_client.transitions.return_value = [transition(31, "Done")]
+        cmd.jira_client.transition_issue.side_effect = JIRAError(
+            status_code=400, text="Field 'resolution' is required"
+        )
+
+        close(cmd, comment="Fixed in 1.2")
+
+        for c in cmd.jira_client.transition_issue.call_args_list:
+            assert c[1] == {"comment": "Fixed in 1.2"}
+        cmd.jira_client.add_comment.assert_not_called()
+        assert "Failed to transition" in cmd.log.error.call_args[0][0]
+
+    def test_comment_added_when_already_in_target(self, cmd):
+        cmd.jira_client.issue.return_value.fields.status.name = "Done"
+        cmd.jira_client.workflow.return_value = WorkflowGraph()
+        cmd.jira_client.transitions.return_value = []
+
+        close(cmd, comment="Fixed in 1.2")
+
+        cmd.jira_client.transition_issue.assert_not_called()
+        cmd.jira_client.add_comment.assert_called_once_with(
+            cmd.jira_client.issue.return_value, "Fixed in 1.2"
+        )
+
+
+def make_issue(key, project="TEST", issuetype="Task", status="To Do"):
+    issue = MagicMock()
+    issue.key = key
+    issue.fields.project.key = project
+    issue.fields.issuetype.name = issuetype
+    issue.fields.status.name = status
+    return issue
+
+
+class TestBulkClose:
+    @pytest.fixture
+    def bulk_cmd(self, cmd):
+        cmd.jira_client.max_workers = 4
+        cmd.jira_client.workflow.side_effect = lambda *_: WorkflowGraph()
+        cmd.jira_client.transitions.return_value = [transition(31, "Done")]
+        return cmd
+
+    def test_jql_targets_share_a_workflow_per_group(self, bulk_cmd):
+        issues = [make_issue(f"TEST-{n}") for n in range(1, 6)]
+        issues.append(make_issue("OPS-1", project="OPS"))
+        bulk_cmd.jira_client.iter_search.return_value = iter(issues)
+
+        with patch("cac_core.output.Output") as output:
+            result = bulk_cmd.execute(
+                argparse.Namespace(
+                    project="TEST", issue=None, jql="fixVersion = 1.2", comment=None
+                )
+            )
+
+        assert result is None
+        assert bulk_cmd.jira_client.iter_search.call_args[0][0] == "fixVersion = 1.2"
+        bulk_cmd.jira_client.issue.assert_not_called()
+        assert bulk_cmd.jira_client.transition_issue.call_count == 6
+        assert sorted(c[0] for c in bulk_cmd.jira_client.workflow.call_args_list) == [
+            ("OPS", "Task"),
+            ("TEST", "Task"),
+        ]
+        assert bulk_cmd.jira_client.save_workflow.call_count == 2
+        rows = output.return_value.print_models.call_args[0][0]
+        assert len(rows) == 6
+
+    def test_keys_fetched_in_batches_with_failures_reported(self, bulk_cmd):
+        ok, broken = make_issue("TEST-1"), make_issue("TEST-2")
+        bulk_cmd.jira_client.issues_by_keys.return_value = ([ok, broken], ["TEST-9"])
+
+        def transition_issue(issue, _transition_id):
+            if issue is broken:
+                raise Exception("denied")
+
+        bulk_cmd.jira_client.transition_issue.side_effect = transition_issue
+
+        with patch("cac_core.output.Output") as output:
+            result = bulk_cmd.execute(
+                argparse.Namespace(
+                    project="TEST",
+                    issue=["TEST-1,TEST-2", "TEST-9"],
+                    jql=None,
+                    comment=None,
+                )
+            )
+
+        assert result == 1
+        keys = bulk_cmd.jira_client.issues_by_keys.call_args[0][0]
+        assert keys == ["TEST-1", "TEST-2", "TEST-9"]
+        rows = [m.to_dict() for m in output.return_value.print_models.call_args[0][0]]
+        assert [(r["Key"], r["Result"]) for r in rows] == [
+            ("TEST-1", "OK"),
+            ("TEST-2", "Failed"),
+            ("TEST-9", "Not found"),
+        ]
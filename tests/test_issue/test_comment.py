@@ -0,0 +1,100 @@
+"""
+Tests for the IssueComment command.
+"""
+
+import argparse
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cac_jira.commands.issue.comment import IssueComment, display_value
+from cac_jira.core.fields import FieldCatalog
+
+FIELDS = [
+    {"id": "summary", "name": "Summary", "schema": {"type": "string"}},
+    {"id": "assignee", "name": "Assignee", "schema": {"type": "user"}},
+]
+
+
+def make_args(**kwargs):
+    defaults = {
+        "project": "TEST",
+        "issue": ["TEST-1"],
+        "jql": None,
+        "comment": None,
+        "template": None,
+        "var": None,
+        "output": "table",
+    }
+    defaults.update(kwargs)
+    return argparse.Namespace(**defaults)
+
+
+def make_issue(key, summary, assignee=None):
+    issue = MagicMock()
+    issue.key = key
+    issue.raw = {"key": key, "fields": {"summary": summary, "assignee": assignee}}
+    return issue
+
+
+@pytest.fixture
+def cmd():
+    command = IssueComment()
+    command.log = MagicMock()
+    command.jira_client = MagicMock()
+    command.jira_client.max_workers = 4
+    command.jira_client.field_catalog.return_value = FieldCatalog(FIELDS)
+    return command
+
+
+class TestIssueComment:
+    def test_single_comment(self, cmd):
+        cmd.execute(make_args(comment="Looks good"))
+        cmd.jira_client.add_comment.assert_called_once_with("TEST-1", "Looks good")
+        cmd.jira_client.field_catalog.assert_not_called()
+
+    def test_template_rendered_from_search_fields(self, cmd):
+        cmd.jira_client.iter_search.return_value = iter(
+            [
+                make_issue("TEST-1", "Login", {"displayName": "Ada"}),
+                make_issue("TEST-2", "Logout"),
+            ]
+        )
+
+        with patch("cac_core.output.Output"):
+            result = cmd.execute(
+                make_args(
+                    issue=None,
+                    jql='fixVersion = "1.2"',
+                    template="Released in {version} ({key}: {summary}, {assignee})",
+                    var=["version=1.2"],
+                )
+            )
+
+        assert result is None
+        jql, kwargs = cmd.jira_client.iter_search.call_args
+        assert jql == ('fixVersion = "1.2"',)
+        assert kwargs["fields"] == ["assignee", "summary"]
+        cmd.jira_client.issue.assert_not_called()
+        posted = sorted(c[0] for c in cmd.jira_client.add_comment.call_args_list)
+        assert posted == [
+            ("TEST-1", "Released in 1.2 (TEST-1: Login, Ada)"),
+            ("TEST-2", "Released in 1.2 (TEST-2: Logout, )"),
+        ]
+
+    def test_key_only_template_needs_no_search(self, cmd):
+        with patch("cac_core.output.Output"):
+            cmd.execute(make_args(issue=["TEST-1,TEST-2"], template="See {key}"))
+        cmd.jira_client.issues_by_keys.assert_not_called()
+        posted = sorted(c[0] for c in cmd.jira_client.add_comment.call_args_list)
+        assert posted == [("TEST-1", "See TEST-1"), ("TEST-2", "See TEST-2")]
+
+    def test_unknown_placeholder(self, cmd):
+        assert cmd.execute(make_args(template="{nope}")) == 1
+        cmd.jira_client.add_comment.assert_not_called()
+
+    def test_display_value(self):
+        assert display_value([{"name": "1.2"}, {"name": "1.3"}]) == "1.2, 1.3"
+        assert display_value({"value": "Core", "id": "1"}) == "Core"
+        assert display_value(None) == ""
+        assert display_value(3) == "3"
@@ -8,6 +8,18 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from cac_jira.commands.issue.create import IssueCreate
+from cac_jira.core.fields import FieldCatalog
+from cac_jira.core.workflow import NEW, WorkflowGraph
+
+FIELDS = [
+    {"id": "summary", "name": "Summary", "schema": {"type": "string"}},
+    {
+        "id": "customfield_10016",
+        "name": "Story Points",
+        "custom": True,
+        "schema": {"type": "number"},
+    },
+]
 
 
 def make_issuetype(name):
@@ -29,6 +41,7 @@ def make_args(**kwargs):
         "epic_name": None,
         "browse": False,
         "custom_fields": None,
+        "from_file": None,
         "output": "table",
         "verbose": False,
     }
@@ -48,6 +61,8 @@ def cmd():
 
     command.jira_client.project.return_value = mock_project
     command.jira_client.current_user.return_value = "user-account-id"
+    command.jira_client.field_catalog.return_value = FieldCatalog(FIELDS)
+    command.jira_client.workflow.side_effect = lambda *_: WorkflowGraph()
     command.jira_client.createmeta.return_value = {
         "projects": [{"issuetypes": [{"fields": {}}]}]
     }
@@ -89,7 +104,7 @@ class TestIssueCreateExecution:
         cmd.execute(make_args())
         cmd.jira_client.create_issue.assert_called_once()
         fields = cmd.jira_client.create_issue.call_args[1]["fields"]
-        assert fields["project"] == "TEST"
+        assert fields["project"] == {"key": "TEST"}
         assert fields["summary"] == "Test Issue"
         assert fields["description"] == "Test description"
         assert fields["issuetype"] == {"name": "Task"}
@@ -100,39 +115,235 @@ class TestIssueCreateExecution:
         assert fields["labels"] == ["bug", "urgent"]
 
     def test_creation_with_epic(self, cmd):
-        mock_epic = MagicMock()
-        mock_epic.key = "TEST-99"
-        cmd.jira_client.issue.return_value = mock_epic
-        cmd.execute(make_args(epic="TEST-99"))
+        cmd.execute(make_args(epic="test-99"))
         fields = cmd.jira_client.create_issue.call_args[1]["fields"]
         assert fields["parent"] == {"key": "TEST-99"}
+        cmd.jira_client.issue.assert_not_called()
 
     def test_creation_with_assign(self, cmd):
         cmd.execute(make_args(assign=True))
-        created_issue = cmd.jira_client.create_issue.return_value
-        created_issue.update.assert_called_once_with(
-            assignee={"accountId": "user-account-id"}
-        )
+        fields = cmd.jira_client.create_issue.call_args[1]["fields"]
+        assert fields["assignee"] == {"accountId": "user-account-id"}
+        cmd.jira_client.create_issue.return_value.update.assert_not_called()
 
     def test_begin_implies_assign(self, cmd):
-        with patch("cac_jira.commands.issue.begin.IssueBegin") as mock_begin_cls:
-            mock_begin_cls.return_value.execute = MagicMock()
-            cmd.execute(make_args(begin=True))
-        created_issue = cmd.jira_client.create_issue.return_value
-        created_issue.update.assert_called_once_with(
-            assignee={"accountId": "user-account-id"}
-        )
+        cmd.execute(make_args(begin=True))
+        fields = cmd.jira_client.create_issue.call_args[1]["fields"]
+        assert fields["assignee"] == {"accountId": "user-account-id"}
 
     def test_begin_triggers_transition(self, cmd):
-        with patch("cac_jira.commands.issue.begin.IssueBegin") as mock_begin_cls:
-            mock_begin_instance = MagicMock()
-            mock_begin_cls.return_value = mock_begin_instance
-            cmd.execute(make_args(begin=True))
-        mock_begin_instance.execute.assert_called_once()
-        begin_args = mock_begin_instance.execute.call_args[0][0]
-        assert begin_args.issue == "TEST-1"
+        cmd.jira_client.transitions.return_value = [
+            {"id": "11", "name": "To Do", "to": {"name": "To Do"}},
+            {"id": "21", "name": "In Progress", "to": {"name": "In Progress"}},
+        ]
+        cmd.execute(make_args(begin=True))
+        created_issue = cmd.jira_client.create_issue.return_value
+        cmd.jira_client.workflow.assert_called_once_with("TEST", "Task")
+        cmd.jira_client.transitions.assert_called_once_with(created_issue)
+        cmd.jira_client.transition_issue.assert_called_once_with(created_issue, "21")
+        cmd.jira_client.issue.assert_not_called()
+        graph = cmd.jira_client.save_workflow.call_args[0][2]
+        assert graph.knows(NEW)
+
+    def test_begin_with_cached_workflow_skips_lookup(self, cmd):
+        graph = WorkflowGraph()
+        graph.learn(NEW, [{"id": "21", "name": "In Progress"}])
+        cmd.jira_client.workflow.side_effect = lambda *_: graph
+        cmd.execute(make_args(begin=True))
+        cmd.jira_client.transitions.assert_not_called()
+        assert cmd.jira_client.transition_issue.call_args[0][1] == "21"
+
+    def test_stale_cached_transition_is_refreshed(self, cmd):
+        graph = WorkflowGraph()
+        graph.learn(NEW, [{"id": "99", "name": "In Progress"}])
+        cmd.jira_client.workflow.side_effect = lambda *_: graph
+        cmd.jira_client.transitions.return_value = [{"id": "21", "name": "In Progress"}]
+        cmd.jira_client.transition_issue.side_effect = [Exception("bad id"), None]
+        cmd.jira_client.issue.return_value.fields.status.name = "To Do"
+        cmd.execute(make_args(begin=True))
+        assert cmd.jira_client.transition_issue.call_args[0][1] == "21"
+        assert graph.transitions(NEW)[0]["id"] == "21"
+        assert graph.transitions("To Do")[0]["id"] == "21"
+
+    def test_created_without_prefetch(self, cmd):
+        cmd.execute(make_args())
+        assert cmd.jira_client.create_issue.call_args[1]["prefetch"] is False
+
+    def test_optional_field_by_name(self, cmd):
+        cmd.execute(make_args(custom_fields=[["Story Points", "3"]]))
+        fields = cmd.jira_client.create_issue.call_args[1]["fields"]
+        assert fields["customfield_10016"] == 3
 
     def test_browse_opens_url(self, cmd):
         with patch("webbrowser.open") as mock_open:
             cmd.execute(make_args(browse=True))
         mock_open.assert_called_once_with("https://test.atlassian.net/browse/TEST-1")
+
+
+class TestIssueCreateLookups:
+    def test_lookups_each_made_once(self, cmd):
+        cmd.execute(make_args(assign=True, epic="TEST-99"))
+        cmd.jira_client.project.assert_called_once_with("TEST")
+        cmd.jira_client.current_user.assert_called_once()
+        cmd.jira_client.issue.assert_not_called()
+        cmd.jira_client.createmeta.assert_called_once_with(
+            projectKeys="TEST", expand="projects.issuetypes.fields"
+        )
+
+    def test_mandatory_fields_picked_from_project_metadata(self, cmd):
+        cmd.jira_client.createmeta.return_value = {
+            "projects": [
+                {
+                    "issuetypes": [
+                        {"name": "Bug", "fields": {}},
+                        {
+                            "name": "Task",
+                            "fields": {
+                                "customfield_1": {"name": "Team", "required": True}
+                            },
+                        },
+                    ]
+                }
+            ]
+        }
+        with pytest.raises(ValueError, match="team"):
+            cmd.execute(make_args(type="task"))
+        cmd.execute(make_args(type="task", custom_fields=[["team", "Core"]]))
+        fields = cmd.jira_client.create_issue.call_args[1]["fields"]
+        assert fields["customfield_1"] == "Core"
+
+
+def bulk_results(field_list, prefetch=True):
+    results = []
+    for n, fields in enumerate(field_list, 1):
+        # Issues built from the create response carry no fields
+        issue = MagicMock(spec=["key"])
+        issue.key = f"TEST-{n}"
+        results.append(
+            {"status": "Success", "error": None, "issue": issue, "input_fields": fields}
+        )
+    return results
+
+
+class TestIssueCreateFromFile:
+    @pytest.fixture
+    def bulk_cmd(self, cmd):
+        cmd.jira_client.create_issues.side_effect = bulk_results
+        cmd.jira_client.concurrent_map.side_effect = lambda fn, items: [
+            fn(item) for item in items
+        ]
+        return cmd
+
+    def test_yaml_rows_created_in_bulk(self, bulk_cmd, tmp_path):
+        path = tmp_path / "issues.yaml"
+        path.write_text(
+            "- title: First\n"
+            "  labels: [a, b]\n"
+            "- title: Second\n"
+            "  type: bug\n"
+            "  description: Broken\n"
+        )
+        with patch("cac_core.output.Output"):
+            result = bulk_cmd.execute(
+                make_args(title=None, description=None, from_file=str(path))
+            )
+
+        assert result is None
+        bulk_cmd.jira_client.create_issue.assert_not_called()
+        field_list, kwargs = bulk_cmd.jira_client.create_issues.call_args
+        first, second = field_list[0]
+        assert kwargs == {"prefetch": False}
+        assert first["summary"] == "First"
+        assert first["labels"] == ["a", "b"]
+        assert first["issuetype"] == {"name": "Task"}
+        assert second["issuetype"] == {"name": "Bug"}
+        assert second["description"] == "Broken"
+
+    def test_csv_columns_map_to_fields(self, bulk_cmd, tmp_path):
+        bulk_cmd.jira_client.createmeta.return_value = {
+            "projects": [
+                {
+                    "issuetypes": [
+                        {
+                            "name": "Task",
+                            "fields": {
+                                "customfield_1": {
+                                    "name": "Team",
+                                    "required": True,
+                                    "schema": {"type": "option"},
+                                }
+                            },
+                        }
+                    ]
+                }
+            ]
+        }
+        path = tmp_path / "issues.csv"
+        path.write_text("title,team,assign\nFirst,Core,yes\n")
+        with patch("cac_core.output.Output"):
+            bulk_cmd.execute(make_args(title=None, from_file=str(path)))
+
+        fields = bulk_cmd.jira_client.create_issues.call_args[0][0][0]
+        assert fields["customfield_1"] == {"value": "Core"}
+        assert fields["assignee"] == {"accountId": "user-account-id"}
+
+    def test_invalid_rows_abort_before_creating(self, bulk_cmd, tmp_path):
+        path = tmp_path / "issues.jsonl"
+        path.write_text('{"title": "Fine"}\n{"description": "no title"}\n')
+        result = bulk_cmd.execute(make_args(title=None, from_file=str(path)))
+
+        assert result == 1
+        bulk_cmd.jira_client.create_issues.assert_not_called()
+        assert "Row %d: %s" in [c[0][0] for c in bulk_cmd.log.error.call_args_list]
+
+    def test_unknown_rows_are_reported_not_resent(self, bulk_cmd, tmp_path):
+        def flaky(field_list, prefetch=True):
+            results = bulk_results(field_list)
+            results[1] = {
+                "status": "Unknown",
+                "error": "Connection reset",
+                "issue": None,
+                "input_fields": field_list[1],
+            }
+            return results
+
+        bulk_cmd.jira_client.create_issues.side_effect = flaky
+        path = tmp_path / "issues.jsonl"
+        path.write_text('{"title": "One"}\n{"title": "Two"}\n{"title": "Three"}\n')
+        with patch("cac_core.output.Output") as mock_output:
+            assert bulk_cmd.execute(make_args(title=None, from_file=str(path))) == 1
+
+        bulk_cmd.jira_client.create_issues.assert_called_once()
+        models = mock_output.return_value.print_models.call_args[0][0]
+        assert [m.Status for m in models] == ["Success", "Unknown", "Success"]
+        bulk_cmd.log.warning.assert_called_once()
+
+    def test_begin_shares_one_workflow_per_type(self, bulk_cmd, tmp_path):
+        bulk_cmd.jira_client.max_workers = 4
+        bulk_cmd.jira_client.transitions.return_value = [
+            {"id": "21", "name": "In Progress"}
+        ]
+
+        def transition_issue(issue, transition_id):
+            if issue.key == "TEST-2":
+                raise Exception("denied")
+
+        bulk_cmd.jira_client.transition_issue.side_effect = transition_issue
+        path = tmp_path / "issues.jsonl"
+        path.write_text('{"title": "One"}\n{"title": "Two"}\n{"title": "Three"}\n')
+        with patch("cac_core.output.Output") as mock_output:
+            result = bulk_cmd.execute(
+                make_args(title=None, from_file=str(path), begin=True)
+            )
+
+        assert result == 1
+        bulk_cmd.jira_client.workflow.assert_called_once_with("TEST", "Task")
+        bulk_cmd.jira_client.save_workflow.assert_called_once()
+        # The failing row is re-planned once before giving up
+        assert bulk_cmd.jira_client.transition_issue.call_count == 4
+        models = mock_output.return_value.print_models.call_args[0][0]
+        assert [m.Begun for m in models] == ["Yes", "No", "Yes"]
+
+    def test_title_required_without_file(self, cmd):
+        assert cmd.execute(make_args(title=None)) == 1
+        cmd.jira_client.project.assert_not_called()
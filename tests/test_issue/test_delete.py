@@ -0,0 +1,70 @@
+"""
+Tests for the IssueDelete command.
+"""
+
+import argparse
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cac_jira.commands.issue.delete import IssueDelete
+
+
+def make_args(**kwargs):
+    defaults = {
+        "project": "TEST",
+        "issue": ["TEST-1"],
+        "jql": None,
+        "yes": False,
+        "delete_subtasks": False,
+        "output": "table",
+    }
+    defaults.update(kwargs)
+    return argparse.Namespace(**defaults)
+
+
+@pytest.fixture
+def cmd():
+    command = IssueDelete()
+    command.log = MagicMock()
+    command.jira_client = MagicMock()
+    command.jira_client.max_workers = 4
+    return command
+
+
+class TestIssueDelete:
+    def test_single_issue_deleted_by_key(self, cmd):
+        cmd.execute(make_args())
+        cmd.jira_client.delete_issue.assert_called_once_with(
+            "TEST-1", delete_subtasks=False
+        )
+        cmd.jira_client.issue.assert_not_called()
+
+    def test_jql_without_yes_only_counts(self, cmd):
+        cmd.jira_client.count_issues.return_value = 1200
+        cmd.execute(make_args(issue=None, jql="labels = synthetic"))
+
+        cmd.jira_client.count_issues.assert_called_once_with("labels = synthetic")
+        cmd.jira_client.delete_issue.assert_not_called()
+        assert cmd.log.info.call_args[0][1] == 1200
+
+    def test_jql_with_yes_deletes_streamed_keys(self, cmd):
+        issues = [MagicMock(key=f"TEST-{n}") for n in range(1, 4)]
+        cmd.jira_client.iter_search.return_value = iter(issues)
+
+        with patch("cac_core.output.Output"):
+            result = cmd.execute(
+                make_args(
+                    issue=None, jql="labels = synthetic", yes=True, delete_subtasks=True
+                )
+            )
+
+        assert result is None
+        assert cmd.jira_client.iter_search.call_args[1]["fields"] == ["key"]
+        deleted = sorted(c[0][0] for c in cmd.jira_client.delete_issue.call_args_list)
+        assert deleted == ["TEST-1", "TEST-2", "TEST-3"]
+        assert cmd.jira_client.delete_issue.call_args[1] == {"delete_subtasks": True}
+
+    def test_several_keys_need_yes(self, cmd):
+        cmd.execute(make_args(issue=["TEST-1,TEST-2"]))
+        cmd.jira_client.delete_issue.assert_not_called()
@@ -0,0 +1,66 @@
+"""
+Tests for the IssueLabel command.
+"""
+
+import argparse
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cac_jira.commands.issue.label import IssueLabel
+
+
+def make_args(**kwargs):
+    defaults = {
+        "project": "TEST",
+        "issue": ["TEST-1"],
+        "jql": None,
+        "add": None,
+        "remove": None,
+        "output": "table",
+    }
+    defaults.update(kwargs)
+    return argparse.Namespace(**defaults)
+
+
+@pytest.fixture
+def cmd():
+    command = IssueLabel()
+    command.log = MagicMock()
+    command.jira_client = MagicMock()
+    command.jira_client.max_workers = 4
+    return command
+
+
+class TestIssueLabel:
+    def test_single_issue_edited_without_fetching(self, cmd):
+        result = cmd.execute(make_args(add=["a,b"], remove=["old"]))
+
+        assert result is None
+        cmd.jira_client.update_labels.assert_called_once_with(
+            "TEST-1", add=["a", "b"], remove=["old"]
+        )
+        cmd.jira_client.issue.assert_not_called()
+
+    def test_no_labels_given(self, cmd):
+        assert cmd.execute(make_args()) == 1
+        cmd.jira_client.update_labels.assert_not_called()
+
+    def test_jql_labels_every_match(self, cmd):
+        issues = [MagicMock(key=f"TEST-{n}") for n in range(1, 4)]
+        cmd.jira_client.iter_search.return_value = iter(issues)
+
+        def update_labels(key, add=None, remove=None):
+            if key == "TEST-2":
+                raise Exception("no permission")
+
+        cmd.jira_client.update_labels.side_effect = update_labels
+        with patch("cac_core.output.Output") as output:
+            result = cmd.execute(make_args(issue=None, jql="sprint = 5", add=["x"]))
+
+        assert result == 1
+        assert cmd.jira_client.iter_search.call_args[1]["fields"] == ["key"]
+        keys = sorted(c[0][0] for c in cmd.jira_client.update_labels.call_args_list)
+        assert keys == ["TEST-1", "TEST-2", "TEST-3"]
+        rows = [m.to_dict() for m in output.return_value.print_models.call_args[0][0]]
+        assert [row["Result"] for row in rows] == ["OK", "Failed", "OK"]
@@ -0,0 +1,102 @@
+"""
+Tests for the IssueList command's watch mode.
+"""
+
+import argparse
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cac_jira.commands.issue.list import IssueList
+
+
+def make_issue(key, updated, status="To Do"):
+    issue = MagicMock()
+    issue.key = key
+    issue.fields.updated = updated
+    issue.fields.summary = f"Summary of {key}"
+    issue.fields.status.name = status
+    issue.fields.assignee = None
+    issue.fields.issuetype.name = "Task"
+    issue.fields.labels = []
+    issue.fields.resolutiondate = None
+    return issue
+
+
+def make_args(**kwargs):
+    defaults = {
+        "project": "TEST",
+        "mine": False,
+        "done": False,
+        "watch": 5,
+        "output": "table",
+    }
+    defaults.update(kwargs)
+    return argparse.Namespace(**defaults)
+
+
+@pytest.fixture
+def cmd():
+    command = IssueList()
+    command.log = MagicMock()
+    command.jira_client = MagicMock()
+    return command
+
+
+class TestIssueListWatch:
+    def run_polls(self, cmd, args, polls):
+        """Run the watch loop for `polls` iterations, returning the rendered views."""
+        rendered = []
+
+        def render(_args, view, changed):
+            rendered.append((list(view), set(changed)))
+
+        sleeps = iter([None] * (polls - 1) + [KeyboardInterrupt()])
+
+        def sleep(_seconds):
+            result = next(sleeps)
+            if result:
+                raise result
+
+        with (
+            patch.object(cmd, "_render_watch", side_effect=render),
+            patch("time.sleep", side_effect=sleep),
+        ):
+            cmd.execute(args)
+        return rendered
+
+    def test_polls_only_for_deltas(self, cmd):
+        first = [
+            make_issue("TEST-1", "2024-05-01T10:00:00.000+0000"),
+            make_issue("TEST-2", "2024-05-01T10:05:00.000+0000"),
+            make_issue("TEST-4", "2024-05-01T10:05:00.000+0000"),
+        ]
+        # TEST-4 is unchanged but falls inside the minute-precision window
+        delta = [
+            make_issue("TEST-4", "2024-05-01T10:05:00.000+0000"),
+            make_issue("TEST-1", "2024-05-01T10:07:00.000+0000"),
+            make_issue("TEST-3", "2024-05-01T10:08:00.000+0000"),
+        ]
+        gone = [make_issue("TEST-2", "2024-05-01T10:09:00.000+0000", "Done")]
+        cmd.jira_client.search_issues.side_effect = [first, delta, gone]
+
+        rendered = self.run_polls(cmd, make_args(), 2)
+
+        calls = cmd.jira_client.search_issues.call_args_list
+        assert calls[0][0][0] == "project = TEST AND status != Done"
+        assert calls[1][0][0] == (
+            'project = TEST AND status != Done AND updated >= "2024-05-01 10:05"'
+        )
+        assert calls[2][0][0] == (
+            'project = TEST AND updated >= "2024-05-01 10:05" AND NOT (status != Done)'
+        )
+        assert rendered[0] == (["TEST-1", "TEST-2", "TEST-4"], set())
+        assert rendered[1] == (["TEST-1", "TEST-4", "TEST-3"], {"TEST-1", "TEST-3"})
+
+    def test_no_filters_skips_removal_query(self, cmd):
+        cmd.jira_client.search_issues.side_effect = [
+            [make_issue("TEST-1", "2024-05-01T10:00:00.000+0000")],
+            [],
+        ]
+        self.run_polls(cmd, make_args(done=True), 2)
+        assert cmd.jira_client.search_issues.call_count == 2
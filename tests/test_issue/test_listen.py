@@ -0,0 +1,194 @@
+"""
+Tests for the IssueListen command, replaying recorded webhook payloads.
+"""
+
+import hashlib
+import hmac
+import json
+import threading
+import urllib.error
+import urllib.request
+from unittest.mock import MagicMock
+
+import pytest
+from jira.resources import Issue
+
+from cac_jira.commands.issue.listen import IssueListen
+from cac_jira.core.index import IssueIndex
+
+OPTIONS = {
+    "server": "https://test.atlassian.net",
+    "rest_path": "api",
+    "rest_api_version": "2",
+    "agile_rest_path": "agile",
+    "agile_rest_api_version": "1.0",
+}
+
+
+def issue_payload(event, key, summary):
+    return {
+        "webhookEvent": event,
+        "issue": {
+            "id": "10001",
+            "key": key,
+            "fields": {
+                "summary": summary,
+                "description": "Steps to reproduce",
+                "status": {"name": "To Do"},
+                "assignee": None,
+                "issuetype": {"name": "Bug"},
+                "labels": ["prod"],
+                "resolutiondate": None,
+                "updated": "2024-05-01T10:00:00.000+0000",
+                "comment": {"comments": []},
+            },
+        },
+    }
+
+
+COMMENT_PAYLOAD = {
+    "webhookEvent": "comment_created",
+    "issue": {"id": "10001", "key": "TEST-1", "fields": {"summary": "Crash"}},
+    "comment": {"id": "1", "body": "Seen again on staging"},
+}
+
+
+@pytest.fixture
+def index(tmp_path):
+    idx = IssueIndex(str(tmp_path / "issues.db"))
+    yield idx
+    idx.close()
+
+
+@pytest.fixture
+def cmd():
+    command = IssueListen()
+    command.log = MagicMock()
+    command.jira_client = MagicMock()
+    command.jira_client.issue_from_raw.side_effect = lambda raw: Issue(
+        OPTIONS, None, raw=raw
+    )
+    return command
+
+
+class TestIssueListen:
+    def test_replay_jsonl(self, cmd, index, tmp_path):
+        recording = tmp_path / "webhooks.jsonl"
+        recording.write_text(
+            "\n".join(
+                json.dumps(p)
+                for p in [
+                    issue_payload("jira:issue_created", "TEST-1", "Crash"),
+                    issue_payload("jira:issue_updated", "TEST-1", "Crash on login"),
+                    COMMENT_PAYLOAD,
+                ]
+            )
+        )
+        cmd.replay(index, str(recording))
+
+        assert index.get("TEST-1")["Summary"] == "Crash on login"
+        assert [r["ID"] for r in index.search("staging")] == ["TEST-1"]
+        cmd.jira_client.issue.assert_not_called()
+        cmd.jira_client.search_issues.assert_not_called()
+
+    def test_delete_event(self, cmd, index):
+        cmd.apply_event(index, issue_payload("jira:issue_created", "TEST-1", "Crash"))
+        result = cmd.apply_event(
+            index, issue_payload("jira:issue_deleted", "TEST-1", "Crash")
+        )
+        assert result == "deleted TEST-1"
+        assert index.get("TEST-1") is None
+        cmd.jira_client.invalidate_issue.assert_called_with("TEST-1", "10001")
+
+    def test_project_event_drops_metadata(self, cmd, index):
+        result = cmd.apply_event(
+            index,
+            {"webhookEvent": "project_updated", "project": {"id": 1, "key": "TEST"}},
+        )
+        assert result == "dropped cached metadata for TEST"
+        cmd.jira_client.invalidate_metadata.assert_called_once_with("TEST", 1)
+
+    def test_comment_on_unmirrored_issue_is_ignored(self, cmd, index):
+        assert "ignored" in cmd.apply_event(index, COMMENT_PAYLOAD)
+
+    def test_update_without_comments_keeps_them(self, cmd, index):
+        cmd.apply_event(index, issue_payload("jira:issue_created", "TEST-1", "Crash"))
+        cmd.apply_event(index, COMMENT_PAYLOAD)
+
+        update = issue_payload("jira:issue_updated", "TEST-1", "Crash on login")
+        del update["issue"]["fields"]["comment"]
+        cmd.apply_event(index, update)
+
+        assert index.get("TEST-1")["Summary"] == "Crash on login"
+        assert [r["ID"] for r in index.search("staging")] == ["TEST-1"]
+
+    def test_comment_updated_replaces_body(self, cmd, index):
+        cmd.apply_event(index, issue_payload("jira:issue_created", "TEST-1", "Crash"))
+        cmd.apply_event(index, COMMENT_PAYLOAD)
+        cmd.apply_event(
+            index,
+            {
+                **COMMENT_PAYLOAD,
+                "webhookEvent": "comment_updated",
+                "comment": {"id": "1", "body": "Seen again on production"},
+            },
+        )
+
+        assert index.search("staging") == []
+        assert [r["ID"] for r in index.search("production")] == ["TEST-1"]
+
+        cmd.apply_event(index, {**COMMENT_PAYLOAD, "webhookEvent": "comment_deleted"})
+        assert index.search("production") == []
+
+    def post(self, cmd, index, data, secret=None, headers=None):
+        server = cmd.make_server(index, "127.0.0.1", 0, secret)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            port = server.server_address[1]
+            request = urllib.request.Request(
+                f"http://127.0.0.1:{port}/",
+                data=data,
+                headers={"Content-Type": "application/json", **(headers or {})},
+                method="POST",
+            )
+            try:
+                with urllib.request.urlopen(request) as response:
+                    return response.status
+            except urllib.error.HTTPError as e:
+                return e.code
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_http_listener(self, cmd, index):
+        payload = issue_payload("jira:issue_created", "TEST-5", "Webhook")
+        assert self.post(cmd, index, json.dumps(payload).encode()) == 204
+        assert index.get("TEST-5")["Summary"] == "Webhook"
+
+    def test_http_listener_rejects_bad_payloads(self, cmd, index):
+        assert self.post(cmd, index, b"not json") == 400
+        assert self.post(cmd, index, b"[]") == 400
+        comment = {**COMMENT_PAYLOAD, "comment": {"body": "no id"}}
+        assert self.post(cmd, index, json.dumps(comment).encode()) == 400
+
+    def test_http_listener_reports_failures(self, cmd, index):
+        cmd.jira_client.invalidate_issue.side_effect = RuntimeError("cache locked")
+        payload = issue_payload("jira:issue_created", "TEST-5", "Webhook")
+        assert self.post(cmd, index, json.dumps(payload).encode()) == 500
+        cmd.log.error.assert_called_once()
+
+    def test_http_listener_checks_signature(self, cmd, index):
+        data = json.dumps(
+            issue_payload("jira:issue_deleted", "TEST-1", "Crash")
+        ).encode()
+        signed = "sha256=" + hmac.new(b"s3cret", data, hashlib.sha256).hexdigest()
+
+        assert self.post(cmd, index, data, secret="s3cret") == 401
+        forged = {"X-Hub-Signature": "sha256=" + "0" * 64}
+        assert self.post(cmd, index, data, "s3cret", forged) == 401
+        cmd.jira_client.invalidate_issue.assert_not_called()
+
+        valid = {"X-Hub-Signature": signed}
+        assert self.post(cmd, index, data, "s3cret", valid) == 204
+        cmd.jira_client.invalidate_issue.assert_called_once()
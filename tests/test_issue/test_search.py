@@ -0,0 +1,109 @@
+"""
+Tests for the IssueSearch command.
+"""
+
+import argparse
+from unittest.mock import MagicMock, patch
+
+import pytest
+from jira.resources import Issue
+
+from cac_jira.commands.issue.search import IssueSearch
+from cac_jira.core.index import IssueIndex
+
+OPTIONS = {
+    "server": "https://test.atlassian.net",
+    "rest_path": "api",
+    "rest_api_version": "2",
+    "agile_rest_path": "agile",
+    "agile_rest_api_version": "1.0",
+}
+
+
+def make_issue(key, summary, updated, comments=()):
+    return Issue(
+        OPTIONS,
+        None,
+        raw={
+            "key": key,
+            "fields": {
+                "summary": summary,
+                "description": None,
+                "status": {"name": "To Do"},
+                "assignee": None,
+                "issuetype": {"name": "Task"},
+                "labels": [],
+                "resolutiondate": None,
+                "updated": updated,
+                "comment": {
+                    "comments": [
+                        {"id": str(n), "body": body} for n, body in enumerate(comments)
+                    ]
+                },
+            },
+        },
+    )
+
+
+def make_args(**kwargs):
+    defaults = {
+        "project": "TEST",
+        "text": None,
+        "sync": False,
+        "prefix": None,
+        "limit": 20,
+        "output": "table",
+    }
+    defaults.update(kwargs)
+    return argparse.Namespace(**defaults)
+
+
+@pytest.fixture
+def index(tmp_path):
+    path = str(tmp_path / "issues.db")
+    with patch("cac_jira.commands.issue.search.IssueIndex", lambda: IssueIndex(path)):
+        yield path
+
+
+@pytest.fixture
+def cmd():
+    command = IssueSearch()
+    command.log = MagicMock()
+    command.jira_client = MagicMock()
+    return command
+
+
+class TestIssueSearch:
+    def test_first_run_syncs_everything(self, cmd, index):
+        cmd.jira_client.search_issues.return_value = [
+            make_issue("TEST-1", "Broken login", "2024-05-01T10:00:00.000+0000"),
+        ]
+        cmd.execute(make_args())
+        jql = cmd.jira_client.search_issues.call_args[0][0]
+        assert jql == "project = TEST ORDER BY updated ASC"
+        assert IssueIndex(index).last_synced("TEST") == "2024-05-01T10:00:00.000+0000"
+
+    def test_sync_is_incremental(self, cmd, index):
+        IssueIndex(index).mark_synced("TEST", "2024-05-01T10:00:00.000+0000")
+        cmd.jira_client.search_issues.return_value = [
+            make_issue("TEST-2", "Later", "2024-05-02T08:30:00.000+0000"),
+        ]
+        cmd.execute(make_args(sync=True))
+        jql = cmd.jira_client.search_issues.call_args[0][0]
+        assert 'updated >= "2024-05-01 10:00"' in jql
+        assert IssueIndex(index).last_synced("TEST") == "2024-05-02T08:30:00.000+0000"
+
+    def test_search_skips_sync_once_mirrored(self, cmd, index):
+        idx = IssueIndex(index)
+        idx.mark_synced("TEST", "2024-05-01T10:00:00.000+0000")
+        cmd.index_issue(
+            idx,
+            make_issue(
+                "TEST-1", "Crash", "2024-05-01T10:00:00.000+0000", ["login fails"]
+            ),
+        )
+        with patch("cac_core.output.Output") as mock_output:
+            cmd.execute(make_args(text="login"))
+        cmd.jira_client.search_issues.assert_not_called()
+        models = mock_output.return_value.print_models.call_args[0][0]
+        assert [m.ID for m in models] == ["TEST-1"]
@@ -0,0 +1,173 @@
+"""
+Tests for the IssueShow command.
+"""
+
+import argparse
+import io
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cac_jira.commands.issue.show import IssueShow
+
+
+def make_issue(key):
+    issue = MagicMock()
+    issue.id = "1000"
+    issue.key = key
+    issue.raw = {"key": key}
+    return issue
+
+
+def make_args(**kwargs):
+    defaults = {
+        "project": "TEST",
+        "issue": None,
+        "fields": None,
+        "expand": None,
+        "output": "table",
+    }
+    defaults.update(kwargs)
+    return argparse.Namespace(**defaults)
+
+
+@pytest.fixture
+def cmd():
+    command = IssueShow()
+    command.log = MagicMock()
+    command.jira_client = MagicMock()
+    command.jira_client.issue.side_effect = lambda key, **_: make_issue(key)
+    command.jira_client.issues_by_keys.side_effect = lambda keys, **_: (
+        [make_issue(key) for key in keys if key != "TEST-9"],
+        ["TEST-9"] if "TEST-9" in keys else [],
+    )
+    return command
+
+
+class TestIssueShow:
+    def test_single_issue_uses_issue(self, cmd, capsys):
+        cmd.execute(make_args(issue=["TEST-1"], output="json"))
+        cmd.jira_client.issue.assert_called_once_with(
+            "TEST-1", fields=None, expand=None
+        )
+        assert json.loads(capsys.readouterr().out) == {"key": "TEST-1"}
+
+    def test_table_fetches_only_shown_fields(self, cmd):
+        with patch("cac_core.output.Output"):
+            cmd.execute(make_args(issue=["TEST-1"]))
+        cmd.jira_client.issue.assert_called_once_with(
+            "TEST-1", fields="summary,status,issuetype,priority", expand=None
+        )
+
+    def test_table_keeps_its_fields_with_fields_option(self, cmd):
+        with patch("cac_core.output.Output"):
+            cmd.execute(make_args(issue=["TEST-1"], fields="labels,summary"))
+        cmd.jira_client.issue.assert_called_once_with(
+            "TEST-1", fields="summary,status,issuetype,priority,labels", expand=None
+        )
+
+    def test_fields_and_expand_pass_through(self, cmd, capsys):
+        cmd.execute(
+            make_args(
+                issue=["TEST-1", "TEST-2"],
+                output="json",
+                fields="summary,labels",
+                expand="changelog",
+            )
+        )
+        kwargs = cmd.jira_client.issues_by_keys.call_args[1]
+        assert kwargs == {"fields": ["summary", "labels"], "expand": "changelog"}
+
+    def test_many_issues_fetched_in_one_batch(self, cmd, capsys):
+        cmd.execute(
+            make_args(issue=["TEST-1", "test-2,TEST-3", "TEST-9"], output="json")
+        )
+        cmd.jira_client.issue.assert_not_called()
+        keys = cmd.jira_client.issues_by_keys.call_args[0][0]
+        assert keys == ["TEST-1", "TEST-2", "TEST-3", "TEST-9"]
+        assert [i["key"] for i in json.loads(capsys.readouterr().out)] == [
+            "TEST-1",
+            "TEST-2",
+            "TEST-3",
+        ]
+        cmd.log.error.assert_called_once_with("Issue %s not found", "TEST-9")
+
+    def test_keys_from_stdin(self, cmd):
+        with (
+            patch("sys.stdin", io.StringIO("TEST-1\nTEST-2 TEST-3\n")),
+            patch("cac_core.output.Output") as mock_output,
+        ):
+            cmd.execute(make_args(issue=["-"]))
+        models = mock_output.return_value.print_models.call_args[0][0]
+        assert [m.Key for m in models] == ["TEST-1", "TEST-2", "TEST-3"]
+
+    def test_no_issues(self, cmd):
+        with patch("sys.stdin", io.StringIO("")):
+            assert cmd.execute(make_args()) == 1
+
+
+class TestIssueShowHistory:
+    def test_streams_comments_and_changelog(self, cmd, capsys):
+        cmd.jira_client.iter_comments.return_value = iter(
+            [
+                {
+                    "created": "2024-06-02T10:00:00.000+0000",
+                    "author": {"displayName": "Ann"},
+                    "body": "second\nline",
+                }
+            ]
+        )
+        cmd.jira_client.iter_changelog.return_value = iter(
+            [
+                {
+                    "created": "2024-06-01T10:00:00.000+0000",
+                    "author": {"displayName": "Bob"},
+                    "items": [
+                        {"field": "status", "fromString": "To Do", "toString": "Done"}
+                    ],
+                }
+            ]
+        )
+        with patch("cac_core.output.Output"):
+            cmd.execute(
+                make_args(
+                    issue=["TEST-1"],
+                    comments=True,
+                    changelog=True,
+                    since="2024-06-01T00:00:00+00:00",
+                )
+            )
+
+        out = capsys.readouterr().out
+        assert "Ann: second line" in out
+        assert "Bob: status: To Do -> Done" in out
+        since = cmd.jira_client.iter_comments.call_args[1]["since"]
+        assert since.isoformat() == "2024-06-01T00:00:00+00:00"
+
+    def test_json_output_nests_history(self, cmd, capsys):
+        cmd.jira_client.iter_comments.return_value = iter([{"id": "1"}, {"id": "2"}])
+        cmd.execute(make_args(issue=["TEST-1"], output="json", comments=True))
+
+        assert json.loads(capsys.readouterr().out) == {
+            "key": "TEST-1",
+            "comments": [{"id": "1"}, {"id": "2"}],
+        }
+        cmd.jira_client.iter_changelog.assert_not_called()
+
+    def test_json_output_nests_history_per_issue(self, cmd, capsys):
+        cmd.jira_client.iter_changelog.side_effect = lambda key, **_: iter(
+            [{"id": key}]
+        )
+        cmd.execute(
+            make_args(issue=["TEST-1", "TEST-2"], output="json", changelog=True)
+        )
+
+        assert json.loads(capsys.readouterr().out) == [
+            {"key": "TEST-1", "changelog": [{"id": "TEST-1"}]},
+            {"key": "TEST-2", "changelog": [{"id": "TEST-2"}]},
+        ]
+
+    def test_invalid_since(self, cmd):
+        assert cmd.execute(make_args(issue=["TEST-1"], since="last tuesday")) == 1
+        cmd.jira_client.issue.assert_not_called()
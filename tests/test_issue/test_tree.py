@@ -0,0 +1,88 @@
+"""
+Tests for the IssueTree command.
+"""
+
+import argparse
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from cac_jira.commands.issue.tree import IssueTree
+
+
+def make_issue(key, status="To Do", parent=None, issuetype="Story"):
+    issue = MagicMock()
+    issue.key = key
+    issue.fields.summary = f"Summary of {key}"
+    issue.fields.status.name = status
+    issue.fields.issuetype.name = issuetype
+    issue.fields.parent.key = parent
+    return issue
+
+
+CHILDREN = {
+    "EPIC-1": [
+        make_issue("PROJ-10", "Done", "EPIC-1"),
+        make_issue("PROJ-9", "In Progress", "EPIC-1"),
+    ],
+    "PROJ-9": [
+        make_issue("PROJ-11", "Done", "PROJ-9", "Subtask"),
+        make_issue("PROJ-12", "To Do", "PROJ-9", "Subtask"),
+    ],
+}
+
+
+def issues_by_parents(keys, fields=None):
+    return [child for key in keys for child in CHILDREN.get(key, [])]
+
+
+@pytest.fixture
+def cmd():
+    command = IssueTree()
+    command.log = MagicMock()
+    command.jira_client = MagicMock()
+    command.jira_client.issue.return_value = make_issue(
+        "EPIC-1", "In Progress", issuetype="Epic"
+    )
+    command.jira_client.issues_by_parents.side_effect = issues_by_parents
+    return command
+
+
+def make_args(**kwargs):
+    defaults = {"project": "PROJ", "root": "epic-1", "depth": 0, "output": "table"}
+    defaults.update(kwargs)
+    return argparse.Namespace(**defaults)
+
+
+class TestIssueTree:
+    def test_one_search_batch_per_level(self, cmd, capsys):
+        cmd.execute(make_args())
+
+        levels = [c[0][0] for c in cmd.jira_client.issues_by_parents.call_args_list]
+        assert levels == [["EPIC-1"], ["PROJ-10", "PROJ-9"], ["PROJ-11", "PROJ-12"]]
+        assert cmd.jira_client.issue.call_args[0][0] == "EPIC-1"
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0].startswith("EPIC-1 Epic [In Progress]")
+        assert lines[0].endswith("(Done: 2, In Progress: 1, To Do: 1)")
+        assert [line.split()[0] for line in lines] == [
+            "EPIC-1",
+            "PROJ-9",
+            "PROJ-11",
+            "PROJ-12",
+            "PROJ-10",
+        ]
+        assert lines[2].startswith("    PROJ-11")
+
+    def test_depth_limits_levels(self, cmd, capsys):
+        cmd.execute(make_args(depth=1))
+        assert cmd.jira_client.issues_by_parents.call_count == 1
+        assert len(capsys.readouterr().out.splitlines()) == 3
+
+    def test_json_output(self, cmd, capsys):
+        cmd.execute(make_args(output="json"))
+        tree = json.loads(capsys.readouterr().out)
+        assert tree["rollup"] == {"Done": 2, "In Progress": 1, "To Do": 1}
+        story = tree["children"][0]
+        assert story["key"] == "PROJ-9"
+        assert [child["key"] for child in story["children"]] == ["PROJ-11", "PROJ-12"]
@@ -0,0 +1,178 @@
+"""
+Tests for the IssueUpdate command.
+"""
+
+import argparse
+from unittest.mock import MagicMock, patch
+
+import pytest
+from jira.exceptions import JIRAError
+
+from cac_jira.commands.issue.update import IssueUpdate
+from cac_jira.core.fields import FieldCatalog
+
+
+def make_args(**kwargs):
+    defaults = {
+        "project": "TEST",
+        "issue": "TEST-1",
+        "jql": None,
+        "title": None,
+        "description": None,
+        "custom_fields": None,
+        "no_notify": False,
+    }
+    defaults.update(kwargs)
+    return argparse.Namespace(**defaults)
+
+
+@pytest.fixture
+def cmd():
+    command = IssueUpdate()
+    command.log = MagicMock()
+    command.jira_client = MagicMock()
+    command.jira_client.field_catalog.return_value = FieldCatalog(
+        [
+            {
+                "id": "customfield_10016",
+                "name": "Story Points",
+                "schema": {
+                    "type": "number",
+                    "custom": "com.atlassian.jira.plugin.system.customfieldtypes:float",
+                },
+            }
+        ]
+    )
+    command.jira_client.max_workers = 4
+    issue = command.jira_client.issue.return_value
+    issue.key = "TEST-1"
+    issue.raw = {"fields": {"summary": "Old", "customfield_10016": 3.0}}
+    return command
+
+
+class TestIssueUpdate:
+    def test_title_and_description(self, cmd):
+        cmd.execute(make_args(title="New", description="Desc"))
+        cmd.jira_client.issue.assert_called_once_with(
+            "TEST-1", fields="summary,description"
+        )
+        cmd.jira_client.edit_issue.assert_called_once_with(
+            "TEST-1", fields={"summary": "New", "description": "Desc"}, notify=True
+        )
+
+    def test_field_by_name(self, cmd):
+        cmd.execute(make_args(custom_fields=[["story points", "5"]]))
+        cmd.jira_client.edit_issue.assert_called_once_with(
+            "TEST-1", fields={"customfield_10016": 5}, notify=True
+        )
+
+    def test_only_changed_fields_sent(self, cmd):
+        cmd.execute(
+            make_args(
+                title="Old", description="Desc", custom_fields=[["Story Points", "3"]]
+            )
+        )
+        assert cmd.jira_client.edit_issue.call_args[1]["fields"] == {
+            "description": "Desc"
+        }
+
+    def test_rerun_makes_no_writes(self, cmd):
+        assert cmd.execute(make_args(title="Old")) is None
+        cmd.jira_client.edit_issue.assert_not_called()
+
+    def test_no_notify(self, cmd):
+        cmd.execute(make_args(title="New", no_notify=True))
+        assert cmd.jira_client.edit_issue.call_args[1]["notify"] is False
+
+    def test_unknown_field(self, cmd):
+        assert cmd.execute(make_args(custom_fields=[["Nope", "5"]])) == 1
+        cmd.jira_client.edit_issue.assert_not_called()
+
+    def test_nothing_to_update(self, cmd):
+        assert cmd.execute(make_args()) == 1
+
+
+def make_issue(n):
+    issue = MagicMock()
+    issue.id = str(10000 + n)
+    issue.key = f"TEST-{n}"
+    issue.raw = {"fields": {"summary": "Old", "customfield_10016": None}}
+    return issue
+
+
+class TestBulkUpdate:
+    def test_jql_uses_one_bulk_edit_job(self, cmd):
+        issues = [make_issue(1), make_issue(2)]
+        cmd.jira_client.iter_search.return_value = iter(issues)
+        cmd.jira_client.bulk_edit.return_value = {
+            "10001": [],
+            "10002": ["Not editable"],
+        }
+
+        with patch("cac_core.output.Output") as output:
+            result = cmd.execute(
+                make_args(
+                    issue=None, jql="sprint = 4", custom_fields=[["story points", "0"]]
+                )
+            )
+
+        assert result == 1
+        ids, edited = cmd.jira_client.bulk_edit.call_args[0]
+        assert cmd.jira_client.bulk_edit.call_args[1] == {"notify": True}
+        assert ids == ["10001", "10002"]
+        assert edited == {
+            "numberCustomFields": [{"fieldId": "customfield_10016", "value": 0}]
+        }
+        cmd.jira_client.edit_issue.assert_not_called()
+        cmd.jira_client.invalidate_issue.assert_called_once_with("TEST-1", "TEST-2")
+        rows = [m.to_dict() for m in output.return_value.print_models.call_args[0][0]]
+        assert [row["Error"] for row in rows] == ["", "Not editable"]
+
+    def test_falls_back_to_concurrent_edits(self, cmd):
+        cmd.jira_client.issues_by_keys.return_value = (
+            [make_issue(1), make_issue(2)],
+            [],
+        )
+        cmd.jira_client.bulk_edit.side_effect = JIRAError(status_code=404)
+
+        with patch("cac_core.output.Output"):
+            result = cmd.execute(
+                make_args(
+                    issue=["TEST-1,TEST-2"], custom_fields=[["story points", "2"]]
+                )
+            )
+
+        assert result is None
+        edited = sorted(c[0][0] for c in cmd.jira_client.edit_issue.call_args_list)
+        assert edited == ["TEST-1", "TEST-2"]
+        assert cmd.jira_client.edit_issue.call_args[1] == {
+            "fields": {"customfield_10016": 2},
+            "notify": True,
+        }
+
+    def test_issues_already_up_to_date_skipped(self, cmd):
+        done = make_issue(2)
+        done.raw["fields"]["summary"] = "New"
+        cmd.jira_client.issues_by_keys.return_value = ([make_issue(1), done], [])
+
+        with patch("cac_core.output.Output") as output:
+            result = cmd.execute(make_args(issue=["TEST-1,TEST-2"], title="New"))
+
+        assert result is None
+        cmd.jira_client.edit_issue.assert_called_once_with(
+            "TEST-1", fields={"summary": "New"}, notify=True
+        )
+        assert cmd.jira_client.issues_by_keys.call_args[1]["fields"] == ["summary"]
+        assert len(output.return_value.print_models.call_args[0][0]) == 2
+
+    def test_unsupported_fields_edited_per_issue(self, cmd):
+        cmd.jira_client.issues_by_keys.return_value = ([make_issue(1)], ["TEST-9"])
+
+        with patch("cac_core.output.Output"):
+            result = cmd.execute(make_args(issue=["TEST-1", "TEST-9"], title="New"))
+
+        assert result == 1
+        cmd.jira_client.bulk_edit.assert_not_called()
+        cmd.jira_client.edit_issue.assert_called_once_with(
+            "TEST-1", fields={"summary": "New"}, notify=True
+        )
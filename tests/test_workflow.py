@@ -0,0 +1,42 @@
+"""
+Tests for workflow graphs.
+"""
+
+from cac_jira.core.workflow import WorkflowGraph
+
+
+def transition(tid, name, to=None):
+    return {"id": tid, "name": name, "to": {"name": to or name}}
+
+
+def make_graph():
+    graph = WorkflowGraph()
+    graph.learn(
+        "To Do",
+        [transition(11, "Start", "In Progress"), transition(12, "Block", "Blocked")],
+    )
+    graph.learn(
+        "In Progress",
+        [transition(21, "Done"), transition(22, "Stop", "To Do")],
+    )
+    return graph
+
+
+class TestWorkflowGraph:
+    def test_one_hop_by_transition_or_status_name(self):
+        graph = make_graph()
+        assert [t["id"] for t in graph.path("To Do", "start")] == ["11"]
+        assert [t["id"] for t in graph.path("to do", "In Progress")] == ["11"]
+
+    def test_shortest_multi_hop_path(self):
+        assert [t["id"] for t in make_graph().path("To Do", "Done")] == ["11", "21"]
+
+    def test_already_there_and_unreachable(self):
+        graph = make_graph()
+        assert graph.path("Done", "done") == []
+        assert graph.path("Blocked", "Done") is None
+
+    def test_round_trips_through_json(self):
+        graph = WorkflowGraph(make_graph().to_json())
+        assert graph.knows("IN PROGRESS")
+        assert [t["id"] for t in graph.path("To Do", "Done")] == ["11", "21"]